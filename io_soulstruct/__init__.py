@@ -122,6 +122,7 @@ from soulstruct.blender.flver import *
 from soulstruct.blender.msb import *
 from soulstruct.blender.nav_graph import *
 from soulstruct.blender.navmesh import *
+from soulstruct.blender.flver.image.texture_index import TextureIndex
 from soulstruct.blender.types import SoulstructType, SoulstructCollectionType
 from soulstruct.blender.utilities import ViewSelectedAtDistanceZero
 
@@ -222,6 +223,7 @@ CLASSES = (
     RotateUVMapClockwise90,
     RotateUVMapCounterClockwise90,
     FindMissingTexturesInImageCache,
+    UpdateTextureIndex,
     SelectMeshChildren,
 
     FLVERMaterialSettings,
@@ -615,6 +617,7 @@ IMAGE_ATTRIBUTES = []
 BONE_ATTRIBUTES = []
 
 LOAD_POST_HANDLERS = []
+DEPSGRAPH_UPDATE_POST_HANDLERS = []
 SPACE_VIEW_3D_HANDLERS = []
 
 
@@ -693,6 +696,10 @@ def register():
         bpy.types.SpaceView3D.draw_handler_add(draw_dummy_ids, (), "WINDOW", "POST_PIXEL")
     )
 
+    bpy.app.handlers.load_post.append(mark_mcg_draw_caches_dirty)
+    LOAD_POST_HANDLERS.append(mark_mcg_draw_caches_dirty)
+    bpy.app.handlers.depsgraph_update_post.append(mark_mcg_draw_caches_dirty)
+    DEPSGRAPH_UPDATE_POST_HANDLERS.append(mark_mcg_draw_caches_dirty)
     SPACE_VIEW_3D_HANDLERS.append(
         bpy.types.SpaceView3D.draw_handler_add(update_mcg_draw_caches, (), "WINDOW", "POST_VIEW")
     )
@@ -751,10 +758,16 @@ def unregister():
         bpy.app.handlers.load_post.remove(handler)
     LOAD_POST_HANDLERS.clear()
 
+    for handler in DEPSGRAPH_UPDATE_POST_HANDLERS:
+        bpy.app.handlers.depsgraph_update_post.remove(handler)
+    DEPSGRAPH_UPDATE_POST_HANDLERS.clear()
+
     for handler in SPACE_VIEW_3D_HANDLERS:
         bpy.types.SpaceView3D.draw_handler_remove(handler, "WINDOW")
     SPACE_VIEW_3D_HANDLERS.clear()
 
+    TextureIndex.close_all()
+
 
 if __name__ == "__main__":
     register()
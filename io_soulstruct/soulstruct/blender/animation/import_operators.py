@@ -10,6 +10,7 @@ __all__ = [
 ]
 
 import re
+import shutil
 import time
 import traceback
 import typing as tp
@@ -22,6 +23,7 @@ from soulstruct.eldenring.containers import DivBinder
 from soulstruct.havok.core import HKX
 
 from soulstruct.blender.exceptions import AnimationImportError, UnsupportedGameError
+from soulstruct.blender.process_pool import get_process_pool, init_animation_worker, read_animation_armature_arrays
 from soulstruct.blender.utilities import *
 
 from .types import SoulstructAnimation
@@ -102,6 +104,67 @@ class ImportHKXAnimationWithBinderChoice(BaseImportHKXAnimation, BinderEntrySele
         """Only show HKX animation entries."""
         return re.match(r"a.*\.hkx(\.dcx)?", entry.name) is not None
 
+    def execute(self, context):
+        """Multiple selected entries are imported in batch mode (see `_import_entries_batch()`)."""
+        if len(self.files) <= 1:
+            return super().execute(context)
+        try:
+            entries = self.get_selected_entries()
+            if not entries:
+                return {"CANCELLED"}  # relevant error already reported
+            return self._import_entries_batch(context, entries)
+        finally:
+            if self.temp_directory:
+                shutil.rmtree(self.temp_directory, ignore_errors=True)
+                self.temp_directory = ""
+
+    def _import_entries_batch(self, context, entries: list[BinderEntry]):
+        """Read and decompress all chosen HKX animation entries to compact arrays in a process pool, and create their
+        Actions on the main thread as they become ready (in entry order)."""
+        p = time.perf_counter()
+        self._record_part_msb_transform()
+
+        self.info(f"Reading and decompressing {len(entries)} HKX animations in parallel.")
+        imported_count = 0
+        with get_process_pool(
+            initializer=init_animation_worker, initargs=(self.SKELETON_HKX, self.HKX_COMPENDIUM)
+        ) as pool:
+            futures = [(entry, pool.submit(read_animation_armature_arrays, entry)) for entry in entries]
+            for i, (entry, future) in enumerate(futures, start=1):
+                anim_name = entry.name.split(".")[0]
+                try:
+                    animation_arrays = future.result()
+                except Exception as ex:
+                    self.error(f"({i}/{len(entries)}) Cannot read HKX animation entry '{entry.name}'. Error: {ex}")
+                    continue
+                try:
+                    SoulstructAnimation.new_from_armature_arrays(
+                        self,
+                        context,
+                        animation_arrays,
+                        name=anim_name,
+                        armature_obj=self.ARMATURE_OBJ,
+                        model_name=self.MODEL_NAME,
+                    )
+                except Exception as ex:
+                    self.error(f"({i}/{len(entries)}) Cannot create animation '{anim_name}'. Error: {ex}")
+                    continue
+                imported_count += 1
+                self.info(f"({i}/{len(entries)}) Created animation '{anim_name}'.")
+
+        self.info(
+            f"Imported {imported_count}/{len(entries)} HKX animations from '{self.BINDER.path_stem}' in "
+            f"{time.perf_counter() - p:.3f} s."
+        )
+        return {"FINISHED"} if imported_count else {"CANCELLED"}
+
+    def _record_part_msb_transform(self):
+        if self.PART_MESH_OBJ and not self.ARMATURE_OBJ.animation_data:
+            # First time creating animation data on MSB Part. We record its last transform for MSB export.
+            self.PART_MESH_OBJ["MSB Translate"] = self.ARMATURE_OBJ.location
+            self.PART_MESH_OBJ["MSB Rotate"] = self.ARMATURE_OBJ.rotation_euler
+            self.PART_MESH_OBJ["MSB Scale"] = self.ARMATURE_OBJ.scale
+
     def _import_entry(self, context, entry: BinderEntry):
         """Import the chosen HKX animation entry."""
 
@@ -110,11 +173,7 @@ class ImportHKXAnimationWithBinderChoice(BaseImportHKXAnimation, BinderEntrySele
         self.info(f"Read `AnimationHKX` Binder entry '{entry.name}' in {time.perf_counter() - p:.3f} s.")
         # `skeleton_hkx` already set to operator.
 
-        if self.PART_MESH_OBJ and not self.ARMATURE_OBJ.animation_data:
-            # First time creating animation data on MSB Part. We record its last transform for MSB export.
-            self.PART_MESH_OBJ["MSB Translate"] = self.ARMATURE_OBJ.location
-            self.PART_MESH_OBJ["MSB Rotate"] = self.ARMATURE_OBJ.rotation_euler
-            self.PART_MESH_OBJ["MSB Scale"] = self.ARMATURE_OBJ.scale
+        self._record_part_msb_transform()
 
         anim_name = entry.name.split(".")[0]
         try:
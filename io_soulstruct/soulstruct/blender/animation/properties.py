@@ -31,3 +31,11 @@ class AnimationExportSettings(bpy.types.PropertyGroup):
                     "first to last keyframe times will be exported",
         default=False,
     )
+
+    sample_fcurves_directly: bpy.props.BoolProperty(
+        name="Sample FCurves Directly",
+        description="Evaluate the action's FCurves and compute bone transforms for all frames at once, rather than "
+                    "updating the whole scene on every frame. Falls back to the slower scene update if the Armature "
+                    "has constraints, drivers, NLA tracks, or non-default bone inheritance",
+        default=True,
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 import time
 import traceback
 import typing as tp
@@ -7,7 +8,7 @@ import typing as tp
 import numpy as np
 
 import bpy
-from mathutils import Matrix, Quaternion as BLQuaternion
+from mathutils import Matrix
 
 from soulstruct.dcx import DCXType
 from soulstruct.games import *
@@ -16,12 +17,78 @@ from soulstruct.havok.fromsoft.darksouls1r.remobnd import *
 from soulstruct.havok.fromsoft.demonssouls import AnimationHKX as DES_AnimationHKX, SkeletonHKX as DES_SkeletonHKX
 from soulstruct.havok.utilities.maths import TRSTransform
 
-from soulstruct.blender.flver.utilities import get_basis_matrix, game_bone_transform_to_bl_bone_matrix
+from soulstruct.blender.flver.utilities import game_bone_transform_arrays_to_bl_bone_matrices
 from soulstruct.blender.exceptions import *
+from soulstruct.blender.process_pool import AnimationArmatureArrays
 from soulstruct.blender.utilities import *
 from .utilities import *
 
 
+# Matches pose bone transform FCurve data paths, capturing bone name and transform property.
+_POSE_BONE_CHANNEL_RE = re.compile(
+    r'^pose\.bones\["(.+)"\]\.(location|rotation_quaternion|rotation_euler|rotation_axis_angle|scale)$'
+)
+# `Keyframe.interpolation` enum value of 'LINEAR' (as used by `foreach_get/set`).
+_KEYFRAME_INTERPOLATION_LINEAR = 1
+
+
+def _sample_fcurve(fcurve: bpy.types.FCurve, frames: np.ndarray) -> np.ndarray:
+    """Evaluate `fcurve` on all `frames`.
+
+    Curves with only linear keyframes are interpolated with NumPy if nothing else can change their value on `frames`:
+    either they have no modifiers and constant extrapolation, or they only have 'CYCLES' modifiers (added to all
+    imported HKX animations) and `frames` are all within the keyframe range, where cycling has no effect. Other curves
+    fall back to `FCurve.evaluate()`.
+    """
+    if frames.size == 0:
+        return np.empty(0)
+    point_count = len(fcurve.keyframe_points)
+    co = np.empty(point_count * 2, dtype=np.float32)
+    fcurve.keyframe_points.foreach_get("co", co)
+    co = co.reshape(-1, 2)
+
+    if fcurve.modifiers:
+        can_interpolate = (
+            all(modifier.type == "CYCLES" for modifier in fcurve.modifiers)
+            and co[0, 0] <= frames.min() and frames.max() <= co[-1, 0]
+        )
+    else:
+        can_interpolate = fcurve.extrapolation == "CONSTANT"
+
+    if can_interpolate:
+        interpolations = np.empty(point_count, dtype=np.int32)
+        fcurve.keyframe_points.foreach_get("interpolation", interpolations)
+        if np.all(interpolations[:-1] == _KEYFRAME_INTERPOLATION_LINEAR):  # last keyframe's interpolation is unused
+            return np.interp(frames, co[:, 0], co[:, 1])
+    return np.array([fcurve.evaluate(frame) for frame in frames])
+
+
+def _set_linear_keyframes(fcurve: bpy.types.FCurve, keyframe_t: np.ndarray, values: np.ndarray):
+    """Add a linear keyframe to (empty) `fcurve` for each `(keyframe_t, value)` pair with bulk `foreach_set` calls.
+
+    `foreach_set` requires a flat `[keyframe_t_0, value_0, keyframe_t_1, value_1, ...]` buffer, which we pass as a
+    contiguous array (rather than a list) so it can be read directly.
+    """
+    count = len(keyframe_t)
+    co = np.empty((count, 2), dtype=np.float32)
+    co[:, 0] = keyframe_t
+    co[:, 1] = values
+    fcurve.keyframe_points.add(count=count)
+    fcurve.keyframe_points.foreach_set("co", co.ravel())
+    fcurve.keyframe_points.foreach_set("interpolation", np.full(count, _KEYFRAME_INTERPOLATION_LINEAR, dtype=np.int32))
+
+
+def _get_channel_samples(
+    channels: dict[tuple[str, int], np.ndarray], data_path: str, defaults: tp.Sequence[float], frame_count: int
+) -> np.ndarray:
+    """Stack sampled `channels` of `data_path` into a `(frame_count, len(defaults))` array. Channels without an FCurve
+    use their `defaults` value on every frame."""
+    return np.stack(
+        [np.broadcast_to(channels.get((data_path, i), default), frame_count) for i, default in enumerate(defaults)],
+        axis=1,
+    )
+
+
 class GameAnimationInfo(tp.NamedTuple):
     # TODO: Probably want an `ANIBND` class in Soulstruct that is simpler (or extended by) the Soulstruct Havok one.
     relative_binder_path: str  # with `model_name` format argument
@@ -242,6 +309,53 @@ class SoulstructAnimation:
 
         return bl_animation
 
+    @classmethod
+    def new_from_armature_arrays(
+        cls,
+        operator: LoggingOperator,
+        context: Context,
+        animation_arrays: AnimationArmatureArrays,
+        name: str,
+        armature_obj: bpy.types.ArmatureObject,
+        model_name: str,
+    ) -> SoulstructAnimation:
+        """Create a new wrapped Blender Action from HKX animation data that has already been decompressed to
+        Armature-space arrays (e.g. in a process pool with `read_animation_armature_arrays()`).
+
+        Otherwise identical to `new_from_hkx_animation()`.
+        """
+        bl_bone_names = {b.name for b in armature_obj.data.bones}
+        arma_trs_arrays = {}
+        for bone_name, trs_array in get_armature_trs_arrays(
+            animation_arrays.track_bone_names, animation_arrays.frame_transforms
+        ).items():
+            if bone_name not in bl_bone_names:
+                operator.warning(
+                    f"Animated bone name '{bone_name}' is missing from FLVER Armature. Animation data for this absent "
+                    f"bone will be discarded."
+                )
+                continue
+            arma_trs_arrays[bone_name] = trs_array
+
+        root_motion = animation_arrays.root_motion
+        if root_motion is not None:
+            root_motion = swap_root_motion_yz(root_motion)
+
+        try:
+            bl_animation = cls.new_from_transform_frames(
+                context,
+                action_name=f"{model_name}|{name}",
+                armature_obj=armature_obj,
+                arma_frames=None,
+                root_motion=root_motion,
+                arma_trs_arrays=arma_trs_arrays,
+            )
+        except Exception as ex:
+            traceback.print_exc()
+            raise AnimationImportError(f"Cannot import HKX animation: {name}. Error: {ex}")
+
+        return bl_animation
+
     @classmethod
     def new_from_transform_frames(
         cls,
@@ -251,9 +365,13 @@ class SoulstructAnimation:
         arma_frames: list[dict[str, TRSTransform]] | None,
         root_motion: np.ndarray | None = None,  # shape (n_frames, 4) or None
         root_motion_bone_name="",
+        arma_trs_arrays: dict[str, np.ndarray] | None = None,
     ) -> SoulstructAnimation:
         """Import single animation HKX.
 
+        Instead of `arma_frames`, `arma_trs_arrays` may be given, which maps bone names to `(frames, 10)` arrays of the
+        same Armature-space transforms (see `get_bone_basis_samples_from_arrays()`).
+
         `arma_frames` is a list of dictionaries mapping bone names to `TRSTransform` objects that represent transforms
         in game armature space. It is necessary to use the computed armature space transforms, rather than the raw local
         HKX frame transforms given in the parent bone's space, because the FLVER skeleton that we are animating here
@@ -296,6 +414,11 @@ class SoulstructAnimation:
         to_60_fps = context.scene.animation_import_settings.to_60_fps
         bl_frames_per_game_frame = 2.0 if to_60_fps else 1.0
 
+        if arma_trs_arrays:
+            frame_count = len(next(iter(arma_trs_arrays.values())))
+        else:
+            frame_count = len(arma_frames) if arma_frames else 0
+
         if root_motion is not None:
             if root_motion.ndim != 2:
                 raise ValueError(f"Root motion array must have 2 dimensions, not {root_motion.ndim}.")
@@ -307,11 +430,11 @@ class SoulstructAnimation:
             if root_motion.shape[0] == 0:
                 # Empty array.  Weird, but we'll leave default scaling and put any single root motion keyframe at 0.
                 pass
-            elif arma_frames and len(root_motion) != len(arma_frames):
+            elif frame_count and len(root_motion) != frame_count:
                 # Root motion is at a lesser (or possibly greater?) sample rate than bone animation. For example, if
                 # only two root motion samples are given, they will be scaled to match the first and last frame of
                 # `arma_frames`. This scaling stacks with the intrinsic `bone_frame_scaling` (e.g. 2 for 60 FPS).
-                keyframe_t_column *= len(arma_frames) / (root_motion.shape[0] - 1)
+                keyframe_t_column *= frame_count / (root_motion.shape[0] - 1)
             root_motion = np.hstack([keyframe_t_column[:, None], root_motion])
 
         action = None  # type: bpy.types.Action | None
@@ -323,7 +446,14 @@ class SoulstructAnimation:
             action = bpy.data.actions.new(name=action_name)
             action.id_root = "OBJECT"
 
-            if arma_frames:
+            if arma_trs_arrays:
+                bone_basis_samples = cls.get_bone_basis_samples_from_arrays(
+                    armature_obj,
+                    arma_trs_arrays,
+                    cls.get_armature_local_inv_matrices(armature_obj),
+                    bl_frames_per_game_frame,
+                )
+            elif arma_frames:
                 bone_basis_samples = cls.get_bone_basis_samples(
                     armature_obj,
                     arma_frames,
@@ -511,68 +641,74 @@ class SoulstructAnimation:
         """Convert a list of Armature-space frames, where each frame is a `dict[bone_name: str, TRSTransform]`, to an
         outer dictionary that maps bone names to an array of 11 bone basis-space keyframe values:
             t, location XYZ, rotation quaternion WXYZ, scale XYZ
-        """
-
-        # Convert armature-space frame data to Blender `(location, rotation_quaternion, scale)` tuples.
-        # Note that we decompose the basis matrices so that quaternion discontinuities are handled properly.
-        last_frame_rotations = {}  # type: dict[str, BLQuaternion]
-        frame_count = len(arma_frames)
 
-        bone_basis_samples = {
-            bone_name: np.empty((frame_count, 11))
+        See `get_bone_basis_samples_from_arrays()`.
+        """
+        arma_trs_arrays = {
+            bone_name: np.array([
+                (
+                    trs.translation.x, trs.translation.y, trs.translation.z,
+                    trs.rotation.x, trs.rotation.y, trs.rotation.z, trs.rotation.w,
+                    trs.scale.x, trs.scale.y, trs.scale.z,
+                )
+                for trs in (frame[bone_name] for frame in arma_frames)
+            ])
             for bone_name in arma_frames[0].keys()
-        }  # type: dict[str, np.ndarray]
+        }
+        return SoulstructAnimation.get_bone_basis_samples_from_arrays(
+            armature, arma_trs_arrays, arma_local_inv_matrices, bl_frames_per_game_frame
+        )
 
-        keyframe_t = 0.0
-        for frame_i, frame in enumerate(arma_frames):
-            # `frame_i` is used to index array rows (created above).
-
-            bl_arma_matrices = {}
-            for bone_name, trs in frame.items():
-                # This function applies Game -> Blender CoB, then bone CoB.
-                bl_arma_matrices[bone_name] = game_bone_transform_to_bl_bone_matrix(
-                    trs.translation,
-                    trs.rotation.to_matrix3(),
-                    trs.scale,
-                )
-            cached_arma_inv_matrices = {}  # cached for frame as needed
-
-            for bone_name, bl_arma_matrix in bl_arma_matrices.items():
-                basis_samples = bone_basis_samples[bone_name]
-
-                bl_edit_bone = armature.data.bones[bone_name]
-
-                if (
-                    bl_edit_bone.parent is not None
-                    and bl_edit_bone.parent.name not in cached_arma_inv_matrices
-                ):
-                    # Cache parent's inverted armature matrix (might be needed by other sibling bones this frame).
-                    # Note that as FLVER and HKX skeleton hierarchies may be different, the FLVER (Blender Armature)
-                    # parent bone may not even be animated, in which case we just use an identity matrix.
-                    parent_name = bl_edit_bone.parent.name
-                    if parent_name in bl_arma_matrices:
-                        cached_arma_inv_matrices[parent_name] = bl_arma_matrices[parent_name].inverted()
-                    else:
-                        cached_arma_inv_matrices[parent_name] = Matrix.Identity(4)
-
-                bl_basis_matrix = get_basis_matrix(
-                    armature,
-                    bone_name,
-                    bl_arma_matrix,
-                    cached_arma_inv_matrices,
-                    arma_local_inv_matrices,
-                )
+    @staticmethod
+    def get_bone_basis_samples_from_arrays(
+        armature: bpy.types.ArmatureObject,
+        arma_trs_arrays: dict[str, np.ndarray],
+        arma_local_inv_matrices: dict[str, Matrix],
+        bl_frames_per_game_frame: float,
+    ) -> dict[str, np.ndarray]:
+        """Convert a dictionary mapping bone names to `(frames, 10)` arrays of game Armature-space transforms (translate
+        XYZ, rotate XYZW, scale XYZ) to a dictionary that maps bone names to `(frames, 11)` arrays of bone basis-space
+        keyframe values:
+            t, location XYZ, rotation quaternion WXYZ, scale XYZ
 
-                t, r, s = bl_basis_matrix.decompose()
+        All frames of each bone are processed at once as `(frames, 4, 4)` matrix arrays.
+        """
+        frame_count = len(next(iter(arma_trs_arrays.values()))) if arma_trs_arrays else 0
+        keyframe_t = np.arange(frame_count, dtype=np.float64) * bl_frames_per_game_frame
 
-                if bone_name in last_frame_rotations:
-                    if last_frame_rotations[bone_name].dot(r) < 0.0:
-                        r.negate()  # negate quaternion to avoid discontinuity (reverse direction of rotation)
+        # Convert armature-space frame data to Blender armature-space bone matrices (Game -> Blender, then bone CoB).
+        bl_arma_matrices = {
+            bone_name: game_bone_transform_arrays_to_bl_bone_matrices(
+                trs_array[:, 0:3], trs_array[:, 3:7], trs_array[:, 7:10]
+            )
+            for bone_name, trs_array in arma_trs_arrays.items()
+        }  # type: dict[str, np.ndarray]
 
-                basis_samples[frame_i] = [keyframe_t, *t, *r, *s]
-                last_frame_rotations[bone_name] = r
+        bone_basis_samples = {}  # type: dict[str, np.ndarray]
+        arma_inv_matrices = {}  # type: dict[str, np.ndarray]  # cached as parents may have multiple children
+        for bone_name, bone_arma_matrices in bl_arma_matrices.items():
+            # Invert Blender's pose process (see `get_basis_matrix()`):
+            #     basis = local.inv @ parent_local @ parent_armature.inv @ armature
+            local_inv = np.array(arma_local_inv_matrices[bone_name])
+            bl_parent_bone = armature.data.bones[bone_name].parent
+            if bl_parent_bone is None:
+                bl_basis_matrices = local_inv @ bone_arma_matrices
+            else:
+                # Note that as FLVER and HKX skeleton hierarchies may be different, the FLVER (Blender Armature) parent
+                # bone may not even be animated, in which case we just use an identity matrix.
+                parent_name = bl_parent_bone.name
+                if parent_name in bl_arma_matrices:
+                    if parent_name not in arma_inv_matrices:
+                        arma_inv_matrices[parent_name] = np.linalg.inv(bl_arma_matrices[parent_name])
+                    parent_removed = arma_inv_matrices[parent_name] @ bone_arma_matrices
+                else:
+                    parent_removed = bone_arma_matrices
+                bl_basis_matrices = (local_inv @ np.array(bl_parent_bone.matrix_local)) @ parent_removed
 
-            keyframe_t += bl_frames_per_game_frame
+            t, r, s = decompose_matrix_arrays(bl_basis_matrices)
+            # Negate quaternions as needed to avoid discontinuities (reverse direction of rotation).
+            r = get_continuous_quaternion_arrays(r)
+            bone_basis_samples[bone_name] = np.c_[keyframe_t, t, r, s]
 
         return bone_basis_samples
 
@@ -633,28 +769,18 @@ class SoulstructAnimation:
             ]
 
         # Build lists of FCurve keyframe points by initializing their size and using `foreach_set`.
-        # Each keyframe point has a `.co` attribute to which we set `(t, value)` (per dimension).
-        # `foreach_set` requires that we flatten the list of tuples to be assigned, a la:
-        #    `[keyframe_t_0, value_0, keyframe_t_1, value_1, ...]`
-        # which we do with array column indexing and `ravel()`.
+        # Each keyframe point has a `.co` attribute to which we set `(t, value)` (per dimension), and an `interpolation`
+        # enum that we set to 'LINEAR' for all keyframes in one call.
         if root_fcurves:
             # NOTE: There may be less root motion samples than bone animation samples. We spread the root motion samples
             # out to match the interval covered by the bone animation frames (done by caller).
             for fcurve_i, root_fcurve in enumerate(root_fcurves):  # x, y, z, -rz (from game ry)
-                data = root_motion[:, [0, fcurve_i + 1]]  # get `keyframe_t` column plus indexed dim of root motion
-                root_fcurve.keyframe_points.add(count=data.shape[0])  # row count
-                root_fcurve.keyframe_points.foreach_set("co", data.ravel().tolist())
-                for kp in root_fcurve.keyframe_points:
-                    kp.interpolation = "LINEAR"
+                _set_linear_keyframes(root_fcurve, root_motion[:, 0], root_motion[:, fcurve_i + 1])
 
         for bone_name, bone_transform_fcurves in bone_fcurves.items():
             basis_samples = bone_basis_samples[bone_name]
             for fcurve_i, bone_fcurve in enumerate(bone_transform_fcurves):
-                bone_fcurve.keyframe_points.add(count=basis_samples.shape[0])  # row count
-                data = basis_samples[:, [0, fcurve_i + 1]]  # get `keyframe_t` column plus indexed dim of bone motion
-                bone_fcurve.keyframe_points.foreach_set("co", data.ravel().tolist())
-                for kp in bone_fcurve.keyframe_points:
-                    kp.interpolation = "LINEAR"
+                _set_linear_keyframes(bone_fcurve, basis_samples[:, 0], basis_samples[:, fcurve_i + 1])
 
     # endregion
     
@@ -692,15 +818,164 @@ class SoulstructAnimation:
             start_frame = int(min(fcurve.range()[0] for fcurve in self.action.fcurves))
             end_frame = int(max(fcurve.range()[1] for fcurve in self.action.fcurves))
 
-        # All frame interleaved transforms, in armature space.
-        root_motion_samples = []  # type: list[tuple[float, float, float, float]]
-        armature_space_frames = []  # type: list[list[TRSTransform]]
+        # Sample every frame, inclusive of `end_frame`.
+        frames = list(range(start_frame, end_frame + 1))
+        if export_settings.from_60_fps:
+            # Skip every second frame to convert 60 FPS to 30 FPS (frame 0 should generally be keyframed).
+            frames = frames[::2]
 
-        has_root_motion = False
+        p = time.perf_counter()
+        fallback_reason = self.get_fcurve_sampling_fallback_reason(armature)
+        if export_settings.sample_fcurves_directly and not fallback_reason:
+            root_motion_samples, armature_space_frames = self._sample_armature_frames_from_fcurves(
+                operator, armature, skeleton_hkx, frames
+            )
+            operator.debug(f"Sampled {len(frames)} animation frames from FCurves in {time.perf_counter() - p:.3f} s.")
+        else:
+            if export_settings.sample_fcurves_directly:
+                operator.info(f"Cannot sample FCurves directly ({fallback_reason}). Updating scene on every frame.")
+            root_motion_samples, armature_space_frames = self._sample_armature_frames_from_scene(
+                operator, context, armature, skeleton_hkx, frames
+            )
+            operator.debug(f"Sampled {len(frames)} animation frames from scene in {time.perf_counter() - p:.3f} s.")
 
         # Animation track order will match Blender bone order (which should come from FLVER).
         track_bone_mapping = list(range(len(skeleton_hkx.skeleton.bones)))
 
+        if len(root_motion_samples) > 0 and np.any(root_motion_samples != root_motion_samples[0]):
+            # Some actual root motion has appeared.
+            root_motion = root_motion_samples.astype(np.float32)
+            # Swap translate Y/Z and negate rotation Z (now Y).
+            root_motion = np.c_[root_motion[:, 0], root_motion[:, 2], root_motion[:, 1], -root_motion[:, 3]]
+        else:
+            root_motion = None
+
+        return animation_hkx_class.from_minimal_data_interleaved(
+            frame_transforms=armature_space_frames,
+            track_names=[bone.name for bone in skeleton_hkx.skeleton.bones],
+            transform_track_bone_indices=track_bone_mapping,
+            root_motion_array=root_motion,
+            original_skeleton_name=skeleton_hkx.skeleton.skeleton.name,
+            frame_rate=30.0,
+            skeleton_for_armature_to_local=skeleton_hkx,
+        )
+
+    def get_fcurve_sampling_fallback_reason(self, armature: bpy.types.ArmatureObject) -> str:
+        """Return why the pose of `armature` cannot be computed from this action's FCurves alone (i.e. it requires a
+        full depsgraph evaluation with `frame_set()`), or an empty string if it can."""
+        anim_data = armature.animation_data
+        if anim_data is None or anim_data.action != self.action:
+            return "action is not active on Armature"
+        if anim_data.drivers or (armature.data.animation_data and armature.data.animation_data.drivers):
+            return "Armature has drivers"
+        if any(not track.mute for track in anim_data.nla_tracks):
+            return "Armature has NLA tracks"
+        if anim_data.action_influence != 1.0 or anim_data.action_blend_type != "REPLACE":
+            return "action is blended"
+        if armature.data.pose_position != "POSE":
+            return "Armature is in Rest Position"
+
+        rotation_animated_bone_names = {
+            match.group(1)
+            for fcurve in self.action.fcurves
+            if (match := _POSE_BONE_CHANNEL_RE.match(fcurve.data_path)) and match.group(2).startswith("rotation_")
+        }
+        for pose_bone in armature.pose.bones:
+            if any(constraint.enabled for constraint in pose_bone.constraints):
+                return f"bone '{pose_bone.name}' has constraints"
+            bone = pose_bone.bone
+            if not bone.use_inherit_rotation or bone.inherit_scale != "FULL" or not bone.use_local_location:
+                return f"bone '{pose_bone.name}' has non-default parent inheritance"
+            if pose_bone.rotation_mode != "QUATERNION" and pose_bone.name in rotation_animated_bone_names:
+                return f"bone '{pose_bone.name}' has animated non-quaternion rotation"
+        return ""
+
+    def _sample_armature_frames_from_fcurves(
+        self,
+        operator: LoggingOperator,
+        armature: bpy.types.ArmatureObject,
+        skeleton_hkx: BaseSkeletonHKX,
+        frames: list[int],
+    ) -> tuple[np.ndarray, list[list[TRSTransform]]]:
+        """Evaluate this action's FCurves on all `frames` and compute Armature-space bone transforms for all frames at
+        once with forward kinematics, without evaluating the scene.
+
+        Returns root motion samples `(frames, 4)` (XYZ and Z rotation) and a list of `TRSTransform`s per frame (in
+        `skeleton_hkx` bone order). Only valid if `get_fcurve_sampling_fallback_reason()` is empty.
+        """
+        frames_array = np.array(frames, dtype=np.float64)
+        frame_count = len(frames)
+
+        bone_channels = {}  # type: dict[str, dict[tuple[str, int], np.ndarray]]
+        object_channels = {}  # type: dict[tuple[str, int], np.ndarray]
+        for fcurve in self.action.fcurves:
+            if fcurve.mute or not fcurve.keyframe_points:
+                continue  # ignored by Blender
+            if match := _POSE_BONE_CHANNEL_RE.match(fcurve.data_path):
+                channel_key = (match.group(2), fcurve.array_index)
+                bone_channels.setdefault(match.group(1), {})[channel_key] = _sample_fcurve(fcurve, frames_array)
+            elif fcurve.data_path in {"location", "rotation_euler"}:
+                object_channels[fcurve.data_path, fcurve.array_index] = _sample_fcurve(fcurve, frames_array)
+
+        # Unanimated channels keep their current value on every frame.
+        root_motion_samples = np.empty((frame_count, 4))
+        root_channels = (("location", 0), ("location", 1), ("location", 2), ("rotation_euler", 2))
+        for i, (data_path, index) in enumerate(root_channels):
+            root_motion_samples[:, i] = object_channels.get((data_path, index), getattr(armature, data_path)[index])
+
+        # Forward kinematics for all frames at once, with parents before children:
+        #     armature = parent_armature @ (parent_local.inv @ local) @ basis
+        armature_matrices = {}  # type: dict[str, np.ndarray]
+        for pose_bone in sorted(armature.pose.bones, key=lambda b: len(b.parent_recursive)):
+            channels = bone_channels.get(pose_bone.name, {})
+            locations = _get_channel_samples(channels, "location", pose_bone.location, frame_count)
+            if pose_bone.rotation_mode == "QUATERNION":
+                quaternions = _get_channel_samples(
+                    channels, "rotation_quaternion", pose_bone.rotation_quaternion, frame_count
+                )
+            else:  # not animated (checked above)
+                quaternions = np.tile(np.array(pose_bone.matrix_basis.to_quaternion()), (frame_count, 1))
+            scales = _get_channel_samples(channels, "scale", pose_bone.scale, frame_count)
+            basis_matrices = compose_matrix_arrays(locations, quaternions, scales)
+
+            local = np.array(pose_bone.bone.matrix_local)
+            if pose_bone.parent is None:
+                armature_matrices[pose_bone.name] = local @ basis_matrices
+            else:
+                parent_local_inv = np.linalg.inv(np.array(pose_bone.parent.bone.matrix_local))
+                armature_matrices[pose_bone.name] = (
+                    armature_matrices[pose_bone.parent.name] @ (parent_local_inv @ local) @ basis_matrices
+                )
+
+        bone_tracks = []  # type: list[list[TRSTransform]]
+        for bone in skeleton_hkx.skeleton.bones:
+            if bone.name not in armature_matrices:
+                operator.warning(
+                    f"Bone '{bone.name}' in HKX skeleton not found in Blender armature. Identity animation "
+                    f"data will exported for this HKX bone for all frames."
+                )
+                bone_tracks.append([TRSTransform.identity() for _ in range(frame_count)])
+                continue
+            bone_tracks.append(bl_matrix_array_to_game_trs_list(armature_matrices[bone.name]))
+
+        return root_motion_samples, [list(frame) for frame in zip(*bone_tracks)]
+
+    @staticmethod
+    def _sample_armature_frames_from_scene(
+        operator: LoggingOperator,
+        context: Context,
+        armature: bpy.types.ArmatureObject,
+        skeleton_hkx: BaseSkeletonHKX,
+        frames: list[int],
+    ) -> tuple[np.ndarray, list[list[TRSTransform]]]:
+        """Set the scene to each of `frames` and read Armature-space pose bone matrices directly.
+
+        Required when constraints, drivers, etc. affect the pose, but much slower than FCurve sampling, as every frame
+        update evaluates the entire scene (including mesh modifiers).
+        """
+        root_motion_samples = []  # type: list[tuple[float, float, float, float]]
+        armature_space_frames = []  # type: list[list[TRSTransform]]
+
         # Store last bone TRS for rotation negation.
         last_bone_trs = {bone.name: TRSTransform.identity() for bone in skeleton_hkx.skeleton.bones}
 
@@ -709,25 +984,15 @@ class SoulstructAnimation:
             bone.name: bone for bone in armature.pose.bones
         }
 
-        # Evaluate all curves at every frame, inclusive of `end_frame`.
-        for i, frame in enumerate(range(start_frame, end_frame + 1)):
+        for i, frame in enumerate(frames):
 
-            if export_settings.from_60_fps and i % 2 == 1:
-                # Skip every second frame to convert 60 FPS to 30 FPS (frame 0 should generally be keyframed).
-                continue
-
-            bpy.context.scene.frame_set(frame)
+            context.scene.frame_set(frame)
             armature_space_frame = []  # type: list[TRSTransform]
 
             # We collect root motion vectors, as we're not sure if any root motion exists yet.
             loc = armature.location
             rot = armature.rotation_euler
-            root_motion_sample = (loc[0], loc[1], loc[2], rot[2])  # XYZ and Z rotation (soon to be game Y)
-            root_motion_samples.append(root_motion_sample)
-            if not has_root_motion:
-                if len(root_motion_samples) >= 2 and root_motion_samples[-1] != root_motion_samples[-2]:
-                    # Some actual root motion has appeared.
-                    has_root_motion = True
+            root_motion_samples.append((loc[0], loc[1], loc[2], rot[2]))  # XYZ and Z rotation (soon to be game Y)
 
             for bone in skeleton_hkx.skeleton.bones:
                 try:
@@ -740,7 +1005,6 @@ class SoulstructAnimation:
                             f"Bone '{bone.name}' in HKX skeleton not found in Blender armature. Identity animation "
                             f"data will exported for this HKX bone for all frames."
                         )
-                    # raise AnimationExportError(f"Bone '{bone.name}' in HKX skeleton not found in Blender armature.")
                     armature_space_transform = TRSTransform.identity()
                 else:
                     armature_space_transform = bl_matrix_to_game_trs(bl_bone.matrix)
@@ -755,22 +1019,7 @@ class SoulstructAnimation:
 
             armature_space_frames.append(armature_space_frame)
 
-        if has_root_motion:
-            root_motion = np.array(root_motion_samples, dtype=np.float32)
-            # Swap translate Y/Z and negate rotation Z (now Y).
-            root_motion = np.c_[root_motion[:, 0], root_motion[:, 2], root_motion[:, 1], -root_motion[:, 3]]
-        else:
-            root_motion = None
-
-        return animation_hkx_class.from_minimal_data_interleaved(
-            frame_transforms=armature_space_frames,
-            track_names=[bone.name for bone in skeleton_hkx.skeleton.bones],
-            transform_track_bone_indices=track_bone_mapping,
-            root_motion_array=root_motion,
-            original_skeleton_name=skeleton_hkx.skeleton.skeleton.name,
-            frame_rate=30.0,
-            skeleton_for_armature_to_local=skeleton_hkx,
-        )
+        return np.array(root_motion_samples), armature_space_frames
 
     def to_wavelet_animation(
         self,
@@ -7,6 +7,8 @@ __all__ = [
     "read_skeleton_hkx_entry",
     "get_armature_frames",
     "get_root_motion",
+    "swap_root_motion_yz",
+    "get_armature_trs_arrays",
     "get_animation_name",
     "get_active_flver_or_part_armature",
 ]
@@ -25,6 +27,7 @@ from soulstruct.havok.fromsoft import demonssouls, darksouls1ptde, darksouls1r,
 from soulstruct.containers import BinderEntry
 
 from soulstruct.blender.exceptions import UnsupportedGameError, SoulstructTypeError
+from soulstruct.blender.process_pool import read_animation_hkx_entry
 from soulstruct.blender.flver.models.types import BlenderFLVER
 from soulstruct.blender.msb.properties.parts import BlenderMSBPartSubtype
 from soulstruct.blender.msb.types.base.parts import BaseBlenderMSBPart
@@ -46,33 +49,6 @@ SKELETON_TYPING = tp.Union[
 ]
 
 
-def read_animation_hkx_entry(hkx_entry: BinderEntry, compendium: HKX = None) -> ANIMATION_TYPING:
-    """Read animation HKX file from a Binder entry and return the appropriate `AnimationHKX` subclass instance."""
-    data = hkx_entry.get_uncompressed_data()
-    packfile_version = data[0x28:0x38]
-    tagfile_version = data[0x10:0x18]
-    if packfile_version.startswith(b"Havok-4.5.0-r1"):  # DeS (c9900)
-        hkx = demonssouls.AnimationHKX.from_bytes(data, compendium=compendium)
-    elif packfile_version.startswith(b"Havok-5.5.0-r1"):  # DeS
-        hkx = demonssouls.AnimationHKX.from_bytes(data, compendium=compendium)
-    elif packfile_version.startswith(b"hk_2010.2.0-r1"):  # PTDE
-        hkx = darksouls1ptde.AnimationHKX.from_bytes(data, compendium=compendium)
-    elif tagfile_version == b"20150100":  # DSR
-        hkx = darksouls1r.AnimationHKX.from_bytes(data, compendium=compendium)
-    elif packfile_version.startswith(b"hk_2014.1.0-r1"):  # BB
-        hkx = bloodborne.AnimationHKX.from_bytes(data, compendium=compendium)
-    elif tagfile_version == b"20180100":  # ER
-        hkx = eldenring.AnimationHKX.from_bytes(data, compendium=compendium)
-    else:
-        raise UnsupportedGameError(
-            f"Cannot support this HKX skeleton file version in Soulstruct and/or Blender.\n"
-            f"   Possible packfile version: {packfile_version}\n"
-            f"   Possible tagfile version: {tagfile_version}"
-        )
-    hkx.path = Path(hkx_entry.name)
-    return hkx
-
-
 def read_skeleton_hkx_entry(hkx_entry: BinderEntry, compendium: HKX = None) -> SKELETON_TYPING:
     """Read skeleton HKX file from a Binder entry and return the appropriate `SkeletonHKX` subclass instance."""
     data = hkx_entry.get_uncompressed_data()
@@ -107,11 +83,18 @@ def get_root_motion(animation_hkx: BaseAnimationHKX, swap_yz=True) -> np.ndarray
         return None
 
     if swap_yz:
-        # Swap Y and Z axes and negate rotation (now around Z axis). Array is read-only, so we construct a new one.
-        root_motion = np.c_[root_motion[:, 0], root_motion[:, 2], root_motion[:, 1], -root_motion[:, 3]]
+        root_motion = swap_root_motion_yz(root_motion)
     return root_motion
 
 
+def swap_root_motion_yz(root_motion: np.ndarray) -> np.ndarray:
+    """Swap Y and Z axes of `(n, 4)` root motion samples and negate rotation (now around Z axis).
+
+    Source array may be read-only, so we construct a new one.
+    """
+    return np.c_[root_motion[:, 0], root_motion[:, 2], root_motion[:, 1], -root_motion[:, 3]]
+
+
 def get_armature_frames(
     animation_hkx: BaseAnimationHKX, skeleton_hkx: BaseSkeletonHKX
 ) -> list[dict[str, TRSTransform]]:
@@ -132,6 +115,12 @@ def get_armature_frames(
     return arma_frame_dicts
 
 
+def get_armature_trs_arrays(track_bone_names: list[str], frame_transforms: np.ndarray) -> dict[str, np.ndarray]:
+    """Split `(frames, tracks, 10)` armature-space transform array (translate XYZ, rotate XYZW, scale XYZ) into a
+    dictionary mapping each track's bone name to its `(frames, 10)` array."""
+    return {bone_name: frame_transforms[:, i] for i, bone_name in enumerate(track_bone_names)}
+
+
 def get_animation_name(animation_id: int, template: str, prefix="a"):
     """Takes a template like '##_####' and converts `animation_id` int (e.g. 13000) to a string (e.g. 'a01_3000')."""
     parts = template.split('_')
@@ -18,6 +18,7 @@ import shutil
 import tempfile
 
 import re
+import time
 import traceback
 import typing as tp
 from pathlib import Path
@@ -31,6 +32,7 @@ from soulstruct.havok.fromsoft.shared import MapCollisionModel, BothResHKXBHD
 from soulstruct.blender.exceptions import MapCollisionImportError
 from soulstruct.blender.utilities import *
 from .types import BlenderMapCollision
+from .utilities import read_both_res_collisions
 
 HKX_NAME_RE = re.compile(r".*\.hkx(\.dcx)?")
 HKXBHD_NAME_RE = re.compile(r"^[hl].*\.hkxbhd(\.dcx)?$")
@@ -92,12 +94,22 @@ class ImportAnyHKXMapCollision(LoggingImportOperator):
             if HKXBHD_NAME_RE.match(file_path.name):
                 both_res_hkxbhd = BothResHKXBHD.from_map_path(file_path.parent)
                 if self.import_all_from_binder:
-                    both_res_hkxbhd.hi_res.load_all()
-                    both_res_hkxbhd.lo_res.load_all()
-                    import_infos.extend([
-                        HKXImportInfo(f"h{hkx_stem}", hi_collision, lo_collision)
-                        for hkx_stem, (hi_collision, lo_collision) in both_res_hkxbhd.get_both_res_dict()
-                    ])
+                    # Decompress and parse all HKX entries in parallel.
+                    p = time.perf_counter()
+                    collisions = read_both_res_collisions(both_res_hkxbhd, allow_missing_lo=True)
+                    loaded_count = 0
+                    for model_name, result in collisions.items():
+                        if isinstance(result, Exception):
+                            self.warning(f"Cannot load HKX '{model_name}' from '{file_path.name}': {result}")
+                            continue
+                        if result[1] is None:
+                            self.warning(f"No lo-res HKX entry found for '{model_name}'. Importing hi-res only.")
+                        import_infos.append(HKXImportInfo(model_name, *result))
+                        loaded_count += 1
+                    self.info(
+                        f"Loaded {loaded_count} HKX models from '{file_path.name}' in parallel in "
+                        f"{time.perf_counter() - p:.2f} s."
+                    )
                 elif self.collision_model_id != -1:
                     hi_hkx_entries = [
                         entry for entry in both_res_hkxbhd.hi_res.entries if self.check_hkx_entry_model_id(entry)
@@ -158,6 +170,7 @@ class ImportAnyHKXMapCollision(LoggingImportOperator):
                         lo_collision = None
                     import_infos.append(HKXImportInfo(file_path.name.split(".")[0], hi_collision, lo_collision))
 
+        p = time.perf_counter()
         for import_info in import_infos:
 
             if isinstance(import_info, BothResHKXBHD):
@@ -180,6 +193,7 @@ class ImportAnyHKXMapCollision(LoggingImportOperator):
                 traceback.print_exc()  # for inspection in Blender console
                 return self.error(f"Cannot import HKX: {import_info.model_name}. Error: {ex}")
 
+        self.debug(f"Created HKX meshes in {time.perf_counter() - p:.2f} s.")
         return {"FINISHED"}
 
     def check_hkx_entry_model_id(self, hkx_entry: BinderEntry) -> bool:
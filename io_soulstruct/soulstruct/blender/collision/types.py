@@ -103,12 +103,9 @@ class BlenderMapCollision(BaseBlenderSoulstructObject[MapCollisionModel, MapColl
         # Swap vertex Y and Z coordinates.
         vertices = np.c_[vertices[:, 0], vertices[:, 2], vertices[:, 1]]
 
-        bl_mesh = bpy.data.meshes.new(name=name)
-        edges = []  # no edges in HKX
-        bl_mesh.from_pydata(vertices, edges, faces)
+        bl_mesh = new_mesh_from_arrays(name, vertices, faces, face_materials)  # no edges in HKX
         for material in bl_materials:
             bl_mesh.materials.append(material)
-        bl_mesh.polygons.foreach_set("material_index", face_materials)
 
         bl_map_collision = cls.new(name, bl_mesh, collection)
         # No further properties to assign.
@@ -163,25 +160,42 @@ class BlenderMapCollision(BaseBlenderSoulstructObject[MapCollisionModel, MapColl
         hi_hkx_meshes = []  # type: list[MapCollisionModelMesh]
         lo_hkx_meshes = []  # type: list[MapCollisionModelMesh]
 
+        # Bulk-read triangulated mesh data. We may as well swap Y and Z coordinates (and add the fourth zero column that
+        # HKX vertices use) here.
+        vert_count = len(tri_mesh_data.vertices)
+        vertex_positions = np.empty(vert_count * 3, dtype=np.float32)
+        tri_mesh_data.vertices.foreach_get("co", vertex_positions)
+        hkx_vertex_positions = np.zeros((vert_count, 4), dtype=np.float32)
+        hkx_vertex_positions[:, :3] = vertex_positions.reshape(-1, 3)[:, [0, 2, 1]]
+
+        face_count = len(tri_mesh_data.polygons)
+        loop_starts = np.empty(face_count, dtype=np.int32)
+        tri_mesh_data.polygons.foreach_get("loop_start", loop_starts)
+        loop_vertex_indices = np.empty(len(tri_mesh_data.loops), dtype=np.int32)
+        tri_mesh_data.loops.foreach_get("vertex_index", loop_vertex_indices)
+        face_vertex_indices = loop_vertex_indices[loop_starts[:, np.newaxis] + np.arange(3)]  # all triangles
+        face_material_indices = np.empty(face_count, dtype=np.int32)
+        tri_mesh_data.polygons.foreach_get("material_index", face_material_indices)
+
+        bpy.data.meshes.remove(tri_mesh_data)
+
+        material_count = len(self.obj.material_slots)
+        if (invalid_faces := np.flatnonzero(face_material_indices >= material_count)).size > 0:
+            face_index = invalid_faces[0]
+            raise MapCollisionExportError(
+                f"Face {face_index} of mesh '{self.name}' has material index {face_material_indices[face_index]}, "
+                f"which is not in the material slots of the mesh."
+            )
+
+        # Split faces by material index with one stable sort, which preserves face order within each material.
         # Note that it is possible that the user may have faces with different materials share vertices; this is fine,
         # and that vertex will be copied into each HKX submesh with a face loop that uses it.
+        material_face_order = np.argsort(face_material_indices, kind="stable")
+        material_face_counts = np.bincount(face_material_indices, minlength=material_count)
+        material_faces = np.split(face_vertex_indices[material_face_order], np.cumsum(material_face_counts)[:-1])
 
-        # Rather than iterating over all faces once for every material, we iterate over all of them once to split them
-        # up by material index, then iterate once over each of those sublists (so the full face list is iterated twice).
-        faces_by_material = {i: [] for i in range(len(self.obj.material_slots))}
-        for face in tri_mesh_data.polygons:
-            try:
-                faces_by_material[face.material_index].append(face)
-            except KeyError:
-                raise MapCollisionExportError(
-                    f"Face {face.index} of mesh '{self.name}' has material index {face.material_index}, "
-                    f"which is not in the material slots of the mesh."
-                )
-
-        # Now iterate over each sublist of faces and create lists of HKX vertices and faces for each one. We maintain
-        # a vertex map that maps the original full-mesh Blender vertex index to the submesh index.
-        for bl_material_index, faces in faces_by_material.items():
-            if not faces:
+        for bl_material_index, faces in enumerate(material_faces):
+            if faces.size == 0:
                 continue  # no faces use this material
 
             # Extract HKX material index from name of Blender material.
@@ -199,30 +213,18 @@ class BlenderMapCollision(BaseBlenderSoulstructObject[MapCollisionModel, MapColl
                 continue  # ignoring resolution
 
             # We can't assume that all faces with the same material index - and the vertices they use - are contiguous
-            # in `polygons`, so a simple global vertex index subtraction won't work. We need to maintain a vertex map.
-            vertex_map = {}
-            hkx_verts_list = []
-            hkx_faces_list = []
-            for face in faces:
-                hkx_face = []
-                for vert_index in face.vertices:
-                    if vert_index not in vertex_map:
-                        # First time this vertex has been used by this submesh.
-                        hkx_vert_index = vertex_map[vert_index] = len(hkx_verts_list)
-                        vert = tri_mesh_data.vertices[vert_index]
-                        hkx_verts_list.append(
-                            [vert.co.x, vert.co.z, vert.co.y, 0.0]  # may as well swap Y and Z coordinates here
-                        )
-                    else:
-                        # Vertex has already been used by this submesh.
-                        hkx_vert_index = vertex_map[vert_index]
-                    hkx_face.append(hkx_vert_index)
-                hkx_faces_list.append(hkx_face)
+            # in `polygons`, so we compact the used vertices. Submesh vertices are ordered by first use.
+            used_vertex_indices, first_uses, submesh_face_indices = np.unique(
+                faces.ravel(), return_index=True, return_inverse=True
+            )
+            first_use_order = np.argsort(first_uses)
+            first_use_ranks = np.empty_like(first_use_order)
+            first_use_ranks[first_use_order] = np.arange(first_use_order.size)
 
             meshes = hi_hkx_meshes if res == "h" else lo_hkx_meshes
             mesh = MapCollisionModelMesh(
-                vertices=np.array(hkx_verts_list, dtype=np.float32),
-                faces=np.array(hkx_faces_list, dtype=np.uint16),
+                vertices=hkx_vertex_positions[used_vertex_indices[first_use_order]],
+                faces=first_use_ranks[submesh_face_indices.ravel()].reshape(-1, 3).astype(np.uint16),
                 material_index=hkx_material_index,
             )
             meshes.append(mesh)
@@ -300,16 +302,16 @@ class BlenderMapCollision(BaseBlenderSoulstructObject[MapCollisionModel, MapColl
             raise ValueError("Number of HKX meshes and Blender material indices must match.")
         vert_stack = []
         face_stack = []
-        face_materials = []
         offset = initial_offset
-        for mesh, bl_material_index in zip(collision.meshes, bl_material_indices, strict=True):
+        for mesh in collision.meshes:
             face_stack.append(mesh.faces[:, :3] + offset)
             vert_stack.append(mesh.vertices[:, :3])
-            face_materials.extend([bl_material_index] * mesh.face_count)
             offset += mesh.vertex_count
         vertices = np.vstack(vert_stack)
-        faces = np.vstack(face_stack)
-        return vertices, faces, np.array(face_materials)
+        faces = np.vstack(face_stack).astype(np.int32)
+        face_counts = [mesh.face_count for mesh in collision.meshes]
+        face_materials = np.repeat(np.asarray(bl_material_indices, dtype=np.int32), face_counts)
+        return vertices, faces, face_materials
 
     @classmethod
     def get_hkx_material(cls, hkx_material_index: int, is_hi_res: bool) -> bpy.types.Material:
@@ -2,9 +2,57 @@ from __future__ import annotations
 
 __all__ = [
     "HKX_MATERIAL_NAME_RE",
+    "read_both_res_collisions",
 ]
 
 import re
+import typing as tp
+
+from soulstruct.containers import EntryNotFoundError
+from soulstruct.havok.fromsoft.shared import BothResHKXBHD, MapCollisionModel
+
+from soulstruct.blender.process_pool import get_process_pool, read_map_collision
 
 
 HKX_MATERIAL_NAME_RE = re.compile(r"HKX (?P<index>\d+) \((?P<res>Hi|Lo)\).*")  # Blender HKX material name
+
+
+def read_both_res_collisions(
+    both_res_hkxbhd: BothResHKXBHD,
+    model_names: tp.Iterable[str] = None,
+    max_workers: int = None,
+    allow_missing_lo=False,
+) -> dict[str, tuple[MapCollisionModel, MapCollisionModel | None] | Exception]:
+    """Decompress and parse hi and lo-res HKX entries for each of `model_names` (or every hi-res entry, if `None`)
+    from `both_res_hkxbhd` in a process pool.
+
+    Returned values are either `(hi_collision, lo_collision)` or the exception raised while loading that model, which
+    is an `EntryNotFoundError` if either resolution's entry is missing. If `allow_missing_lo` is True, models with no
+    lo-res entry are returned as `(hi_collision, None)` instead.
+    """
+    hi_entries = {entry.minimal_stem: entry for entry in both_res_hkxbhd.hi_res.entries}
+    lo_entries = {entry.minimal_stem: entry for entry in both_res_hkxbhd.lo_res.entries}
+    if model_names is None:
+        model_names = hi_entries.keys()
+
+    results = {}  # type: dict[str, tuple[MapCollisionModel, MapCollisionModel | None] | Exception]
+    with get_process_pool(max_workers) as pool:
+        futures = {}
+        for model_name in dict.fromkeys(model_names):  # unique, in order
+            hi_entry = hi_entries.get(f"h{model_name[1:]}")
+            lo_entry = lo_entries.get(f"l{model_name[1:]}")
+            if hi_entry is None or (lo_entry is None and not allow_missing_lo):
+                results[model_name] = EntryNotFoundError(
+                    f"Cannot find {'hi' if hi_entry is None else 'lo'}-res HKX entry for model '{model_name}'."
+                )
+                continue
+            futures[model_name] = (
+                pool.submit(read_map_collision, hi_entry.get_uncompressed_data()),
+                pool.submit(read_map_collision, lo_entry.get_uncompressed_data()) if lo_entry else None,
+            )
+        for model_name, (hi_future, lo_future) in futures.items():
+            try:
+                results[model_name] = (hi_future.result(), lo_future.result() if lo_future else None)
+            except Exception as ex:
+                results[model_name] = ex
+    return results
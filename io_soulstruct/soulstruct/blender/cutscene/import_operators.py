@@ -5,13 +5,14 @@ __all__ = [
     "ImportHKXCutscene",
 ]
 
-import math
 import re
+import time
 import traceback
 import typing as tp
 from pathlib import Path
 
 import bpy
+import numpy as np
 
 from soulstruct.base.animations.sibcam import CameraFrameTransform
 
@@ -22,6 +23,7 @@ from soulstruct.blender.exceptions import CutsceneImportError, SoulstructTypeErr
 from soulstruct.blender.msb.properties.parts import MSBPartArmatureMode
 from soulstruct.blender.msb.types.adapters import get_part_game_name
 from soulstruct.blender.msb.types.darksouls1r import *
+from soulstruct.blender.process_pool import get_process_pool, load_remo_cut_parts
 from soulstruct.blender.utilities import *
 
 if tp.TYPE_CHECKING:
@@ -29,6 +31,10 @@ if tp.TYPE_CHECKING:
 
 REMOBND_RE = re.compile(r"^.*?\.remobnd(\.dcx)?$")
 
+# `Keyframe.interpolation` enum values, for `foreach_set`.
+_KEYFRAME_INTERPOLATION_CONSTANT = 0
+_KEYFRAME_INTERPOLATION_LINEAR = 1
+
 
 BL_PART_CLASSES = {
     RemoPartType.Player: BlenderMSBPlayerStart,
@@ -38,6 +44,28 @@ BL_PART_CLASSES = {
     RemoPartType.Collision: BlenderMSBCollision,
 }
 
+# Maps `(map_area_block, bl_part_class)` to the name of the MSB Part collection for those Remo parts, and its Mesh
+# objects by part game name (or `None` if the collection does not exist).
+MSB_PART_INDEX = dict[
+    tuple[tuple[int, int], type["BaseBlenderMSBPart"]], tuple[str, dict[str, bpy.types.Object] | None]
+]
+
+
+def _add_keyframes(fcurve: bpy.types.FCurve, keyframe_t: np.ndarray, values: np.ndarray, constant_mask: np.ndarray):
+    """Add a keyframe to (empty) `fcurve` for each `(keyframe_t, value)` pair with bulk `foreach_set` calls.
+
+    Keyframes in `constant_mask` (e.g. the final frame of each cut) use 'CONSTANT' interpolation, and all others use
+    'LINEAR' interpolation.
+    """
+    count = len(keyframe_t)
+    co = np.empty((count, 2), dtype=np.float32)
+    co[:, 0] = keyframe_t
+    co[:, 1] = values
+    interpolations = np.where(constant_mask, _KEYFRAME_INTERPOLATION_CONSTANT, _KEYFRAME_INTERPOLATION_LINEAR)
+    fcurve.keyframe_points.add(count=count)
+    fcurve.keyframe_points.foreach_set("co", co.ravel())
+    fcurve.keyframe_points.foreach_set("interpolation", interpolations.astype(np.int32))
+
 
 class ImportHKXCutscene(LoggingImportOperator):
     bl_idname = "import_scene.hkx_cutscene"
@@ -86,7 +114,10 @@ class ImportHKXCutscene(LoggingImportOperator):
             return {"FINISHED"}
 
         # We don't load MSBs and attach them to the RemoBND. We look up the imported Parts in Blender directly.
-        remobnd.load_remo_parts()
+        p = time.perf_counter()
+        all_remo_parts = self.load_remo_parts(remobnd)
+        self.info(f"Loaded cutscene parts from {len(remobnd.cuts)} cuts in {time.perf_counter() - p:.3f} s.")
+        msb_part_index = self.get_msb_part_index(context, all_remo_parts)
 
         self.info(f"Importing HKX cutscene: {remobnd.cutscene_name}")
 
@@ -99,7 +130,7 @@ class ImportHKXCutscene(LoggingImportOperator):
         cutscene_collection.objects.link(camera)
         all_animations = [SoulstructAnimation(camera.animation_data.action)]
 
-        for remo_part_type, remo_parts_dict in remobnd.all_remo_parts.items():
+        for remo_part_type, remo_parts_dict in all_remo_parts.items():
             
             if remo_part_type == RemoPartType.Dummy:
                 for remo_part in remo_parts_dict.values():
@@ -128,7 +159,7 @@ class ImportHKXCutscene(LoggingImportOperator):
 
                 self.debug(f"Adding RemoPart: {remo_part.name}")
 
-                bl_part = self.find_remo_part_msb_part(context, remo_part, bl_part_class)
+                bl_part = self.find_remo_part_msb_part(remo_part, bl_part_class, msb_part_index)
                 if bl_part is None:
                     continue  # next RemoPart
 
@@ -241,38 +272,101 @@ class ImportHKXCutscene(LoggingImportOperator):
                 all_cut_frames.append(cut.sibcam.clip_frame_count)
         return all_cut_frames
 
+    def load_remo_parts(self, remobnd: RemoBND) -> dict[RemoPartType, dict[str, RemoPart]]:
+        """Decompress and load all Remo parts of `remobnd`, with each cut loaded in a separate process.
+
+        Falls back to loading all cuts in this process if parallel loading fails.
+        """
+        if len(remobnd.cuts) > 1:
+            try:
+                return self._load_remo_parts_parallel(remobnd)
+            except Exception as ex:
+                traceback.print_exc()  # for inspection in Blender console
+                self.warning(f"Could not load cutscene cuts in parallel. Loading them one by one instead. Error: {ex}")
+        remobnd.load_remo_parts()
+        return remobnd.all_remo_parts
+
+    @staticmethod
+    def _load_remo_parts_parallel(remobnd: RemoBND) -> dict[RemoPartType, dict[str, RemoPart]]:
+        """Load the Remo parts of each cut of `remobnd` in a process pool, and merge each part's armature-space frames
+        from all cuts (in cut order). Only each cut (not the whole Binder) is sent to its worker."""
+        main_map_area_block = remobnd.get_map_area_block()
+        with get_process_pool() as pool:
+            all_cut_remo_parts = list(
+                pool.map(load_remo_cut_parts, remobnd.cuts, [main_map_area_block] * len(remobnd.cuts))
+            )
+
+        all_remo_parts = {}  # type: dict[RemoPartType, dict[str, RemoPart]]
+        for cut_remo_parts in all_cut_remo_parts:
+            for remo_part_type, cut_remo_parts_dict in cut_remo_parts.items():
+                remo_parts_dict = all_remo_parts.setdefault(remo_part_type, {})
+                for remo_part_name, remo_part in cut_remo_parts_dict.items():
+                    if remo_part_name in remo_parts_dict:
+                        # Later cuts overwrite root bone names, as when all cuts are loaded into the same parts.
+                        merged_remo_part = remo_parts_dict[remo_part_name]
+                        merged_remo_part.cut_arma_frames |= remo_part.cut_arma_frames
+                        merged_remo_part.part_cutscene_root_bone_names = remo_part.part_cutscene_root_bone_names
+                    else:
+                        remo_parts_dict[remo_part_name] = remo_part
+        return all_remo_parts
+
+    @staticmethod
+    def get_msb_part_index(
+        context: bpy.types.Context, all_remo_parts: dict[RemoPartType, dict[str, RemoPart]]
+    ) -> MSB_PART_INDEX:
+        """Index the Mesh objects of every MSB Part collection needed by `all_remo_parts` by part game name, so each
+        Remo part's MSB Part can be found with a single lookup rather than by scanning the collection."""
+        msb_part_index = {}  # type: MSB_PART_INDEX
+        for remo_part_type, remo_parts_dict in all_remo_parts.items():
+            bl_part_class = BL_PART_CLASSES.get(remo_part_type)
+            if bl_part_class is None:
+                continue
+            for remo_part in remo_parts_dict.values():
+                key = (remo_part.map_area_block, bl_part_class)
+                if key in msb_part_index:
+                    continue
+                area, block = remo_part.map_area_block
+                map_stem = f"m{area:02d}_{block:02d}_00_00"
+                msb_stem = context.scene.soulstruct_settings.get_latest_map_stem_version(map_stem)
+                collection_name = f"{msb_stem} {bl_part_class.MSB_ENTRY_SUBTYPE.get_nice_name()} Parts"
+                # TODO: Restrict to Scene collections?
+                part_collection = bpy.data.collections.get(collection_name)
+                if part_collection is None:
+                    msb_part_index[key] = (collection_name, None)
+                    continue
+                part_objects = {}  # type: dict[str, bpy.types.Object]
+                for obj in part_collection.objects:  # immediate child objects only
+                    # TODO: Use proper 'find object of type' utility.
+                    if obj.type == "MESH":
+                        part_objects.setdefault(get_part_game_name(obj.name), obj)  # first object found wins
+                msb_part_index[key] = (collection_name, part_objects)
+        return msb_part_index
+
     def find_remo_part_msb_part(
-        self, context: bpy.types.Context, remo_part: RemoPart, bl_part_class: type[BaseBlenderMSBPart]
+        self, remo_part: RemoPart, bl_part_class: type[BaseBlenderMSBPart], msb_part_index: MSB_PART_INDEX
     ) -> BaseBlenderMSBPart | None:
 
-        area, block = remo_part.map_area_block
-        map_stem = f"m{area:02d}_{block:02d}_00_00"
-        msb_stem = context.scene.soulstruct_settings.get_latest_map_stem_version(map_stem)
-        collection_name = f"{msb_stem} {bl_part_class.MSB_ENTRY_SUBTYPE.get_nice_name()} Parts"
-        try:
-            # TODO: Restrict to Scene collections?
-            part_collection = bpy.data.collections[collection_name]
-        except KeyError:
+        collection_name, part_objects = msb_part_index[remo_part.map_area_block, bl_part_class]
+        if part_objects is None:
             self.error(
                 f"Could not find MSB Part collection '{collection_name}' for cutscene Part "
                 f"'{remo_part.map_part_name}' (full Remo name '{remo_part.name}')."
             )
             return None
 
-        for obj in part_collection.objects:  # immediate child objects only
-            # TODO: Use proper 'find object of type' utility.
-            if obj.type == "MESH" and get_part_game_name(obj.name) == remo_part.map_part_name:
-                try:
-                    return bl_part_class(obj)
-                except SoulstructTypeError:
-                    self.error(
-                        f"Found Mesh object '{obj.name}' in collection '{part_collection.name}', but it "
-                        f"is not a valid `{bl_part_class.__name__}` object."
-                    )
-                    return None
+        obj = part_objects.get(remo_part.map_part_name)
+        if obj is None:
+            self.error(f"Could not find MSB Part '{remo_part.map_part_name}' in MSB collection '{collection_name}'.")
+            return None
 
-        self.error(f"Could not find MSB Part '{remo_part.map_part_name}' in MSB collection '{part_collection.name}'.")
-        return None
+        try:
+            return bl_part_class(obj)
+        except SoulstructTypeError:
+            self.error(
+                f"Found Mesh object '{obj.name}' in collection '{collection_name}', but it "
+                f"is not a valid `{bl_part_class.__name__}` object."
+            )
+            return None
 
     def create_cutscene_dummy(
         self,
@@ -386,59 +480,58 @@ class ImportHKXCutscene(LoggingImportOperator):
         camera_fov_keyframes: list[list[tuple[float, float]]],
         to_60_fps: bool,
     ):
-        """Add keyframes for camera object and data (focal length)."""
-        camera_data = camera.data  # type: bpy.types.Camera
+        """Add keyframes for camera object and data (focal length) with bulk `foreach_set` calls.
 
-        final_frame_indices = set()
+        The final keyframe of each cut uses 'CONSTANT' interpolation, so cameras cut instantly to the next cut.
+        """
+        camera_data = camera.data  # type: bpy.types.Camera
+        frame_step = 2 if to_60_fps else 1
 
         # TODO: Fix any camera rotation discontinuities first?
 
-        # NOT reset across cuts.
-        cutscene_frame_index = 0
-
-        # TODO: Use array `foreach_set`, not `keyframe_insert`.
-
-        for cut_camera_transforms in camera_transforms:
-
-            for cut_frame_index, camera_transform in enumerate(cut_camera_transforms):
-                bl_frame_index = cutscene_frame_index * 2 if to_60_fps else cutscene_frame_index
-                bl_translate = to_blender(camera_transform.position)
-                bl_euler = to_blender(camera_transform.rotation)
-                camera.location = bl_translate
-                camera.rotation_euler = bl_euler
-                camera.keyframe_insert(data_path="location", frame=bl_frame_index)
-                camera.keyframe_insert(data_path="rotation_euler", frame=bl_frame_index)
-                if cut_frame_index == len(cut_camera_transforms) - 1:
-                    final_frame_indices.add(bl_frame_index)
-                cutscene_frame_index += 1
-
-        for fcurve in camera.animation_data.action.fcurves:
-            for keyframe in fcurve.keyframe_points:
-                if int(keyframe.co.x) in final_frame_indices:
-                    keyframe.interpolation = "CONSTANT"
-                else:
-                    keyframe.interpolation = "LINEAR"
+        # Frame index is NOT reset across cuts.
+        cut_frame_counts = np.array([len(cut_camera_transforms) for cut_camera_transforms in camera_transforms])
+        transform_frames = np.arange(cut_frame_counts.sum()) * frame_step
+        final_frame_indices = (np.cumsum(cut_frame_counts) - 1)[cut_frame_counts > 0] * frame_step
+        bl_translates = np.array(
+            [to_blender(t.position) for cut_camera_transforms in camera_transforms for t in cut_camera_transforms],
+            dtype=np.float32,
+        ).reshape(-1, 3)
+        bl_eulers = np.array(
+            [to_blender(t.rotation) for cut_camera_transforms in camera_transforms for t in cut_camera_transforms],
+            dtype=np.float32,
+        ).reshape(-1, 3)
+
+        if transform_frames.size > 0:
+            constant_mask = np.isin(transform_frames, final_frame_indices)
+            obj_action = camera.animation_data.action
+            for data_path, values in (("location", bl_translates), ("rotation_euler", bl_eulers)):
+                for i in range(3):
+                    fcurve = obj_action.fcurves.new(data_path=data_path, index=i, action_group="Object Transforms")
+                    _add_keyframes(fcurve, transform_frames, values[:, i], constant_mask)
 
         cut_fov_t_offset = 0
-        camera_final_t = set()
-        sensor_width = camera_data.sensor_width
+        fov_t = []
+        fovs = []
+        camera_final_t = []
         for cut_fov_keyframes, cut_camera_transforms in zip(camera_fov_keyframes, camera_transforms, strict=True):
-
-            bl_t = -1
-            for t, fov in cut_fov_keyframes:
-                camera_data.lens = sensor_width / (2 * math.tan(fov / 2.0))
-                bl_t = (cut_fov_t_offset + t) * 2 if to_60_fps else (cut_fov_t_offset + t)
-                camera_data.keyframe_insert(data_path="lens", frame=bl_t)
-            if bl_t >= 0:
-                camera_final_t.add(bl_t)
+            if cut_fov_keyframes:
+                cut_fov_t, cut_fovs = zip(*cut_fov_keyframes)
+                fov_t.append(cut_fov_t_offset + np.array(cut_fov_t, dtype=np.float64))
+                fovs.append(np.array(cut_fovs, dtype=np.float64))
+                camera_final_t.append((cut_fov_t_offset + cut_fov_t[-1]) * frame_step)
 
             # Add transform frame count to `t` offset for next cut.
             cut_fov_t_offset += len(cut_camera_transforms)
 
-        # Make all keyframes in `final_frame_indices` 'CONSTANT' interpolation.
-        for fcurve in camera_data.animation_data.action.fcurves:
-            for keyframe in fcurve.keyframe_points:
-                if int(keyframe.co.x) in camera_final_t:
-                    keyframe.interpolation = "CONSTANT"
-                else:
-                    keyframe.interpolation = "LINEAR"
+        if fov_t:
+            bl_fov_t = np.concatenate(fov_t) * frame_step
+            lenses = camera_data.sensor_width / (2 * np.tan(np.concatenate(fovs) / 2.0))
+            # A later keyframe at the same frame replaces an earlier one (as with `keyframe_insert()`). This also sorts
+            # keyframes by frame.
+            bl_fov_t, last_indices = np.unique(bl_fov_t[::-1], return_index=True)
+            lenses = lenses[::-1][last_indices]
+            # Keyframes are 'CONSTANT' if their (truncated) frame is the final FOV keyframe of a cut.
+            constant_mask = np.isin(np.trunc(bl_fov_t.astype(np.float32)), camera_final_t)
+            fcurve = camera_data.animation_data.action.fcurves.new(data_path="lens")
+            _add_keyframes(fcurve, bl_fov_t, lenses, constant_mask)
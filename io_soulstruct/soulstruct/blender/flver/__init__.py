@@ -133,6 +133,7 @@ __all__ = [
     # region Operators
     "ImportTextures",
     "FindMissingTexturesInImageCache",
+    "UpdateTextureIndex",
     # "ExportTexturesIntoBinder",
     # endregion
 
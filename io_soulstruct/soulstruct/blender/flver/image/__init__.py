@@ -12,6 +12,7 @@ __all__ = [
     # region Operators
     "ImportTextures",
     "FindMissingTexturesInImageCache",
+    "UpdateTextureIndex",
     # "ExportTexturesIntoBinder",
     # endregion
 
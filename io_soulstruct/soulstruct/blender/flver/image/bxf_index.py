@@ -0,0 +1,114 @@
+"""Minimal reader for the entry tables of split BXF Binder headers (BHF3/BHF4), used to find TPFs in TPFBHD/CHRTPFBHD
+Binders without reading their (usually huge) BDT data files.
+
+Only entry names and their data ranges in the BDT are read. Entry data is read later on demand from a memory-mapped BDT.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "BXFEntryLocation",
+    "read_bhd_entry_locations",
+]
+
+import mmap
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+# `Binder` format flags, after bit order correction.
+_FORMAT_IDS = 0b0000_0010
+_FORMAT_NAMES_1 = 0b0000_0100
+_FORMAT_NAMES_2 = 0b0000_1000
+_FORMAT_LONG_OFFSETS = 0b0001_0000
+_FORMAT_COMPRESSION = 0b0010_0000
+
+
+@dataclass(slots=True, frozen=True)
+class BXFEntryLocation:
+    """Location of a single (possibly DCX-compressed) entry's data in a BDT file."""
+    name: str  # entry name only (no directories)
+    bdt_path: Path
+    offset: int
+    size: int  # stored (compressed) size
+
+    def read(self) -> bytes:
+        """Read entry data from memory-mapped BDT, without reading the rest of the file."""
+        with self.bdt_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as bdt_map:
+            return bdt_map[self.offset:self.offset + self.size]
+
+
+def read_bhd_entry_locations(bhd_data: bytes, bdt_path: Path) -> list[BXFEntryLocation]:
+    """Read entry names and data ranges from BHF3 or BHF4 header data.
+
+    Raises `ValueError` if the header is not a supported BHF header, has no entry names, or has an unterminated name.
+    """
+    magic = bhd_data[:4]
+    if magic == b"BHF3":
+        return _read_bhf3_entry_locations(bhd_data, bdt_path)
+    if magic == b"BHF4":
+        return _read_bhf4_entry_locations(bhd_data, bdt_path)
+    raise ValueError(f"Not a BHF3/BHF4 split Binder header: magic {magic!r}")
+
+
+def _read_format(raw_format: int, bit_big_endian: bool) -> int:
+    if bit_big_endian or (raw_format & 0b0000_0001 and not raw_format & 0b1000_0000):
+        return raw_format
+    return int(f"{raw_format:08b}"[::-1], 2)
+
+
+def _read_name(bhd_data: bytes, name_offset: int, unicode: bool, byte_order: str) -> str:
+    if unicode:
+        end = bhd_data.find(b"\0\0", name_offset)
+        while end != -1 and (end - name_offset) % 2:
+            end = bhd_data.find(b"\0\0", end + 1)  # terminator must be aligned to a UTF-16 character
+        if end == -1:
+            raise ValueError(f"Unterminated UTF-16 entry name at BHD offset {name_offset}.")
+        name = bhd_data[name_offset:end].decode("utf-16-be" if byte_order == ">" else "utf-16-le")
+    else:
+        name = bhd_data[name_offset:bhd_data.index(b"\0", name_offset)].decode("shift_jis")
+    return name.replace("\\", "/").split("/")[-1]
+
+
+def _read_bhf3_entry_locations(bhd_data: bytes, bdt_path: Path) -> list[BXFEntryLocation]:
+    bit_big_endian = bool(bhd_data[0xE])
+    binder_format = _read_format(bhd_data[0xC], bit_big_endian)
+    byte_order = ">" if bhd_data[0xD] else "<"
+    if not binder_format & (_FORMAT_NAMES_1 | _FORMAT_NAMES_2):
+        raise ValueError("BHF3 header has no entry names.")
+    file_count = struct.unpack_from(f"{byte_order}i", bhd_data, 0x10)[0]
+
+    # Flags (4), stored size, data offset, [ID], name offset, [uncompressed size]
+    entry_format = byte_order + "4xi" + ("q" if binder_format & _FORMAT_LONG_OFFSETS else "I")
+    entry_format += "4xI" if binder_format & _FORMAT_IDS else "I"
+    entry_format += "4x" if binder_format & _FORMAT_COMPRESSION else ""
+    entry_size = struct.calcsize(entry_format)
+
+    locations = []
+    for i in range(file_count):
+        size, offset, name_offset = struct.unpack_from(entry_format, bhd_data, 0x20 + i * entry_size)
+        name = _read_name(bhd_data, name_offset, False, byte_order)
+        locations.append(BXFEntryLocation(name, bdt_path, offset, size))
+    return locations
+
+
+def _read_bhf4_entry_locations(bhd_data: bytes, bdt_path: Path) -> list[BXFEntryLocation]:
+    byte_order = ">" if bhd_data[0x9] else "<"
+    bit_big_endian = not bhd_data[0xA]
+    file_count = struct.unpack_from(f"{byte_order}i", bhd_data, 0xC)[0]
+    entry_size = struct.unpack_from(f"{byte_order}q", bhd_data, 0x20)[0]
+    unicode = bool(bhd_data[0x30])
+    binder_format = _read_format(bhd_data[0x31], bit_big_endian)
+    if not binder_format & (_FORMAT_NAMES_1 | _FORMAT_NAMES_2):
+        raise ValueError("BHF4 header has no entry names.")
+
+    # Flags (4), -1 (4), stored size, [uncompressed size], data offset, [ID], name offset
+    entry_format = byte_order + "8xq" + ("8x" if binder_format & _FORMAT_COMPRESSION else "")
+    entry_format += "q" if binder_format & _FORMAT_LONG_OFFSETS else "I"
+    entry_format += "4xI" if binder_format & _FORMAT_IDS else "I"
+
+    locations = []
+    for i in range(file_count):
+        size, offset, name_offset = struct.unpack_from(entry_format, bhd_data, 0x40 + i * entry_size)
+        name = _read_name(bhd_data, name_offset, unicode, byte_order)
+        locations.append(BXFEntryLocation(name, bdt_path, offset, size))
+    return locations
@@ -7,6 +7,7 @@ __all__ = [
 import logging
 import re
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import bpy
@@ -17,6 +18,9 @@ from soulstruct.games import *
 
 from soulstruct.blender.utilities import LoggingOperator, CheckDCXMode, MAP_STEM_RE
 
+from .bxf_index import BXFEntryLocation, read_bhd_entry_locations
+from .texture_index import TextureIndex, TextureIndexEntry
+
 if tp.TYPE_CHECKING:
     from soulstruct.flver import FLVER
 
@@ -33,7 +37,7 @@ def lower_name(texture: TPFTexture) -> str:
     return texture.stem.lower()
 
 
-def lower_stem(path_or_entry: Path | BinderEntry) -> str:
+def lower_stem(path_or_entry: Path | BinderEntry | BXFEntryLocation) -> str:
     return path_or_entry.name.split(".")[0].lower()
 
 
@@ -55,8 +59,9 @@ class ImageImportManager:
     # Maps Binder stems to Binder file paths we are aware of, but have NOT yet opened and scanned for TPF sources.
     _binder_paths: dict[str, Path]
 
-    # Maps TPF stems to file paths or Binder entries we are aware of, but have NOT yet loaded into TPF textures (below).
-    _pending_tpf_sources: dict[str, Path | BinderEntry]
+    # Maps TPF stems to file paths, Binder entries, or split Binder entry locations (read from BHD headers only) that we
+    # are aware of, but have NOT yet loaded into TPF textures (below).
+    _pending_tpf_sources: dict[str, Path | BinderEntry | BXFEntryLocation]
 
     # Maps TPF stems to opened TPF textures.
     _tpf_textures: dict[str, TPFTexture]
@@ -70,6 +75,22 @@ class ImageImportManager:
     # Holds TPF stems that have already been opened and scanned, so they aren't checked again.
     _scanned_tpf_sources: set[str]
 
+    # Loose multi-texture map area TPFs (e.g. 'mXX_9999.tpf') whose textures do not share the TPF stem, so they must be
+    # fully loaded before a texture can be found in them. Loaded before any Binders are opened.
+    _pending_area_tpf_paths: list[Path]
+
+    # Optional persistent index of all texture stems in the project/game directories. If available, it is checked
+    # before any registered sources, and FLVER source types do not need their texture locations registered.
+    _texture_index: TextureIndex | None
+
+    # Holds `(source_path, entry_name)` keys of TPFs already loaded from index locations.
+    _scanned_index_tpfs: set[tuple[Path, str]]
+
+    # Lower-case model stems and map areas (e.g. 'c1234', 'm10') of registered FLVERs, in registration order. Texture
+    # index sources with these prefixes are preferred over other sources with the same texture stem, like the model
+    # and area locations registered when no index is used.
+    _index_source_prefixes: list[str]
+
     def __init__(self, operator: LoggingOperator, context: bpy.types.Context):
         self.operator = operator
         self.context = context
@@ -79,6 +100,13 @@ class ImageImportManager:
         self._tpf_textures = {}  # NOTE: keys are all lower case
         self._scanned_binder_paths = set()
         self._scanned_tpf_sources = set()  # NOTE: all lower case
+        self._pending_area_tpf_paths = []
+        self._texture_index = TextureIndex.from_context(operator, context)
+        self._scanned_index_tpfs = set()
+        self._index_source_prefixes = []
+
+        if self._texture_index:
+            return  # `parts/Common*.tpf` textures are indexed
 
         # We register all `parts/common_*.tpf` textures immediately (if available).
         try:
@@ -93,11 +121,25 @@ class ImageImportManager:
 
         `flver_source_path` is the path to the Binder file containing the FLVER, or loose FLVER file.
         `flver_binder` is the Binder object that contains the FLVER, if it has already been opened.
+
+        If a texture index is in use, only `flver_binder` is scanned, as all other locations are already indexed, and
+        the model stem (and map area, for loose Map Pieces) is recorded to prefer matching index sources.
         """
         source_name = Path(flver_source_path).name.removesuffix(".dcx")  # e.g. 'c1234.chrbnd' or 'm1234B0A10.flver'
         model_stem = source_name.split(".")[0]
         source_dir = flver_source_path.parent
 
+        if self._texture_index:
+            if flver_binder:
+                self.scan_binder_textures(flver_binder)
+            source_prefixes = [model_stem.lower()]
+            if model_stem.startswith("c") and source_name.endswith((".flver", ".chrbnd")):
+                source_prefixes.append(f"{model_stem[:4]}9".lower())  # shared 'cXXX9' textures
+            elif model_stem.startswith("m") and source_name.endswith(".flver") and MAP_STEM_RE.match(source_dir.name):
+                source_prefixes.append(source_dir.name[:3].lower())  # 'mAA' map area
+            self._add_index_source_prefixes(source_prefixes)
+            return
+
         settings = self.operator.settings(self.context)
 
         # MAP PIECES
@@ -190,6 +232,68 @@ class ImageImportManager:
             if tpf_entry_stem not in self._scanned_tpf_sources:
                 self._pending_tpf_sources.setdefault(tpf_entry_stem, tpf_entry)
 
+    def prefetch_flver_textures(
+        self, texture_stems: tp.Iterable[str], max_workers: int = None
+    ) -> dict[str, TPFTexture]:
+        """Find and load as many of `texture_stems` as possible from all registered sources at once, reading and
+        parsing Binders and TPFs in a thread pool.
+
+        Intended to be called once for a whole batch of FLVERs (after all their sources have been registered), so
+        that later `get_flver_texture()` calls are simple lookups. Threads are used rather than processes because
+        the parsed textures would otherwise have to be pickled back, and most of the work is file reading and DCX
+        decompression, which release the GIL.
+
+        Steps:
+            1. Load pending loose map area TPFs and pending TPFs whose stems match (or prefix) a requested stem.
+            2. If any stems are still missing, open pending Binders whose stem or map area prefixes a missing stem and
+               register their TPF entries. Other Binders are left to `get_flver_texture()`.
+            3. Load newly registered TPFs whose stems match (or prefix) a still-missing stem.
+
+        Returns a dictionary mapping (lower-case) texture stems to loaded textures. Texture stems not found are
+        omitted (and can still be searched for with `get_flver_texture()`, which checks `model_name` prefixes).
+        """
+        texture_stems = {stem.lower() for stem in texture_stems}
+
+        with ThreadPoolExecutor(max_workers) as pool:
+            if self._texture_index:
+                index_entries = {}  # type: dict[tuple[Path, str], TextureIndexEntry]
+                for texture_stem in texture_stems - self._tpf_textures.keys():
+                    if index_entry := self._find_unscanned_index_entry(texture_stem, self._index_source_prefixes):
+                        index_entries.setdefault(index_entry.tpf_key, index_entry)
+                self._scanned_index_tpfs.update(index_entries)
+                index_futures = [
+                    pool.submit(self._read_indexed_tpfs, source_path, source_entries)
+                    for source_path, source_entries in _group_by_source_path(index_entries.values()).items()
+                ]
+                for index_future in index_futures:
+                    try:
+                        for tpf in index_future.result():
+                            self._add_tpf_textures(tpf)
+                    except Exception as ex:
+                        _LOGGER.warning(f"Could not load indexed TPF textures: {ex}")
+
+            area_tpf_paths, self._pending_area_tpf_paths = self._pending_area_tpf_paths, []
+            tpf_futures = [pool.submit(TPF.from_path, tpf_path) for tpf_path in area_tpf_paths]
+            tpf_futures += self._submit_matching_tpfs(pool, texture_stems - self._tpf_textures.keys())
+            self._add_tpf_future_textures(tpf_futures)
+
+            if missing_stems := texture_stems - self._tpf_textures.keys():
+                binder_stems = self._get_matching_binder_stems(missing_stems)
+                binder_paths = [self._binder_paths.pop(binder_stem) for binder_stem in binder_stems]
+                self._scanned_binder_paths.update(binder_paths)
+                binder_futures = [pool.submit(Binder.from_path, binder_path) for binder_path in binder_paths]
+                for binder_path, binder_future in zip(binder_paths, binder_futures):
+                    try:
+                        self.scan_binder_textures(binder_future.result())
+                    except Exception as ex:
+                        _LOGGER.warning(f"Could not open texture Binder '{binder_path}': {ex}")
+                self._add_tpf_future_textures(self._submit_matching_tpfs(pool, missing_stems))
+
+        self.operator.debug(
+            f"Prefetched {len(texture_stems & self._tpf_textures.keys())} / {len(texture_stems)} textures."
+        )
+        return {stem: self._tpf_textures[stem] for stem in texture_stems if stem in self._tpf_textures}
+
     def get_flver_texture(self, texture_stem: str, model_name: str = "") -> TPFTexture:
         """Find texture from its stem across all registered/loaded texture file sources.
 
@@ -215,6 +319,23 @@ class ImageImportManager:
                 )
                 raise
 
+        source_prefixes = [model_name, *self._index_source_prefixes] if model_name else self._index_source_prefixes
+        if self._texture_index and (index_entry := self._find_unscanned_index_entry(texture_stem, source_prefixes)):
+            # Found in persistent texture index. Load the TPF containing it directly.
+            self._scanned_index_tpfs.add(index_entry.tpf_key)
+            for tpf in self._read_indexed_tpfs(index_entry.source_path, [index_entry]):
+                self._add_tpf_textures(tpf)
+            if texture_stem in self._tpf_textures:
+                return self._tpf_textures[texture_stem]
+
+        if self._pending_area_tpf_paths:
+            # Load all multi-texture map area TPFs, then try again.
+            area_tpf_paths, self._pending_area_tpf_paths = self._pending_area_tpf_paths, []
+            for tpf_path in area_tpf_paths:
+                self._add_tpf_textures(TPF.from_path(tpf_path))
+            if texture_stem in self._tpf_textures:
+                return self._tpf_textures[texture_stem]
+
         # Search for a multi-DDS TPF whose stem is a prefix of the requested texture.
         for tpf_stem in tuple(self._pending_tpf_sources):  # tpf keys may be popped when textures are loaded
             if texture_stem.startswith(tpf_stem) or (model_name and model_name.startswith(tpf_stem)):
@@ -228,7 +349,7 @@ class ImageImportManager:
 
         if self._binder_paths:
             # Last resort: scan all pending Binders for new TPFs. We typically cannot tell which Binder has the texture.
-            # TODO: I could at least check JUST the BHD headers of TPFBHD split Binders before loading them.
+            # (TPFBHD split Binders are indexed from their BHD headers when registered, so they are not here.)
 
             for binder_stem in tuple(self._binder_paths):  # binder keys may be popped when textures are loaded
                 self._load_binder(binder_stem)
@@ -246,7 +367,8 @@ class ImageImportManager:
             - Some vanilla Map Pieces also use textures from different maps that the game assumes will be loaded when
             the Map Piece appears. This is especially common in DS1, which has a lot of shared textures.
 
-        Returns a set of map area prefixes found in the FLVER textures.
+        Returns a set of map area prefixes found in the FLVER textures. (No sources are registered if a texture index
+        is in use.)
         """
         # Unpacked PTDE has a 'map/tx' folder with every loose TPF. We only search for the given area prefix, though.
         tx_path = map_dir / "tx"
@@ -256,6 +378,10 @@ class ImageImportManager:
             for texture_path in flver.get_all_texture_paths()
             if MAP_AREA_RE.match(texture_path.stem)
         }
+        if self._texture_index:
+            self._add_index_source_prefixes(texture_map_areas)
+            return texture_map_areas
+
         for map_area in texture_map_areas:
             map_area_dir = (map_dir / map_area).resolve()
             self._register_map_area_textures(map_area_dir)
@@ -274,22 +400,31 @@ class ImageImportManager:
 
         for tpf_or_tpfbhd_path in map_area_dir.glob("*.tpf*"):
             if tpf_or_tpfbhd_path.name.endswith(".tpfbhd"):
-                binder_stem = lower_stem(tpf_or_tpfbhd_path)
-                if tpf_or_tpfbhd_path not in self._scanned_binder_paths:
-                    self._binder_paths.setdefault(binder_stem, tpf_or_tpfbhd_path)
+                if tpf_or_tpfbhd_path in self._scanned_binder_paths:
+                    continue
+                tpfbdt_path = tpf_or_tpfbhd_path.with_name(tpf_or_tpfbhd_path.name.removesuffix(".tpfbhd") + ".tpfbdt")
+                if tpfbdt_path.is_file():
+                    try:
+                        # Only the BHD header is read now. TPF data is read from the BDT when needed.
+                        self._register_bxf_tpfs(tpf_or_tpfbhd_path.read_bytes(), tpfbdt_path)
+                    except ValueError as ex:
+                        _LOGGER.warning(f"Could not index TPFBHD header '{tpf_or_tpfbhd_path}': {ex}")
+                    else:
+                        self._scanned_binder_paths.add(tpf_or_tpfbhd_path)
+                        continue
+                # Fall back to loading entire Binder if needed.
+                self._binder_paths.setdefault(lower_stem(tpf_or_tpfbhd_path), tpf_or_tpfbhd_path)
             elif tpf_m := TPF_RE.match(tpf_or_tpfbhd_path.name):
                 if tpf_m.groupdict()["dcx"] and check_dcx_mode == CheckDCXMode.NO_DCX:
                     continue
                 elif not tpf_m.groupdict()["dcx"] and check_dcx_mode == CheckDCXMode.DCX_ONLY:
                     continue
 
-                # Loose map multi-texture TPF (usually 'mXX_9999.tpf'). We unpack all textures in it immediately.
+                # Loose map multi-texture TPF (usually 'mXX_9999.tpf'). We unpack all textures in it before checking
+                # any Binders, either on demand or in `prefetch_flver_textures()`.
                 tpf_stem = lower_stem(tpf_or_tpfbhd_path)
                 if tpf_stem not in self._scanned_tpf_sources:
-                    tpf = TPF.from_path(tpf_or_tpfbhd_path)
-                    for texture in tpf.textures:
-                        # TODO: Handle duplicate textures/overwrites. Currently ignoring duplicates.
-                        self._tpf_textures.setdefault(texture.stem.lower(), texture)
+                    self._pending_area_tpf_paths.append(tpf_or_tpfbhd_path)
                     self._scanned_tpf_sources.add(tpf_stem)
 
     def _register_map_tpfs(self, map_area_block_dir: Path, check_dcx_mode=CheckDCXMode.BOTH):
@@ -353,12 +488,22 @@ class ImageImportManager:
             _LOGGER.warning(f"Could not find expected CHRTPFBDT file for '{chrbnd.path}' at {tpfbdt_path}.")
             return
 
-        tpfbxf = Binder.from_bytes(tpfbhd_entry.data, bdt_data=tpfbdt_path.read_bytes())
-        for tpf_entry in tpfbxf.find_entries_matching_name(TPF_RE):
-            # These are very likely to be used by the FLVER, but we still queue them up rather than open them now.
-            tpf_stem = lower_stem(tpf_entry)
-            if tpf_stem not in self._scanned_tpf_sources:
-                self._pending_tpf_sources.setdefault(tpf_stem, tpf_entry)
+        # These are very likely to be used by the FLVER, but we still queue them up rather than open them now. Only the
+        # BHD header is read; TPF data is read from the BDT when needed.
+        try:
+            self._register_bxf_tpfs(tpfbhd_entry.data, tpfbdt_path)
+        except ValueError as ex:
+            _LOGGER.warning(f"Could not index CHRTPFBHD header for '{chrbnd.path}'. Loading entire CHRTPFBDT. ({ex})")
+            tpfbxf = Binder.from_bytes(tpfbhd_entry.data, bdt_data=tpfbdt_path.read_bytes())
+            self.scan_binder_textures(tpfbxf)
+
+    def _register_bxf_tpfs(self, bhd_data: bytes, bdt_path: Path):
+        """Register locations of all TPFs in a split Binder's BDT as pending sources, from its BHD header alone."""
+        for entry_location in read_bhd_entry_locations(bhd_data, bdt_path):
+            if TPF_RE.match(entry_location.name):
+                tpf_stem = lower_stem(entry_location)
+                if tpf_stem not in self._scanned_tpf_sources:
+                    self._pending_tpf_sources.setdefault(tpf_stem, entry_location)
 
     def _register_chr_texbnd(
         self,
@@ -414,24 +559,89 @@ class ImageImportManager:
 
     # region Loading Methods
 
+    def _get_matching_binder_stems(self, texture_stems: set[str]) -> list[str]:
+        """Get stems of pending Binders that may contain any of `texture_stems`, as the Binder stem (e.g. 'm10_0000')
+        or its map area (e.g. 'm10') is a prefix of a texture stem."""
+        texture_map_areas = {texture_stem[:3] for texture_stem in texture_stems if MAP_AREA_RE.match(texture_stem)}
+        return [
+            binder_stem for binder_stem, binder_path in self._binder_paths.items()
+            if binder_path.parent.name.lower() in texture_map_areas
+            or (MAP_AREA_RE.match(binder_stem) and binder_stem[:3] in texture_map_areas)
+            or any(texture_stem.startswith(binder_stem) for texture_stem in texture_stems)
+        ]
+
     def _load_binder(self, binder_stem):
         binder_path = self._binder_paths.pop(binder_stem)
         self._scanned_binder_paths.add(binder_path)
-        binder = Binder.from_path(binder_path)
-        for tpf_entry in binder.find_entries_matching_name(TPF_RE):
-            tpf_entry_stem = lower_stem(tpf_entry)
-            if tpf_entry_stem not in self._scanned_tpf_sources:
-                self._pending_tpf_sources.setdefault(tpf_entry_stem, tpf_entry)
+        self.scan_binder_textures(Binder.from_path(binder_path))
 
     def _load_tpf(self, tpf_stem):
         tpf_path_or_entry = self._pending_tpf_sources.pop(tpf_stem)
         self._scanned_tpf_sources.add(tpf_stem)
-        if isinstance(tpf_path_or_entry, BinderEntry):
-            tpf = TPF.from_binder_entry(tpf_path_or_entry)
-        else:
-            tpf = TPF.from_path(tpf_path_or_entry)
+        self._add_tpf_textures(self._read_tpf(tpf_path_or_entry))
+
+    @staticmethod
+    def _read_tpf(tpf_source: Path | BinderEntry | BXFEntryLocation) -> TPF:
+        if isinstance(tpf_source, BinderEntry):
+            return TPF.from_binder_entry(tpf_source)
+        if isinstance(tpf_source, BXFEntryLocation):
+            return TPF.from_bytes(tpf_source.read())
+        return TPF.from_path(tpf_source)
+
+    def _add_tpf_textures(self, tpf: TPF):
         for texture in tpf.textures:
             # TODO: Handle duplicate textures/overwrites. Currently ignoring duplicates.
             self._tpf_textures.setdefault(texture.stem.lower(), texture)
 
+    def _submit_matching_tpfs(self, pool: ThreadPoolExecutor, texture_stems: set[str]) -> list:
+        """Pop all pending TPF sources whose stem is one of (or a prefix of one of) `texture_stems` and submit them to
+        be read by `pool`. Returns futures."""
+        tpf_stems = [
+            tpf_stem for tpf_stem in self._pending_tpf_sources
+            if any(texture_stem.startswith(tpf_stem) for texture_stem in texture_stems)
+        ]
+        futures = []
+        for tpf_stem in tpf_stems:
+            self._scanned_tpf_sources.add(tpf_stem)
+            futures.append(pool.submit(self._read_tpf, self._pending_tpf_sources.pop(tpf_stem)))
+        return futures
+
+    def _add_index_source_prefixes(self, source_prefixes: tp.Iterable[str]):
+        for source_prefix in source_prefixes:
+            if source_prefix not in self._index_source_prefixes:
+                self._index_source_prefixes.append(source_prefix)
+
+    def _find_unscanned_index_entry(
+        self, texture_stem: str, source_prefixes: tp.Sequence[str] = ()
+    ) -> TextureIndexEntry | None:
+        index_entry = self._texture_index.find(texture_stem, source_prefixes)
+        if index_entry is None or index_entry.tpf_key in self._scanned_index_tpfs:
+            return None
+        return index_entry
+
+    @staticmethod
+    def _read_indexed_tpfs(source_path: Path, index_entries: tp.Sequence[TextureIndexEntry]) -> list[TPF]:
+        """Read TPFs of `index_entries`, which all have the same `source_path`. A Binder source is only opened once."""
+        if not index_entries[0].entry_name:
+            return [TPF.from_path(source_path)]  # loose TPF
+        if index_entries[0].get_bxf_entry_location():
+            return [TPF.from_bytes(index_entry.get_bxf_entry_location().read()) for index_entry in index_entries]
+        binder_entries = {entry.name: entry for entry in Binder.from_path(source_path).entries}
+        return [TPF.from_binder_entry(binder_entries[index_entry.entry_name]) for index_entry in index_entries]
+
+    def _add_tpf_future_textures(self, tpf_futures: list):
+        """Add textures from TPF futures in submission order, so duplicate handling matches serial loading."""
+        for tpf_future in tpf_futures:
+            try:
+                self._add_tpf_textures(tpf_future.result())
+            except Exception as ex:
+                _LOGGER.warning(f"Could not load TPF textures: {ex}")
+
     # endregion
+
+
+def _group_by_source_path(index_entries: tp.Iterable[TextureIndexEntry]) -> dict[Path, list[TextureIndexEntry]]:
+    grouped = {}
+    for index_entry in index_entries:
+        grouped.setdefault(index_entry.source_path, []).append(index_entry)
+    return grouped
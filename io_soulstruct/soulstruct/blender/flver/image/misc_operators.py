@@ -3,12 +3,15 @@ from __future__ import annotations
 
 __all__ = [
     "FindMissingTexturesInImageCache",
+    "UpdateTextureIndex",
 ]
 
 import bpy
 
 from soulstruct.blender.utilities import LoggingOperator, ObjectType, is_path_and_file
 
+from .texture_index import TextureIndex
+
 
 class FindMissingTexturesInImageCache(LoggingOperator):
     """Iterate over all texture nodes used by all materials of one or more selected objects (typically FLVER meshes) and
@@ -69,3 +72,24 @@ class FindMissingTexturesInImageCache(LoggingOperator):
                         self.warning(f"Could not find texture file '{cached_image_path.name}' in image cache.")
 
         return {"FINISHED"}
+
+
+class UpdateTextureIndex(LoggingOperator):
+    """Re-index TPFs in the project and game directories that have been added or changed since the Texture Index was
+    last updated. (The index is otherwise only updated at the first FLVER import of each Blender session.)"""
+    bl_idname = "mesh.update_texture_index"
+    bl_label = "Update Texture Index"
+    bl_description = "Re-index new or modified TPF textures in the project and game directories"
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        if not context.scene.flver_import_settings.use_texture_index:
+            return False
+        return bool(context.scene.flver_material_settings.get_game_image_cache_directory(context))
+
+    def execute(self, context):
+        texture_index = TextureIndex.from_context(self, context, force_update=True)
+        if not texture_index:
+            return self.error("Could not open Texture Index.")
+        self.info(f"Updated Texture Index '{texture_index.index_path}'.")
+        return {"FINISHED"}
@@ -0,0 +1,313 @@
+"""Persistent SQLite index of every TPF texture stem in the project/game directories, kept in the image cache directory.
+
+Covers loose TPFs (including `parts/Common*.tpf` and map area TPFs), TPFs inside CHRBNDs and TEXBNDs, and TPFs inside
+TPFBHD/CHRTPFBHD split Binders. Each texture row records the location of its TPF and the texture's DDS format.
+
+Source files are only re-read when their modified time or size has changed since the last update. The index is only
+updated the first time it is opened in a Blender session (or on request with the 'Update Texture Index' operator), and
+its connection is shared by all importers for the rest of the session.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "TextureIndex",
+    "TextureIndexEntry",
+]
+
+import logging
+import os
+import sqlite3
+import time
+import typing as tp
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from soulstruct.containers import Binder, BinderEntry
+from soulstruct.containers.tpf import TPF
+
+from .bxf_index import BXFEntryLocation, read_bhd_entry_locations
+
+if tp.TYPE_CHECKING:
+    import bpy
+    from soulstruct.blender.utilities import LoggingOperator
+
+_LOGGER = logging.getLogger("soulstruct.io")
+
+_TPF_SUFFIXES = (".tpf", ".tpf.dcx")
+_BINDER_SUFFIXES = (".chrbnd", ".chrbnd.dcx", ".texbnd", ".texbnd.dcx")
+_TPFBHD_SUFFIX = ".tpfbhd"
+
+# Indices opened (and updated) this session, keyed by `(index_path, root_paths)`.
+_SESSION_INDICES = {}  # type: dict[tuple[Path, tuple[Path, ...]], TextureIndex]
+
+
+@dataclass(slots=True, frozen=True)
+class TextureIndexEntry:
+    """Location of the TPF containing an indexed texture."""
+    texture_stem: str  # original case
+    source_path: Path  # loose TPF, Binder, or BDT (for split Binder TPFs)
+    entry_name: str  # TPF entry name in Binder/BDT (empty for loose TPFs)
+    offset: int  # TPF data offset in BDT (-1 if not in a BDT)
+    size: int  # TPF data size in BDT (-1 if not in a BDT)
+    dds_format: str  # DDS FourCC or 'DX10:{DXGI format}' (empty if uncompressed or unknown)
+
+    @property
+    def tpf_key(self) -> tuple[Path, str]:
+        return self.source_path, self.entry_name
+
+    def get_bxf_entry_location(self) -> BXFEntryLocation | None:
+        if self.offset < 0:
+            return None
+        return BXFEntryLocation(self.entry_name, self.source_path, self.offset, self.size)
+
+
+class TextureIndex:
+    """Lookup of TPF locations by (case-insensitive) texture stem, backed by a SQLite database."""
+
+    # Bump this if the schema or indexed source types change, which triggers a full rebuild.
+    SCHEMA_VERSION: tp.ClassVar[int] = 1
+    FILE_NAME: tp.ClassVar[str] = "texture_index.sqlite"
+
+    index_path: Path
+    root_paths: tuple[Path, ...]  # in order of lookup preference
+    _connection: sqlite3.Connection
+
+    def __init__(self, index_path: Path, root_paths: tp.Sequence[Path]):
+        self.index_path = index_path
+        self.root_paths = tuple(root_paths)
+        self._connection = sqlite3.connect(index_path)
+        if self._connection.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            self._connection.executescript(
+                f"""
+                DROP TABLE IF EXISTS sources;
+                DROP TABLE IF EXISTS textures;
+                CREATE TABLE sources (path TEXT PRIMARY KEY, stat_key TEXT NOT NULL);
+                CREATE TABLE textures (
+                    stem TEXT NOT NULL,
+                    lower_stem TEXT NOT NULL,
+                    source_key TEXT NOT NULL,
+                    tpf_path TEXT NOT NULL,
+                    entry_name TEXT NOT NULL,
+                    data_offset INTEGER NOT NULL,
+                    data_size INTEGER NOT NULL,
+                    dds_format TEXT NOT NULL
+                );
+                CREATE INDEX textures_lower_stem ON textures (lower_stem);
+                CREATE INDEX textures_source_key ON textures (source_key);
+                PRAGMA user_version = {self.SCHEMA_VERSION};
+                """
+            )
+
+    @classmethod
+    def from_context(
+        cls, operator: LoggingOperator, context: bpy.types.Context, force_update=False
+    ) -> TextureIndex | None:
+        """Get index from FLVER import settings, or return `None` if the index is disabled or there is no image cache
+        directory.
+
+        The index is opened and updated once per session for each image cache directory and root paths, and that same
+        instance (and SQLite connection) is returned to all later callers. Use `force_update` to update it again (e.g.
+        after files have changed on disk).
+        """
+        if not context.scene.flver_import_settings.use_texture_index:
+            return None
+        image_cache_directory = context.scene.flver_material_settings.get_game_image_cache_directory(context)
+        if not image_cache_directory:
+            operator.warning("Texture Index is enabled, but no image cache directory is set. Not using index.")
+            return None
+
+        settings = operator.settings(context)
+        root_paths = tuple(
+            root_path for root_path in (
+                (settings.project_root_path, settings.game_root_path) if settings.prefer_import_from_project
+                else (settings.game_root_path, settings.project_root_path)
+            )
+            if root_path and root_path.is_dir()
+        )
+        if not root_paths:
+            return None
+
+        index_path = image_cache_directory / cls.FILE_NAME
+        texture_index = _SESSION_INDICES.get((index_path, root_paths))
+        if texture_index is None:
+            try:
+                image_cache_directory.mkdir(parents=True, exist_ok=True)
+                texture_index = cls(index_path, root_paths)
+            except (OSError, sqlite3.Error) as ex:
+                operator.warning(f"Could not open Texture Index in '{image_cache_directory}'. Not using index. ({ex})")
+                return None
+            _SESSION_INDICES[index_path, root_paths] = texture_index
+            force_update = True
+        if force_update:
+            texture_index.update(operator)
+        return texture_index
+
+    @staticmethod
+    def close_all():
+        """Close all indices opened this session."""
+        for texture_index in _SESSION_INDICES.values():
+            texture_index.close()
+        _SESSION_INDICES.clear()
+
+    def close(self):
+        self._connection.close()
+
+    def find(self, texture_stem: str, source_prefixes: tp.Sequence[str] = ()) -> TextureIndexEntry | None:
+        """Find the preferred TPF location of `texture_stem` (case-insensitive), or `None` if it is not indexed.
+
+        If multiple sources contain the texture, sources whose file name or directory name starts with one of the
+        (lower-case) `source_prefixes` (e.g. model stems like 'c1234' or map areas like 'm10') are preferred, in the
+        order given. Remaining ties are broken by root directory preference, then by index order.
+        """
+        rows = self._connection.execute(
+            "SELECT source_key, stem, tpf_path, entry_name, data_offset, data_size, dds_format FROM textures "
+            "WHERE lower_stem = ? ORDER BY rowid",
+            (texture_stem.lower(),),
+        ).fetchall()
+        if not rows:
+            return None
+        _, stem, tpf_path, entry_name, offset, size, dds_format = min(
+            rows, key=lambda r: (_get_prefix_index(r[0], source_prefixes), self._get_root_index(r[0]))
+        )
+        return TextureIndexEntry(stem, Path(tpf_path), entry_name, offset, size, dds_format)
+
+    def _get_root_index(self, source_key: str) -> int:
+        source_path = Path(source_key)
+        for root_index, root_path in enumerate(self.root_paths):
+            if source_path.is_relative_to(root_path):
+                return root_index
+        return len(self.root_paths)
+
+    def update(self, operator: LoggingOperator = None, max_workers: int = None):
+        """Re-index all source files that have been added or changed (by modified time or size) since the last update
+        and drop sources that no longer exist. TPFs are read in a thread pool."""
+        p = time.perf_counter()
+
+        current_sources = {}  # type: dict[str, tuple[Path, str]]
+        for root_path in self.root_paths:
+            for source_path in _iter_source_paths(root_path):
+                source_key = str(source_path)
+                try:
+                    stat_key = _get_stat_key(source_path)
+                except OSError:
+                    continue
+                current_sources.setdefault(source_key, (source_path, stat_key))
+
+        indexed_sources = dict(self._connection.execute("SELECT path, stat_key FROM sources"))
+        changed_keys = [
+            source_key for source_key, (_, stat_key) in current_sources.items()
+            if indexed_sources.get(source_key) != stat_key
+        ]
+        removed_keys = [source_key for source_key in indexed_sources if source_key not in current_sources]
+
+        with ThreadPoolExecutor(max_workers) as pool:
+            futures = [pool.submit(_read_source_textures, current_sources[key][0]) for key in changed_keys]
+            with self._connection:
+                for source_key in removed_keys + changed_keys:
+                    self._connection.execute("DELETE FROM textures WHERE source_key = ?", (source_key,))
+                    self._connection.execute("DELETE FROM sources WHERE path = ?", (source_key,))
+                for source_key, future in zip(changed_keys, futures):
+                    source_path, stat_key = current_sources[source_key]
+                    try:
+                        rows = future.result()
+                    except Exception as ex:
+                        _LOGGER.warning(f"Could not index textures in '{source_path}': {ex}")
+                        continue  # not recorded, so will be tried again next update
+                    self._connection.executemany(
+                        "INSERT INTO textures VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        [(stem, stem.lower(), source_key, *row) for stem, *row in rows],
+                    )
+                    self._connection.execute("INSERT INTO sources VALUES (?, ?)", (source_key, stat_key))
+
+        if operator:
+            operator.debug(
+                f"Updated Texture Index '{self.index_path}' ({len(changed_keys)} sources re-indexed, "
+                f"{len(removed_keys)} removed) in {time.perf_counter() - p:.2f} s."
+            )
+
+
+def _get_prefix_index(source_key: str, source_prefixes: tp.Sequence[str]) -> int:
+    """Get index of first prefix of the source's file or directory name in `source_prefixes`."""
+    source_path = Path(source_key)
+    names = (source_path.name.lower(), source_path.parent.name.lower())
+    for prefix_index, prefix in enumerate(source_prefixes):
+        if names[0].startswith(prefix) or names[1].startswith(prefix):
+            return prefix_index
+    return len(source_prefixes)
+
+
+def _iter_source_paths(root_path: Path) -> tp.Iterator[Path]:
+    """Yield all loose TPF, CHRBND, TEXBND, and TPFBHD paths under `root_path`."""
+    for dir_path, _, file_names in os.walk(root_path):
+        for file_name in file_names:
+            lower_name = file_name.lower()
+            if lower_name.endswith(_TPF_SUFFIXES + _BINDER_SUFFIXES) or lower_name.endswith(_TPFBHD_SUFFIX):
+                yield Path(dir_path, file_name)
+
+
+def _get_stat_key(source_path: Path) -> str:
+    """Combine `(mtime_ns, size)` of source file and (if a TPFBHD or CHRBND) its BDT."""
+    stat_paths = [source_path, *_get_bdt_paths(source_path)]
+    return ";".join(
+        f"{stat.st_mtime_ns}:{stat.st_size}" for stat in (path.stat() for path in stat_paths if path.is_file())
+    )
+
+
+def _get_bdt_paths(source_path: Path) -> list[Path]:
+    lower_name = source_path.name.lower()
+    stem = source_path.name.split(".")[0]
+    if lower_name.endswith(_TPFBHD_SUFFIX):
+        return [source_path.with_name(f"{stem}.tpfbdt")]
+    if ".chrbnd" in lower_name:
+        return [source_path.with_name(f"{stem}.chrtpfbdt")]
+    return []
+
+
+def _get_dds_format(dds_data: bytes) -> str:
+    if dds_data[:4] != b"DDS ":
+        return ""
+    four_cc = dds_data[84:88]
+    if four_cc == b"DX10":
+        return f"DX10:{int.from_bytes(dds_data[128:132], 'little')}"
+    return four_cc.rstrip(b"\0").decode("ascii", errors="replace")
+
+
+def _get_tpf_rows(tpf: TPF, tpf_path: Path, entry_name="", offset=-1, size=-1) -> list[tuple]:
+    return [
+        (texture.stem, str(tpf_path), entry_name, offset, size, _get_dds_format(texture.data))
+        for texture in tpf.textures
+    ]
+
+
+def _read_source_textures(source_path: Path) -> list[tuple]:
+    """Read all textures in TPFs in a single source file. Returns rows of
+    `(stem, tpf_path, entry_name, offset, size, dds_format)`."""
+    lower_name = source_path.name.lower()
+
+    if lower_name.endswith(_TPF_SUFFIXES):
+        return _get_tpf_rows(TPF.from_path(source_path), source_path)
+
+    if lower_name.endswith(_TPFBHD_SUFFIX):
+        return _read_bxf_textures(source_path.read_bytes(), _get_bdt_paths(source_path)[0])
+
+    rows = []
+    binder = Binder.from_path(source_path)
+    for entry in binder.entries:  # type: BinderEntry
+        entry_name = entry.name.lower()
+        if entry_name.endswith(_TPF_SUFFIXES):
+            rows += _get_tpf_rows(TPF.from_binder_entry(entry), source_path, entry.name)
+        elif entry_name.endswith(".chrtpfbhd"):
+            bdt_path = _get_bdt_paths(source_path)[0]
+            if bdt_path.is_file():
+                rows += _read_bxf_textures(entry.data, bdt_path)
+    return rows
+
+
+def _read_bxf_textures(bhd_data: bytes, bdt_path: Path) -> list[tuple]:
+    rows = []
+    for location in read_bhd_entry_locations(bhd_data, bdt_path):
+        if location.name.lower().endswith(_TPF_SUFFIXES):
+            tpf = TPF.from_bytes(location.read())
+            rows += _get_tpf_rows(tpf, bdt_path, location.name, location.offset, location.size)
+    return rows
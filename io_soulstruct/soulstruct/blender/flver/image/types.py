@@ -123,22 +123,18 @@ class DDSTexture:
         replace_existing=False,
         pack_image_data=False,
     ) -> DDSTexture:
-        """Import PNG data into Blender as an Image, optionally replacing an existing image with the same name.
+        """Import PNG/TGA data into Blender as an Image, optionally replacing an existing image with the same name.
 
-        If `pack_image_data` is True and `image_cache_directory` is given, the PNG data will be embedded in the `.blend`
-        file. Otherwise, it will be linked to the original PNG file.
+        If `image_cache_directory` is given, the data is written there and the Image is linked to that file (and packed
+        into the `.blend` file if `pack_image_data` is True). Otherwise, the data is packed into the `.blend` file
+        directly from memory, without touching the disk.
         """
         image_name = f"{name}{image_format.get_suffix()}"
-        if image_cache_directory is None:
-            # Use a temporarily file.
-            write_image_path = Path(f"~/AppData/Local/Temp/{image_name}").expanduser()
-            is_temp_image = True
-            # NOTE: We must pack Image data, but we don't warn about the incompatible setting here.
-        else:
+        if image_cache_directory is not None:
             write_image_path = image_cache_directory / image_name
-            is_temp_image = False
-
-        write_image_path.write_bytes(image_data)
+            write_image_path.write_bytes(image_data)
+        else:
+            write_image_path = None
 
         try:
             if not replace_existing:
@@ -146,27 +142,42 @@ class DDSTexture:
                 raise KeyError
             image = bpy.data.images[name]
         except KeyError:
-            image = bpy.data.images.load(str(write_image_path))
-            if is_temp_image or pack_image_data:
-                image.pack()  # embed PNG in Blend file
+            if write_image_path:
+                image = bpy.data.images.load(str(write_image_path))
+                if pack_image_data:
+                    image.pack()  # embed PNG in Blend file
+            else:
+                image = bpy.data.images.new(image_name, 1, 1)  # real size is read from packed data
+                cls._pack_image_data(image, image_name, image_format, image_data)
         else:
-            if image.packed_file:
-                image.unpack(method="USE_ORIGINAL")
-            image.filepath_raw = str(write_image_path)
-            image.file_format = image_format
-            image.source = "FILE"
-            image.reload()
-            if is_temp_image or pack_image_data:
-                image.pack()  # embed new PNG in Blend file
-
-        if is_temp_image:
-            write_image_path.unlink(missing_ok=True)
+            if not write_image_path:
+                cls._pack_image_data(image, image_name, image_format, image_data)
+            else:
+                if image.packed_file:
+                    image.unpack(method="USE_ORIGINAL")
+                image.filepath_raw = str(write_image_path)
+                image.file_format = image_format
+                image.source = "FILE"
+                image.reload()
+                if pack_image_data:
+                    image.pack()  # embed new PNG in Blend file
 
         bl_image = cls(image)
         bl_image.dds_format = BlenderDDSFormat.SAME
 
         return bl_image
 
+    @staticmethod
+    def _pack_image_data(
+        image: bpy.types.Image, image_name: str, image_format: BlenderImageFormat, image_data: bytes
+    ):
+        """Use encoded `image_data` as the packed source file of `image`, replacing any existing packed data."""
+        image.pack(data=image_data, data_len=len(image_data))
+        image.filepath_raw = f"//{image_name}"  # only used if image is later unpacked
+        image.file_format = image_format
+        image.source = "FILE"
+        image.reload()
+
     def get_dds_format_str(self, find_same_format: tp.Callable[[str], str]) -> str:
         if self.dds_format == BlenderDDSFormat.NONE:
             raise TextureExportError(f"Blender image '{self.name}' has DDS format set to 'NONE'. Cannot get format.")
@@ -13,7 +13,7 @@ import bpy
 from soulstruct.blender.bpy_base.panel import SoulstructPanel
 from soulstruct.blender.types import ObjectType, SoulstructType
 from soulstruct.blender.flver.image.import_operators import ImportTextures
-from soulstruct.blender.flver.image.misc_operators import FindMissingTexturesInImageCache
+from soulstruct.blender.flver.image.misc_operators import FindMissingTexturesInImageCache, UpdateTextureIndex
 
 from .operators import *
 
@@ -147,4 +147,5 @@ class FLVERMaterialToolsPanel(SoulstructPanel):
             panel.label(text="Textures:")
             panel.operator(ImportTextures.bl_idname)
             panel.operator(FindMissingTexturesInImageCache.bl_idname)
+            panel.operator(UpdateTextureIndex.bl_idname)
             # panel.operator(ExportTexturesIntoBinder.bl_idname)  # TODO: not yet functional
@@ -0,0 +1,191 @@
+"""Optional on-disk cache of `MergedMesh` arrays, so repeated imports of the same FLVER can skip mesh merging.
+
+Entries are uncompressed NumPy `.npz` archives named after a hash of the FLVER file content and all settings that affect
+the merge (Blender material indices, material UV layer names, and vertex merging). The cache directory is bounded in
+size by evicting the least recently used entries, using file modification time as the access time.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "MergedMeshCache",
+]
+
+import hashlib
+import os
+import typing as tp
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+from soulstruct.flver import MergedMesh
+
+if tp.TYPE_CHECKING:
+    from soulstruct.blender.utilities import LoggingOperator
+
+
+@dataclass(slots=True)
+class MergedMeshCache:
+    """Reads and writes cached `MergedMesh` arrays in `cache_directory`."""
+
+    # Bump this if the stored arrays or key contents change, which invalidates all existing entries.
+    CACHE_VERSION: tp.ClassVar[int] = 1
+
+    cache_directory: Path
+    max_size_bytes: int
+
+    @classmethod
+    def from_context(cls, operator: LoggingOperator, context: bpy.types.Context) -> MergedMeshCache | None:
+        """Get cache from FLVER import settings, or `None` if the cache is disabled or has no directory."""
+        import_settings = context.scene.flver_import_settings
+        if not import_settings.use_merged_mesh_cache:
+            return None
+        if not import_settings.str_merged_mesh_cache_directory:
+            operator.warning("Merged Mesh Cache is enabled, but no cache directory is set. Not using cache.")
+            return None
+        cache_directory = Path(import_settings.str_merged_mesh_cache_directory)
+        try:
+            cache_directory.mkdir(parents=True, exist_ok=True)
+        except OSError as ex:
+            operator.warning(f"Cannot create Merged Mesh Cache directory '{cache_directory}'. Not using cache. ({ex})")
+            return None
+        return cls(cache_directory, import_settings.merged_mesh_cache_max_mb * 1024 * 1024)
+
+    @classmethod
+    def get_key(
+        cls,
+        flver_data: bytes,
+        mesh_bl_material_indices: tp.Sequence[int],
+        material_uv_layer_names: tp.Sequence[tp.Sequence[str]],
+        merge_vertices: bool,
+    ) -> str:
+        """Hash (uncompressed or DCX) FLVER file content and all `MergedMesh` creation arguments into a cache key."""
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(flver_data)
+        settings = (
+            cls.CACHE_VERSION,
+            tuple(mesh_bl_material_indices),
+            tuple(tuple(names) for names in material_uv_layer_names),
+            merge_vertices,
+        )
+        hasher.update(repr(settings).encode())
+        return hasher.hexdigest()
+
+    def get_entry_path(self, key: str) -> Path:
+        return self.cache_directory / f"{key}.npz"
+
+    def load(self, key: str) -> MergedMesh | None:
+        """Load cached `MergedMesh` for `key`, or return `None` if not cached (or unreadable)."""
+        entry_path = self.get_entry_path(key)
+        if not entry_path.is_file():
+            return None
+        try:
+            with np.load(entry_path, allow_pickle=False) as archive:
+                arrays = {name: archive[name] for name in archive.files}
+            merged_mesh = self._arrays_to_merged_mesh(arrays)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # Corrupt, truncated, or outdated entry. Remove it so it is rewritten.
+            try:
+                entry_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return None
+
+        # Mark entry as recently used.
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        return merged_mesh
+
+    @staticmethod
+    def _arrays_to_merged_mesh(arrays: dict[str, np.ndarray]) -> MergedMesh:
+        loop_tangents = [arrays.pop(f"loop_tangents_{i}") for i in range(int(arrays.pop("loop_tangents_count")))]
+        loop_vertex_colors = [
+            arrays.pop(f"loop_vertex_colors_{i}") for i in range(int(arrays.pop("loop_vertex_colors_count")))
+        ]
+        loop_uvs = {  # archive preserves original layer order
+            name.removeprefix("loop_uvs__"): arrays.pop(name)
+            for name in tuple(arrays) if name.startswith("loop_uvs__")
+        }
+        return MergedMesh(
+            vertex_data=arrays["vertex_data"],
+            loop_vertex_indices=arrays["loop_vertex_indices"],
+            vertices_merged=bool(arrays["vertices_merged"]),
+            loop_normals=arrays["loop_normals"],
+            loop_normals_w=arrays.get("loop_normals_w", None),
+            loop_tangents=loop_tangents,
+            loop_bitangents=arrays.get("loop_bitangents", None),
+            loop_vertex_colors=loop_vertex_colors,
+            loop_uvs=loop_uvs,
+            faces=arrays["faces"],
+        )
+
+    def save(self, key: str, merged_mesh: MergedMesh, evict=True):
+        """Write `merged_mesh` arrays to cache under `key`.
+
+        Must be called BEFORE the `MergedMesh` is modified in-place for Blender (e.g. with `swap_vertex_yz()`).
+
+        If `evict` is False, caller should call `evict()` itself after saving a batch of entries.
+        """
+        arrays = {
+            "vertex_data": merged_mesh.vertex_data,
+            "loop_vertex_indices": merged_mesh.loop_vertex_indices,
+            "vertices_merged": np.array(merged_mesh.vertices_merged),
+            "loop_normals": merged_mesh.loop_normals,
+            "faces": merged_mesh.faces,
+            "loop_tangents_count": np.array(len(merged_mesh.loop_tangents)),
+            "loop_vertex_colors_count": np.array(len(merged_mesh.loop_vertex_colors)),
+        }
+        if merged_mesh.loop_normals_w is not None:
+            arrays["loop_normals_w"] = merged_mesh.loop_normals_w
+        if merged_mesh.loop_bitangents is not None:
+            arrays["loop_bitangents"] = merged_mesh.loop_bitangents
+        for i, loop_tangents in enumerate(merged_mesh.loop_tangents):
+            arrays[f"loop_tangents_{i}"] = loop_tangents
+        for i, loop_vertex_colors in enumerate(merged_mesh.loop_vertex_colors):
+            arrays[f"loop_vertex_colors_{i}"] = loop_vertex_colors
+        for uv_layer_name, loop_uvs in merged_mesh.loop_uvs.items():
+            arrays[f"loop_uvs__{uv_layer_name}"] = loop_uvs
+
+        # Write to a temporary file first, so a partially written entry can never be loaded.
+        entry_path = self.get_entry_path(key)
+        temp_path = entry_path.with_suffix(".tmp")
+        try:
+            with temp_path.open("wb") as f:
+                np.savez(f, **arrays)
+            os.replace(temp_path, entry_path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            return
+
+        if evict:
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until total cache size is within `max_size_bytes`."""
+        entries = []
+        total_size = 0
+        for entry_path in self.cache_directory.glob("*.npz"):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+            total_size += stat.st_size
+
+        if total_size <= self.max_size_bytes:
+            return
+
+        entries.sort()  # oldest first
+        for _, size, entry_path in entries:
+            try:
+                entry_path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+            if total_size <= self.max_size_bytes:
+                break
@@ -306,6 +306,15 @@ class FLVERImportSettings(SoulstructPropertyGroup):
         default=True,
     )
 
+    use_texture_index: bpy.props.BoolProperty(
+        name="Use Texture Index",
+        description="Find textures with a persistent index of every TPF texture in the project and game directories, "
+                    "stored in the image cache directory, instead of searching expected locations. The index is "
+                    "updated for new or modified files at the first import of each session, or with 'Update Texture "
+                    "Index' (first build reads every TPF)",
+        default=False,
+    )
+
     omit_default_bone: bpy.props.BoolProperty(
         name="Omit Default Bone",
         description="If imported FLVER has a single default bone (e.g. standard Map Pieces), do not create an "
@@ -331,6 +340,27 @@ class FLVERImportSettings(SoulstructPropertyGroup):
         default="HASHED",
     )
 
+    use_merged_mesh_cache: bpy.props.BoolProperty(
+        name="Use Merged Mesh Cache",
+        description="Store merged FLVER mesh data on disk, keyed by FLVER file content and merge settings, so that "
+                    "repeated imports of the same FLVER skip mesh merging. Requires a cache directory",
+        default=False,
+    )
+
+    str_merged_mesh_cache_directory: bpy.props.StringProperty(
+        name="Merged Mesh Cache Directory",
+        description="Directory to read/write cached merged FLVER mesh data (if enabled)",
+        default="",
+        subtype="DIR_PATH",
+    )
+
+    merged_mesh_cache_max_mb: bpy.props.IntProperty(
+        name="Merged Mesh Cache Size (MB)",
+        description="Maximum total size of merged mesh cache directory. Least recently used entries are deleted first",
+        default=2048,
+        min=1,
+    )
+
 
 class FLVERExportSettings(SoulstructPropertyGroup):
     """Common FLVER export settings. Drawn manually in operator browser windows."""
@@ -251,8 +251,8 @@ def _create_flver_meshes(
     using_default_bone: bool,
 ):
     """
-    Construct a `MergedMesh` from Blender data, in a straightforward way (unfortunately using `for` loops over
-    vertices, faces, and loops), then split it into `FLVERMesh` instances based on Blender materials.
+    Construct a `MergedMesh` from Blender data (read in bulk wherever Blender allows it), then split it into
+    `FLVERMesh` instances based on Blender materials.
 
     Also creates `Material` and `VertexArrayLayout` instances for each Blender material, and assigns them to the
     appropriate `FLVERMesh` instances. Any duplicate instances here will be merged when FLVER is packed.
@@ -315,8 +315,8 @@ def _create_flver_meshes(
 
     # 4. Construct arrays from Blender data and pass into a new `MergedMesh` for splitting.
 
-    # Slow part number 1: iterating over every Blender vertex to retrieve its position and bone weights/indices.
-    # We at least know the size of the array in advance.
+    # Vertex positions are read in bulk. Bone weights/indices are read in a single pass over vertex group elements and
+    # then validated and padded as arrays.
     vertex_count = len(tri_mesh_data.vertices)
     if use_map_piece_layout and command.flver.version.map_pieces_use_normal_w_bones():
         # Bone weights/indices not in array. `normal_w` is used for single Map Piece bone.
@@ -336,79 +336,18 @@ def _create_flver_meshes(
     vertex_data = np.empty(vertex_count, dtype=vertex_data_dtype)
     vertex_positions = np.empty((vertex_count, 3), dtype=np.float32)
     command.bl_flver.mesh.data.vertices.foreach_get("co", vertex_positions.ravel())
-    vertex_bone_weights = np.zeros((vertex_count, 4), dtype=np.float32)  # default: 0.0
-    vertex_bone_indices = np.full((vertex_count, 4), -1, dtype=np.int32)  # default: -1
-
-    # Map bone names to their indices now to avoid `index()` calls in the loop.
-    bone_name_indices = {bone_name: i for i, bone_name in enumerate(bl_bone_names)}
-    # Map group indices to group objects for bone weights.
-    vertex_groups_dict = {group.index: group for group in command.mesh.vertex_groups}
-    no_bone_warning_done = False
-    used_bone_indices = set()  # for marking unused bones in FLVER
 
     p = time.perf_counter()
 
-    # Unfortunately, there is no way to retrieve the weighted bones of vertices without iterating over all vertices.
-    # We iterate over the original, non-triangulated mesh, as the vertices should be the same and these vertices
-    # have their bone vertex groups (which cannot easily be transferred to the triangulated copy).
-    for i, vertex in enumerate(command.mesh.data.vertices):
-        bone_indices = []  # global (splitter will make them local to mesh if appropriate)
-        bone_weights = []
-        for vertex_group in vertex.groups:  # only one for Map Pieces; max of 4 for other FLVER types
-            mesh_group = vertex_groups_dict[vertex_group.group]
-            try:
-                bone_index = bone_name_indices[mesh_group.name]
-            except ValueError:
-                raise FLVERExportError(f"Vertex is weighted to invalid bone name: '{mesh_group.name}'.")
-            bone_indices.append(bone_index)
-            used_bone_indices.add(bone_index)
-            # We don't waste time calling retrieval method `weight()` for map pieces.
-            if not use_map_piece_layout:
-                # TODO: `vertex_group` has `group` (int) and `weight` (float) on it already?
-                bone_weights.append(mesh_group.weight(i))
-
-        if len(bone_indices) > 4:
-            raise FLVERExportError(
-                f"Vertex {i} cannot be weighted to {len(bone_indices)} bones (max 1 for Map Pieces, 4 for others)."
-            )
-        elif len(bone_indices) == 0:
-            if len(bl_bone_names) == 1 and use_map_piece_layout:
-                # Omitted bone indices can be assumed to be the only bone in the skeleton.
-                # We issue a warning (once) unless this FLVER export is using a default bone (no Armature), in which
-                # case we obviously don't expect any vertices to be weighted to anything.
-                if not using_default_bone and not no_bone_warning_done:
-                    command.operator.warning(
-                        f"WARNING: At least one vertex in mesh '{command.mesh.name}' is not weighted to any bones. "
-                        f"Weighting in 'Map Piece' mode to only bone in skeleton: '{bl_bone_names[0]}'"
-                    )
-                    no_bone_warning_done = True
-                bone_indices = [0]  # padded out below
-                used_bone_indices.add(0)
-                # Leave weights as zero.
-            else:
-                # Can't guess which bone to weight to. Raise error.
-                raise FLVERExportError(
-                    f"Vertex {i} is not weighted to any bones, and Map Piece FLVER has multiple bones."
-                )
-
-        if use_map_piece_layout:
-            if len(bone_indices) == 1:
-                # Duplicate single-element list to four-element list.
-                # (This is done even for games that will write only a single Map Piece bone to `normal_w`.)
-                bone_indices *= 4
-            else:
-                raise FLVERExportError(f"Map Piece vertices must be weighted to exactly one bone (vertex {i}).")
-        else:
-            # Pad out bone weights and (unused) indices for rigged meshes.
-            while len(bone_weights) < 4:
-                bone_weights.append(0.0)
-            while len(bone_indices) < 4:
-                # NOTE: we use -1 here to optimize the mesh splitting process; it will be changed to 0 for write.
-                bone_indices.append(-1)
-
-        vertex_bone_indices[i] = bone_indices
-        if bone_weights:  # rigged only
-            vertex_bone_weights[i] = bone_weights
+    # We read the original, non-triangulated mesh, as the vertices should be the same and these vertices have their
+    # bone vertex groups (which cannot easily be transferred to the triangulated copy).
+    vertex_bone_indices, vertex_bone_weights, used_bone_indices = _get_vertex_bone_arrays(
+        command.operator,
+        command.mesh,
+        bl_bone_names,
+        use_map_piece_layout,
+        using_default_bone,
+    )
 
     for used_bone_index in used_bone_indices:
         command.flver.bones[used_bone_index].usage_flags &= ~1
@@ -423,14 +362,9 @@ def _create_flver_meshes(
 
     command.operator.debug(f"Constructed combined vertex array in {time.perf_counter() - p} s.")
 
-    # NOTE: We now iterate over the faces of the triangulated copy. Material index has been properly triangulated.
+    # NOTE: We now read the faces of the triangulated copy. Material index has been properly triangulated.
     p = time.perf_counter()
-    faces = np.empty((len(tri_mesh_data.polygons), 4), dtype=np.int32)
-    # TODO: Again, due to the unfortunate need to access Python attributes one by one, we need a `for` loop.
-    #  ...But, `foreach_get()` doesn't work for `loop_indices` and `material_index`?
-    for i, face in enumerate(tri_mesh_data.polygons):
-        # Since we've triangulated the mesh, no need to check face loop count here.
-        faces[i] = [*face.loop_indices, face.material_index]
+    faces = _get_triangle_face_array(tri_mesh_data)
 
     command.operator.debug(f"Constructed combined face array with {len(faces)} rows in {time.perf_counter() - p} s.")
 
@@ -569,6 +503,118 @@ def _create_flver_meshes(
     )
 
 
+def _get_vertex_bone_arrays(
+    operator: LoggingOperator,
+    mesh: bpy.types.MeshObject,
+    bl_bone_names: list[str],
+    use_map_piece_layout: bool,
+    using_default_bone: bool,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build `(N, 4)` bone index and bone weight arrays for all vertices of `mesh` from its bone vertex groups.
+
+    Bone indices are global (splitter will make them local to mesh if appropriate). Unused slots of rigged vertices
+    have index -1 and weight 0.0. Map Piece vertices must be weighted to exactly one bone, which is duplicated to all
+    four slots (even for games that will only write it to `normal_w`), and their weights are left as zero.
+
+    Also returns a sorted array of every bone index used by at least one vertex.
+    """
+    vertices = mesh.data.vertices
+    vertex_count = len(vertices)
+    vertex_bone_indices = np.full((vertex_count, 4), -1, dtype=np.int32)
+    vertex_bone_weights = np.zeros((vertex_count, 4), dtype=np.float32)
+
+    # Map Blender vertex group indices to FLVER bone indices (-1 for groups that aren't bone names).
+    bone_name_indices = {bone_name: i for i, bone_name in enumerate(bl_bone_names)}
+    group_bone_indices = np.full(len(mesh.vertex_groups), -1, dtype=np.int32)
+    for group in mesh.vertex_groups:
+        group_bone_indices[group.index] = bone_name_indices.get(group.name, -1)
+
+    # Blender has no `foreach_get` for vertex group elements, so we still have to visit them in Python. But each
+    # element already holds its `group` index and `weight`, so a single flat comprehension replaces the old per-vertex
+    # list building and (very slow) `VertexGroup.weight(i)` calls. Everything after this is array work.
+    elements = np.array(
+        [(i, element.group, element.weight) for i, vertex in enumerate(vertices) for element in vertex.groups],
+        dtype=[("vertex", np.int32), ("group", np.int32), ("weight", np.float32)],
+    )
+    element_vertex_indices = elements["vertex"]
+    element_bone_indices = group_bone_indices[elements["group"]]
+
+    invalid_elements = element_bone_indices == -1
+    if np.any(invalid_elements):
+        first = np.argmax(invalid_elements)
+        group_name = mesh.vertex_groups[int(elements["group"][first])].name
+        raise FLVERExportError(
+            f"Vertex {element_vertex_indices[first]} is weighted to invalid bone name: '{group_name}'."
+        )
+
+    vertex_group_counts = np.bincount(element_vertex_indices, minlength=vertex_count)
+    if np.any(too_many := vertex_group_counts > 4):
+        i = np.argmax(too_many)
+        raise FLVERExportError(
+            f"Vertex {i} cannot be weighted to {vertex_group_counts[i]} bones (max 1 for Map Pieces, 4 for others)."
+        )
+    if use_map_piece_layout and np.any(multiple := vertex_group_counts > 1):
+        raise FLVERExportError(
+            f"Map Piece vertices must be weighted to exactly one bone (vertex {np.argmax(multiple)})."
+        )
+
+    # Elements are ordered by vertex, so each element's slot is its offset from the first element of its vertex.
+    vertex_element_starts = np.cumsum(vertex_group_counts) - vertex_group_counts
+    element_slots = np.arange(len(elements)) - vertex_element_starts[element_vertex_indices]
+    vertex_bone_indices[element_vertex_indices, element_slots] = element_bone_indices
+    # We don't bother with weights for Map Pieces.
+    if not use_map_piece_layout:
+        vertex_bone_weights[element_vertex_indices, element_slots] = elements["weight"]
+
+    if np.any(unweighted := vertex_group_counts == 0):
+        if len(bl_bone_names) == 1 and use_map_piece_layout:
+            # Omitted bone indices can be assumed to be the only bone in the skeleton.
+            # We issue a warning unless this FLVER export is using a default bone (no Armature), in which case we
+            # obviously don't expect any vertices to be weighted to anything.
+            if not using_default_bone:
+                operator.warning(
+                    f"WARNING: {np.sum(unweighted)} vertices in mesh '{mesh.name}' are not weighted to any bones. "
+                    f"Weighting in 'Map Piece' mode to only bone in skeleton: '{bl_bone_names[0]}'"
+                )
+            vertex_bone_indices[unweighted, 0] = 0  # duplicated below; weights left as zero
+        else:
+            # Can't guess which bone to weight to. Raise error.
+            raise FLVERExportError(
+                f"Vertex {np.argmax(unweighted)} is not weighted to any bones, and Map Piece FLVER has multiple bones."
+            )
+
+    if use_map_piece_layout:
+        # Duplicate single bone index to all four slots.
+        vertex_bone_indices[:, 1:] = vertex_bone_indices[:, :1]
+
+    used_bone_indices = np.unique(vertex_bone_indices[vertex_bone_indices >= 0])
+    return vertex_bone_indices, vertex_bone_weights, used_bone_indices
+
+
+def _get_triangle_face_array(tri_mesh_data: bpy.types.Mesh) -> np.ndarray:
+    """Read `(F, 4)` face array of three loop indices and material index from triangulated mesh in bulk.
+
+    `loop_indices` can't be read with `foreach_get`, but `loop_start`, `loop_total`, and `material_index` can, and the
+    three loops of each triangle are contiguous from `loop_start`.
+    """
+    face_count = len(tri_mesh_data.polygons)
+    loop_totals = np.empty(face_count, dtype=np.int32)
+    tri_mesh_data.polygons.foreach_get("loop_total", loop_totals)
+    if np.any(non_triangles := loop_totals != 3):
+        raise FLVERExportError(
+            f"Triangulated mesh has {np.sum(non_triangles)} non-triangle faces (e.g. face {np.argmax(non_triangles)})."
+        )
+
+    loop_starts = np.empty(face_count, dtype=np.int32)
+    tri_mesh_data.polygons.foreach_get("loop_start", loop_starts)
+    faces = np.empty((face_count, 4), dtype=np.int32)
+    faces[:, :3] = loop_starts[:, np.newaxis] + np.arange(3, dtype=np.int32)
+    material_indices = np.empty(face_count, dtype=np.int32)
+    tri_mesh_data.polygons.foreach_get("material_index", material_indices)
+    faces[:, 3] = material_indices
+    return faces
+
+
 def _get_tangents_for_uv_layer(
     operator: LoggingOperator,
     uv_name: str,
@@ -17,6 +17,7 @@ from soulstruct.base.models.shaders import MatDefError
 
 from soulstruct.blender.exceptions import FLVERImportError
 from soulstruct.blender.flver.material.types import BlenderFLVERMaterial
+from soulstruct.blender.flver.models.merged_mesh_cache import MergedMeshCache
 from soulstruct.blender.flver.models.properties import FLVERImportSettings
 from soulstruct.blender.utilities import *
 
@@ -197,13 +198,29 @@ def _create_bl_mesh(
         bl_material_uv_layer_names = ()
 
     p = time.perf_counter()
-    # Create merged mesh.
-    merged_mesh = command.flver.to_merged_mesh(
-        mesh_bl_material_indices,
-        material_uv_layer_names=bl_material_uv_layer_names,
-        merge_vertices=command.import_settings.merge_mesh_vertices,
-    )
-    command.operator.debug(f"Merged FLVER meshes in {time.perf_counter() - p} s")
+    # Load merged mesh from cache (loose FLVER files only) or create it.
+    merged_mesh_cache = MergedMeshCache.from_context(command.operator, command.context)
+    merged_mesh = None
+    cache_key = None
+    if merged_mesh_cache and command.flver.path and command.flver.path.is_file():
+        cache_key = MergedMeshCache.get_key(
+            command.flver.path.read_bytes(),
+            mesh_bl_material_indices,
+            bl_material_uv_layer_names,
+            command.import_settings.merge_mesh_vertices,
+        )
+        merged_mesh = merged_mesh_cache.load(cache_key)
+    if merged_mesh is not None:
+        command.operator.debug(f"Loaded cached merged FLVER meshes in {time.perf_counter() - p} s")
+    else:
+        merged_mesh = command.flver.to_merged_mesh(
+            mesh_bl_material_indices,
+            material_uv_layer_names=bl_material_uv_layer_names,
+            merge_vertices=command.import_settings.merge_mesh_vertices,
+        )
+        if cache_key:
+            merged_mesh_cache.save(cache_key, merged_mesh)
+        command.operator.debug(f"Merged FLVER meshes in {time.perf_counter() - p} s")
     if command.import_settings.merge_mesh_vertices:
         # Report vertex reduction.
         total_vertices = sum(len(mesh.vertices) for mesh in command.flver.meshes)
@@ -292,17 +309,19 @@ def _create_bl_mesh_from_merged_mesh(
         # No vertex merging occurred, so FLVER 'loops' and 'vertices' are still synonymous.
         face_vertex_indices = all_faces
 
-    # Drop faces that don't use three unique vertex indices.
-    # TODO: Try a vectorized approach that calculates the difference between each pair of the three columns, then
-    #  takes the product of those differences. Any row that ends up with zero is degenerate.
-    unique_mask = np.apply_along_axis(lambda row: len(np.unique(row)) == 3, 1, face_vertex_indices)  # 1D array (N)
+    # Drop faces that don't use three unique vertex indices, and exact duplicates of earlier faces with the same
+    # material (faces that reuse vertices with a different material, e.g. decals, are kept).
+    face_material_indices = merged_mesh.faces[:, 3]  # 1D array (N)
+    unique_mask = get_valid_triangle_mask(
+        face_vertex_indices, remove_duplicates=True, face_groups=face_material_indices
+    )  # 1D array (N)
     valid_face_vertex_indices = face_vertex_indices[unique_mask]  # N' x 3 array
-    valid_face_material_indices = merged_mesh.faces[:, 3][unique_mask]  # 1D array (N')
+    valid_face_material_indices = face_material_indices[unique_mask]  # 1D array (N')
 
     valid_face_count = valid_face_vertex_indices.shape[0]  # N'
     invalid_face_count = face_vertex_indices.shape[0] - valid_face_count  # N - N'
     if invalid_face_count > 0:
-        operator.debug(f"Removed {invalid_face_count} invalid/degenerate mesh faces from {mesh_data.name}.")
+        operator.debug(f"Removed {invalid_face_count} degenerate/duplicate mesh faces from {mesh_data.name}.")
 
     # Directly assign face corner (loop) vertex indices.
     mesh_data.loops.add(valid_face_vertex_indices.size)
@@ -366,27 +385,55 @@ def _create_bone_vertex_groups(
     ]  # type: list[bpy.types.VertexGroup]
 
     # Awkwardly, we need a separate call to `bone_vertex_groups[bone_index].add(indices, weight)` for each combo
-    # of `bone_index` and `weight`, so the dictionary keys constructed below are a tuple of those two to minimize
-    # the number of `VertexGroup.add()` calls needed at the end of this function.
-    bone_vertex_group_indices = {}  # type: dict[tuple[int, float], list[int]]
+    # of `bone_index` and `weight`. We build flat (vertex, bone, weight) arrays and sort them so that each combo is a
+    # contiguous run, which minimizes the number of `VertexGroup.add()` calls.
 
     # p = time.perf_counter()
-    # TODO: Can probably be vectorized better with NumPy.
-    for v_i, (bone_indices, bone_weights) in enumerate(zip(bl_vert_bone_indices, bl_vert_bone_weights)):
-        if all(weight == 0.0 for weight in bone_weights) and len(set(bone_indices)) == 1:
-            # Map Piece FLVERs use a single duplicated index and no weights.
-            # TODO: May be able to assert that this is ALWAYS true for ALL vertices in map pieces.
-            v_bone_index = bone_indices[0]
-            bone_vertex_group_indices.setdefault((v_bone_index, 1.0), []).append(v_i)
-        else:
-            # Standard multi-bone weighting.
-            for v_bone_index, v_bone_weight in zip(bone_indices, bone_weights):
-                if v_bone_weight == 0.0:
-                    continue
-                bone_vertex_group_indices.setdefault((v_bone_index, v_bone_weight), []).append(v_i)
-
-    for (bone_index, bone_weight), bone_vertices in bone_vertex_group_indices.items():
-        bone_vertex_groups[bone_index].add(bone_vertices, bone_weight, "ADD")
+
+    # Map Piece FLVERs use a single duplicated index and no weights. These vertices are fully weighted to that bone.
+    single_bone_mask = np.all(bl_vert_bone_weights == 0.0, axis=1) & np.all(
+        bl_vert_bone_indices == bl_vert_bone_indices[:, :1], axis=1
+    )
+
+    if np.all(single_bone_mask):
+        # Fast path (all Map Pieces): one `add()` call per bone with weight 1.0.
+        vertex_bone_indices = bl_vert_bone_indices[:, 0]
+        order = np.argsort(vertex_bone_indices, kind="stable")
+        sorted_bone_indices = vertex_bone_indices[order]
+        run_starts = np.flatnonzero(np.diff(sorted_bone_indices, prepend=-1))
+        for bone_index, bone_vertices in zip(sorted_bone_indices[run_starts], np.split(order, run_starts[1:])):
+            bone_vertex_groups[bone_index].add(bone_vertices.tolist(), 1.0, "ADD")
+        # self.operator.info(f"Assigned Blender vertex groups to bones in {time.perf_counter() - p} s")
+        return
+
+    # Standard multi-bone weighting: every nonzero weight slot, plus single-bone vertices (if any) with weight 1.0.
+    weighted_vertices, weighted_slots = np.nonzero((bl_vert_bone_weights != 0.0) & ~single_bone_mask[:, np.newaxis])
+    single_bone_vertices = np.flatnonzero(single_bone_mask)
+    element_vertices = np.concatenate((weighted_vertices, single_bone_vertices))
+    element_bone_indices = np.concatenate(
+        (bl_vert_bone_indices[weighted_vertices, weighted_slots], bl_vert_bone_indices[single_bone_vertices, 0])
+    )
+    element_weights = np.concatenate(
+        (
+            bl_vert_bone_weights[weighted_vertices, weighted_slots],
+            np.ones(single_bone_vertices.size, dtype=bl_vert_bone_weights.dtype),
+        )
+    )
+
+    if element_vertices.size == 0:
+        return  # no weights at all
+
+    # Sort by bone, then weight, then vertex, and split into runs of identical (bone, weight).
+    order = np.lexsort((element_vertices, element_weights, element_bone_indices))
+    element_vertices = element_vertices[order]
+    element_bone_indices = element_bone_indices[order]
+    element_weights = element_weights[order]
+    run_boundaries = (np.diff(element_bone_indices) != 0) | (np.diff(element_weights) != 0)
+    run_starts = np.concatenate(([0], np.flatnonzero(run_boundaries) + 1))
+    for run_start, bone_vertices in zip(run_starts, np.split(element_vertices, run_starts[1:])):
+        bone_vertex_groups[element_bone_indices[run_start]].add(
+            bone_vertices.tolist(), float(element_weights[run_start]), "ADD"
+        )
 
     # self.operator.info(f"Assigned Blender vertex groups to bones in {time.perf_counter() - p} s")
 
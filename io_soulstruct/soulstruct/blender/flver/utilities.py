@@ -4,6 +4,7 @@ __all__ = [
     "get_flvers_from_binder",
     "BONE_CoB_4x4",
     "game_bone_transform_to_bl_bone_matrix",
+    "game_bone_transform_arrays_to_bl_bone_matrices",
     "get_armature_matrix",
     "get_basis_matrix",
     "game_forward_up_vectors_to_bl_euler",
@@ -13,6 +14,8 @@ __all__ = [
 
 from pathlib import Path
 
+import numpy as np
+
 import bpy
 from mathutils import Euler, Matrix
 
@@ -21,6 +24,7 @@ from soulstruct.flver import FLVER
 from soulstruct.utilities.maths import EulerRad, Vector3, Matrix3
 
 from soulstruct.blender.utilities.conversion import to_blender, to_game
+from soulstruct.blender.utilities.maths import quaternion_arrays_to_rotation_matrices
 from soulstruct.blender.exceptions import *
 
 
@@ -71,6 +75,30 @@ def game_bone_transform_to_bl_bone_matrix(
     return bl_transform @ BONE_CoB_4x4
 
 
+def game_bone_transform_arrays_to_bl_bone_matrices(
+    game_translates: np.ndarray,
+    game_quaternions: np.ndarray,
+    game_scales: np.ndarray,
+) -> np.ndarray:
+    """Array version of `game_bone_transform_to_bl_bone_matrix()` for `(N, 3)` translations, `(N, 4)` XYZW quaternions,
+    and `(N, 3)` scales (e.g. one bone on every animation frame). Returns `(N, 4, 4)` Blender bone matrices.
+    """
+    # Swap Y and Z. Quaternion conversion matches `to_blender(Quaternion)` (WXYZ with negated, swapped vector).
+    bl_translates = game_translates[:, [0, 2, 1]]
+    x, y, z, w = game_quaternions.T
+    bl_rotmats = quaternion_arrays_to_rotation_matrices(np.stack([w, -x, -z, -y], axis=1))
+    bl_scales = game_scales[:, [0, 2, 1]]
+
+    bl_transforms = np.zeros((len(bl_translates), 4, 4), dtype=np.float64)
+    bl_transforms[:, :3, :3] = bl_rotmats
+    bl_transforms[:, :3, 3] = bl_translates
+    bl_transforms[:, 3, 3] = 1.0
+    for i in range(3):
+        bl_transforms[:, i, i] *= bl_scales[:, i]  # as in single version
+    # Apply CoB matrix to swap X and Y and negate Z.
+    return bl_transforms @ np.array(BONE_CoB_4x4)
+
+
 def get_armature_matrix(armature: bpy.types.ArmatureObject, bone_name: str, basis=None) -> Matrix:
     """Demonstrates how Blender calculates `pose_bone.matrix` (armature matrix) for `bone_name`.
 
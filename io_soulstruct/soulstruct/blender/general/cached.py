@@ -1,53 +1,110 @@
 from __future__ import annotations
 
 __all__ = [
+    "CacheValidation",
+    "CachedFileStats",
     "get_cached_file",
     "get_cached_bxf",
+    "get_cached_file_stats",
+    "clear_cached_files",
 ]
 
+import hashlib
 import typing as tp
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
 
 from soulstruct.containers import Binder
-from soulstruct.utilities.files import get_blake2b_hash
 
 if tp.TYPE_CHECKING:
     from soulstruct.base.base_binary_file import BASE_BINARY_FILE_T
+    from soulstruct.blender.utilities import LoggingOperator
 
 
-# Maps file paths to `(BaseBinaryFile, blake2b_hash)` tuples for caching. Useful for inspecting, say, MSB files
+class CacheValidation(Enum):
+    """How a cached file is checked against the file(s) on disk."""
+    # Compare `(mtime_ns, size, inode)` of file(s) first, and only hash their content if any of those have changed.
+    STAT_THEN_HASH = 0
+    # Always hash full file content (slow for large files, but immune to tools that preserve modified times).
+    ALWAYS_HASH = 1
+
+
+@dataclass(slots=True)
+class CachedFileStats:
+    """Running totals for all `get_cached_*` calls in this Blender session."""
+    hits: int = 0  # includes hits that required a hash check
+    hash_checks: int = 0
+    misses: int = 0
+    evictions: int = 0
+    cached_size: int = 0  # total size of currently cached source files
+
+    def __str__(self):
+        return (
+            f"{self.hits} hits ({self.hash_checks} hash checks), {self.misses} misses, {self.evictions} evictions, "
+            f"{len(_CACHED_FILES)} cached ({self.cached_size / 1024 / 1024:.1f} MB)"
+        )
+
+
+@dataclass(slots=True)
+class _CachedFile:
+    game_file: tp.Any
+    stat_key: tuple[tuple[int, int, int], ...]  # `(mtime_ns, size, inode)` for each source file
+    content_hash: bytes
+    size: int  # total size of source files, used as an approximation of memory usage
+
+
+# Maps file paths to `_CachedFile` entries, in least to most recently used order. Useful for inspecting, say, MSB files
 # repeatedly without modifying them.
-_CACHED_FILES = {}
+_CACHED_FILES = OrderedDict()  # type: OrderedDict[Path, _CachedFile]
+_CACHED_FILE_STATS = CachedFileStats()
+
+# Least recently used files are dropped when the total size of cached source files exceeds this. The most recently
+# loaded file is always kept, however large it is.
+MAX_CACHED_FILES_SIZE = 1024 * 1024 * 1024  # 1 GB
 
+_HASH_CHUNK_SIZE = 1024 * 1024
 
-def get_cached_file(file_path: Path | str, file_type: type[BASE_BINARY_FILE_T]) -> BASE_BINARY_FILE_T:
+
+def get_cached_file(
+    file_path: Path | str,
+    file_type: type[BASE_BINARY_FILE_T],
+    validation=CacheValidation.STAT_THEN_HASH,
+    operator: LoggingOperator = None,
+) -> BASE_BINARY_FILE_T:
     """Load a `BaseBinaryFile` from disk and cache it in a global dictionary.
 
+    If `operator` is given, whether the file was a cache hit and current cache statistics are logged to it.
+
     NOTE: Obviously, these cached `BaseBinaryFile` instances should be read-only, generally speaking, unless they are
      immediately written back to disk when modified!
     """
     file_path = Path(file_path)
     if not file_path.is_file():
         # Not loaded, even if cached.
-        _CACHED_FILES.pop(file_path, None)
+        _pop_cached_file(file_path)
         raise FileNotFoundError(f"Cannot find file '{file_path}'.")
 
-    # The hashing process reads the file anyway, so we may as well save the second read if it's actually needed.
+    game_file = _get_cached_game_file(file_path, (file_path,), validation, operator)
+    if game_file is not None:
+        return game_file
+
+    # Read the file once for both hashing and parsing.
     file_data = file_path.read_bytes()
-    file_path_hash = get_blake2b_hash(file_data)
-    if file_path in _CACHED_FILES:
-        game_file, cached_hash = _CACHED_FILES[file_path]
-        if cached_hash == file_path_hash:
-            # Can return cached file.
-            return game_file
-        # Hash has changed, so update cache below.
     game_file = file_type.from_bytes(file_data)
-    _CACHED_FILES[file_path] = (game_file, file_path_hash)
+    _add_cached_file(file_path, (file_path,), game_file, _get_hash(file_data), operator)
     return game_file
 
 
-def get_cached_bxf(bhd_path: Path | str) -> Binder:
-    """Load a `BaseBinaryFile` from disk and cache it in a global dictionary.
+def get_cached_bxf(
+    bhd_path: Path | str,
+    validation=CacheValidation.STAT_THEN_HASH,
+    operator: LoggingOperator = None,
+) -> Binder:
+    """Load a split `Binder` from disk and cache it in a global dictionary.
+
+    BHD and BDT files are validated together, since they are always paired.
 
     NOTE: Obviously, these cached `BaseBinaryFile` instances should be read-only, generally speaking, unless they are
      immediately written back to disk when modified!
@@ -63,21 +120,111 @@ def get_cached_bxf(bhd_path: Path | str) -> Binder:
 
     if not bhd_path.is_file() or not bdt_path.is_file():
         # Not loaded, even if cached.
-        _CACHED_FILES.pop(bhd_path, None)
-        _CACHED_FILES.pop(bdt_path, None)
+        _pop_cached_file(bhd_path)
         raise FileNotFoundError(f"Cannot find file '{bhd_path}' and/or file '{bdt_path}'.")
 
-    # The hashing process reads the file anyway, so we may as well save the second read if it's actually needed.
-    # Here, we hash both BHD and BDT files together, since they are always paired.
+    bxf = _get_cached_game_file(bhd_path, (bhd_path, bdt_path), validation, operator)
+    if bxf is not None:
+        return bxf
+
     bhd_data = bhd_path.read_bytes()
     bdt_data = bdt_path.read_bytes()
-    bhd_bdt_hash = get_blake2b_hash(bhd_data + bdt_data)
-    if bhd_path in _CACHED_FILES:
-        bxf, cached_hash = _CACHED_FILES[bhd_path]
-        if cached_hash == bhd_bdt_hash:
-            # Can return cached split `Binder`.
-            return bxf
-        # Hash has changed, so update cache below.
     bxf = Binder.from_bytes(bhd_data, bdt_data)
-    _CACHED_FILES[bhd_path] = (bxf, bhd_bdt_hash)
+    _add_cached_file(bhd_path, (bhd_path, bdt_path), bxf, _get_hash(bhd_data, bdt_data), operator)
     return bxf
+
+
+def get_cached_file_stats() -> CachedFileStats:
+    return _CACHED_FILE_STATS
+
+
+def clear_cached_files():
+    """Drop all cached files (statistics are kept)."""
+    _CACHED_FILES.clear()
+    _CACHED_FILE_STATS.cached_size = 0
+
+
+def _get_stat_key(source_paths: tp.Sequence[Path]) -> tuple[tuple[int, int, int], ...]:
+    stats = [path.stat() for path in source_paths]
+    return tuple((stat.st_mtime_ns, stat.st_size, stat.st_ino) for stat in stats)
+
+
+def _get_hash(*datas: bytes) -> bytes:
+    """Hash one or more byte strings as if concatenated (without actually concatenating them)."""
+    hasher = hashlib.blake2b()
+    for data in datas:
+        hasher.update(data)
+    return hasher.digest()
+
+
+def _get_file_hash(*source_paths: Path) -> bytes:
+    """Streaming version of `_get_hash()` that never holds more than one chunk of the files in memory."""
+    hasher = hashlib.blake2b()
+    for path in source_paths:
+        with path.open("rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                hasher.update(chunk)
+    return hasher.digest()
+
+
+def _get_cached_game_file(
+    key_path: Path,
+    source_paths: tp.Sequence[Path],
+    validation: CacheValidation,
+    operator: LoggingOperator | None,
+) -> tp.Any | None:
+    """Return cached game file for `key_path` if still valid, or `None` (and drop any stale entry) otherwise."""
+    cached = _CACHED_FILES.get(key_path)
+    if cached is None:
+        return None
+
+    stat_key = _get_stat_key(source_paths)
+    if validation == CacheValidation.STAT_THEN_HASH and stat_key == cached.stat_key:
+        _use_cached_file(key_path, operator, "unchanged file stats")
+        return cached.game_file
+
+    _CACHED_FILE_STATS.hash_checks += 1
+    if _get_file_hash(*source_paths) == cached.content_hash:
+        cached.stat_key = stat_key  # e.g. file touched or copied, but content unchanged
+        _use_cached_file(key_path, operator, "unchanged file hash")
+        return cached.game_file
+
+    # Content has changed. Caller will reload it.
+    _pop_cached_file(key_path)
+    return None
+
+
+def _use_cached_file(key_path: Path, operator: LoggingOperator | None, reason: str):
+    _CACHED_FILES.move_to_end(key_path)
+    _CACHED_FILE_STATS.hits += 1
+    if operator:
+        operator.debug(f"Using cached file '{key_path.name}' ({reason}). Cache: {_CACHED_FILE_STATS}")
+
+
+def _add_cached_file(
+    key_path: Path,
+    source_paths: tp.Sequence[Path],
+    game_file: tp.Any,
+    content_hash: bytes,
+    operator: LoggingOperator | None,
+):
+    _pop_cached_file(key_path)
+    size = sum(path.stat().st_size for path in source_paths)
+    _CACHED_FILES[key_path] = _CachedFile(game_file, _get_stat_key(source_paths), content_hash, size)
+    _CACHED_FILE_STATS.cached_size += size
+    _CACHED_FILE_STATS.misses += 1
+
+    # Evict least recently used files (never the new one).
+    while _CACHED_FILE_STATS.cached_size > MAX_CACHED_FILES_SIZE and len(_CACHED_FILES) > 1:
+        _, evicted = _CACHED_FILES.popitem(last=False)
+        _CACHED_FILE_STATS.cached_size -= evicted.size
+        _CACHED_FILE_STATS.evictions += 1
+
+    if operator:
+        operator.debug(f"Loaded and cached file '{key_path.name}'. Cache: {_CACHED_FILE_STATS}")
+
+
+def _pop_cached_file(key_path: Path):
+    cached = _CACHED_FILES.pop(key_path, None)
+    if cached is not None:
+        _CACHED_FILE_STATS.cached_size -= cached.size
@@ -5,6 +5,7 @@ __all__ = [
     "ExportMapMSB",
 ]
 
+import time
 import traceback
 import typing as tp
 from pathlib import Path
@@ -21,11 +22,12 @@ from soulstruct.demonssouls.maps.navmesh import NVMBND as NVMBND_DES
 from soulstruct.dcx import DCXType
 from soulstruct.games import *
 from soulstruct.utilities.text import natural_keys
-from soulstruct.havok.fromsoft.shared import HKXBHD, BothResHKXBHD
+from soulstruct.havok.fromsoft.shared import HKXBHD, MapCollisionModel
 
 from soulstruct.blender.general.game_config import BLENDER_GAME_CONFIG
 from soulstruct.blender.collision.types import BlenderMapCollision
 from soulstruct.blender.navmesh.nvm.types import BlenderNVM
+from soulstruct.blender.process_pool import get_process_pool, pack_game_file
 from soulstruct.blender.types import SoulstructType
 from soulstruct.blender.utilities.operators import LoggingOperator, LoggingExportOperator
 
@@ -445,7 +447,10 @@ class ExportMapMSB(LoggingOperator):
     def export_loose_hkxs(
         self, context: bpy.types.Context, map_stem: str, bl_collisions: list[BaseBlenderMSBPart]
     ) -> set[str]:
-        """Collect and export all both-res loose HKXs for all MSB Collision models."""
+        """Collect and export all both-res loose HKXs for all MSB Collision models.
+
+        HKX data is extracted from Blender on the main thread, then all HKX files are packed in a process pool.
+        """
         settings = context.scene.soulstruct_settings
         dcx_type = settings.game.get_dcx_type("hkx")  # probably no DCX
         havok_module = settings.game_config.havok_module
@@ -453,46 +458,41 @@ class ExportMapMSB(LoggingOperator):
             return self.error(f"Cannot export Collision models for game '{settings.game}' without PyHavok module.")
 
         relative_map_dir = Path(f"map/{map_stem}")
-        added_models = set()
-        exported_paths = []
-
-        for bl_collision in bl_collisions:
-            if not bl_collision.model:
-                # Log error (should never happen in any valid MSB), but continue.
-                self.error(f"Blender MSB Collision '{bl_collision.name}' has no model assigned to export.")
-                continue
-            model_stem = bl_collision.game_name
-            if model_stem in added_models:
-                # Acceptable, unlike navmeshes (e.g. kill planes or shifted dupes of some other kind).
-                continue
-            added_models.add(model_stem)
+        hkx_pairs = self._get_collision_hkx_pairs(bl_collisions, havok_module, dcx_type)
+        if not hkx_pairs:
+            self.warning(f"No Collision models found to export in MSB {map_stem}. No HKX files written.")
+            return {"CANCELLED"}
 
-            bl_collision_model = BlenderMapCollision(bl_collision.model)
-            try:
-                hi_hkx, lo_hkx = bl_collision_model.to_hkx_pair(
-                    self, havok_module, require_hi=True, use_hi_if_missing_lo=True
+        p = time.perf_counter()
+        with get_process_pool() as pool:
+            hkx_data_futures = [
+                (model_name, pool.submit(pack_game_file, hi_hkx), pool.submit(pack_game_file, lo_hkx), hi_hkx, lo_hkx)
+                for model_name, hi_hkx, lo_hkx in hkx_pairs
+            ]
+            exported_paths = []
+            for model_name, hi_future, lo_future, hi_hkx, lo_hkx in hkx_data_futures:
+                try:
+                    hi_data, lo_data = hi_future.result(), lo_future.result()
+                except Exception as ex:
+                    self.error(f"Could not pack hi/lo HKX for '{model_name}'. Error: {ex}")
+                    continue
+                hi_paths = settings.export_file_data(
+                    self, hi_data, relative_map_dir / f"{hi_hkx.path_stem}.hkx", "MapCollisionModel"
                 )
-            except Exception as ex:
-                self.error(f"Cannot get exported hi/lo HKX for '{bl_collision.model.name}'. Error: {ex}")
-                continue
-            hi_hkx.dcx_type = dcx_type
-            lo_hkx.dcx_type = dcx_type
-
-            try:
-                exported_paths += settings.export_file(self, hi_hkx, relative_map_dir / f"{hi_hkx.path_stem}.hkx")
-            except Exception as ex:
-                self.error(f"Could not export hi HKX for '{bl_collision.model.name}'. Error: {ex}")
-                continue
-            try:
-                exported_paths += settings.export_file(self, lo_hkx, relative_map_dir / f"{lo_hkx.path_stem}.hkx")
-            except Exception as ex:
-                # TODO: Delete hi HKX...
-                self.error(f"Hi HKX exported, but could not export lo HKX for '{bl_collision.model.name}'. Error: {ex}")
-                continue
+                if not hi_paths:
+                    self.error(f"Could not export hi HKX for '{model_name}'.")
+                    continue
+                exported_paths += hi_paths
+                lo_paths = settings.export_file_data(
+                    self, lo_data, relative_map_dir / f"{lo_hkx.path_stem}.hkx", "MapCollisionModel"
+                )
+                if not lo_paths:
+                    # TODO: Delete hi HKX...
+                    self.error(f"Hi HKX exported, but could not export lo HKX for '{model_name}'.")
+                    continue
+                exported_paths += lo_paths
+        self.debug(f"Packed and wrote {len(hkx_pairs)} hi/lo HKX pairs in {time.perf_counter() - p:.2f} s.")
 
-        if not added_models:
-            self.warning(f"No Collision models found to export in MSB {map_stem}. No HKX files written.")
-            return {"CANCELLED"}
         if not exported_paths:
             return self.error(f"Collision models were found in MSB {map_stem}, but no HKX files could be written.")
 
@@ -501,21 +501,66 @@ class ExportMapMSB(LoggingOperator):
     def export_hkxbhds(
         self, context: bpy.types.Context, map_stem: str, bl_collisions: list[BaseBlenderMSBPart]
     ) -> set[str]:
-        """Collect and export brand new both-res HKXBHDs containing all MSB Collision models."""
+        """Collect and export brand new both-res HKXBHDs containing all MSB Collision models.
+
+        HKX data is extracted from Blender on the main thread, then all HKX files are packed in a process pool. The hi
+        and lo HKXBHDs are assembled from the packed entry data on the main thread.
+        """
         settings = context.scene.soulstruct_settings
         dcx_type = settings.game.get_dcx_type("hkx")  # will have DCX inside HKXBHD
         havok_module = settings.game_config.havok_module
         if not havok_module:
             return self.error(f"Cannot export Collision models for game '{settings.game}' without PyHavok module.")
 
-        # The `BothResHKXBHD` class is already DSR-specific.
-        both_res_hkxbhd = BothResHKXBHD(
-            hi_res=HKXBHD(map_stem=map_stem, path=Path(f"map/{map_stem}/h{map_stem[1:]}.hkxbhd")),
-            lo_res=HKXBHD(map_stem=map_stem, path=Path(f"map/{map_stem}/l{map_stem[1:]}.hkxbhd")),
-            path=Path(f"map/{map_stem}"),
-        )  # brand new empty HKXBHDs
-        added_models = set()
+        hkx_pairs = self._get_collision_hkx_pairs(bl_collisions, havok_module, dcx_type)
+        if not hkx_pairs:
+            self.warning(f"No Collision models found to export in MSB {map_stem}. HKXBHDs not written.")
+            return {"CANCELLED"}
+
+        p = time.perf_counter()
+        # The `HKXBHD` class is already DSR-specific. These are brand new HKXBHDs.
+        hi_hkxbhd = HKXBHD(map_stem=map_stem)
+        lo_hkxbhd = HKXBHD(map_stem=map_stem)
+        with get_process_pool() as pool:
+            hkx_data_futures = [
+                (model_name, pool.submit(pack_game_file, hi_hkx), pool.submit(pack_game_file, lo_hkx), hi_hkx, lo_hkx)
+                for model_name, hi_hkx, lo_hkx in hkx_pairs
+            ]
+            for model_name, hi_future, lo_future, hi_hkx, lo_hkx in hkx_data_futures:
+                try:
+                    hi_data, lo_data = hi_future.result(), lo_future.result()
+                except Exception as ex:
+                    self.error(f"Could not pack hi/lo HKX for '{model_name}'. Error: {ex}")
+                    continue
+                for hkxbhd, hkx, data in ((hi_hkxbhd, hi_hkx, hi_data), (lo_hkxbhd, lo_hkx, lo_data)):
+                    hkxbhd.set_default_entry(
+                        hkxbhd.get_hkx_entry_path(hkx.path_stem), new_id=len(hkxbhd.entries), new_flags=0x2
+                    ).set_uncompressed_data(data)
+        self.debug(f"Packed {len(hkx_pairs)} hi/lo HKX pairs for HKXBHDs in {time.perf_counter() - p:.2f} s.")
+
+        if not hi_hkxbhd.entries:
+            return self.error(f"Collision models were found in MSB {map_stem}, but no HKX files could be packed.")
 
+        relative_map_dir = Path(f"map/{map_stem}")
+        hi_paths = settings.export_file(self, hi_hkxbhd, relative_map_dir / f"h{map_stem[1:]}.hkxbhd")
+        if not hi_paths:
+            return self.error(f"MSB {map_stem} was exported, but could not export new hi Collision HKXBHD.")
+        lo_paths = settings.export_file(self, lo_hkxbhd, relative_map_dir / f"l{map_stem[1:]}.hkxbhd")
+        if not lo_paths:
+            return self.error(f"MSB {map_stem} and hi HKXBHD were exported, but could not export new lo HKXBHD.")
+
+        return {"FINISHED"}
+
+    def _get_collision_hkx_pairs(
+        self, bl_collisions: list[BaseBlenderMSBPart], havok_module, dcx_type: DCXType
+    ) -> list[tuple[str, MapCollisionModel, MapCollisionModel]]:
+        """Extract hi/lo `MapCollisionModel` pair from each unique MSB Collision model. Must run on main thread.
+
+        Returns `(model_name, hi_hkx, lo_hkx)` tuples.
+        """
+        p = time.perf_counter()
+        added_models = set()
+        hkx_pairs = []
         for bl_collision in bl_collisions:
             if not bl_collision.model:
                 # Log error (should never happen in any valid MSB), but continue.
@@ -537,19 +582,7 @@ class ExportMapMSB(LoggingOperator):
                 continue
             hi_hkx.dcx_type = dcx_type
             lo_hkx.dcx_type = dcx_type
+            hkx_pairs.append((bl_collision.model.name, hi_hkx, lo_hkx))
 
-            both_res_hkxbhd.hi_res.set_hkx(hi_hkx.path_stem, hi_hkx)
-            both_res_hkxbhd.lo_res.set_hkx(lo_hkx.path_stem, lo_hkx)
-
-        if not added_models:
-            self.warning(f"No Collision models found to export in MSB {map_stem}. HKXBHDs not written.")
-            return {"CANCELLED"}
-
-        try:
-            # HKX paths are already set to correct relative path.
-            settings.export_file(self, both_res_hkxbhd.hi_res, both_res_hkxbhd.hi_res.path)
-            settings.export_file(self, both_res_hkxbhd.lo_res, both_res_hkxbhd.lo_res.path)
-        except Exception as ex:
-            return self.error(f"MSB {map_stem} was exported, but could not export new Collision HKXBHDs. Error: {ex}")
-
-        return {"FINISHED"}
+        self.debug(f"Extracted {len(hkx_pairs)} hi/lo HKX pairs from Blender in {time.perf_counter() - p:.2f} s.")
+        return hkx_pairs
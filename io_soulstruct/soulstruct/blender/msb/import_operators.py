@@ -330,7 +330,7 @@ class ImportMapMSB(_BaseImportMSB):
 
         msb_stem = settings.get_latest_map_stem_version()
         msb_path = settings.get_import_msb_path()  # will automatically use latest MSB version if known and enabled
-        msb = get_cached_file(msb_path, settings.game_config.msb_class)  # type: MSB_TYPING
+        msb = get_cached_file(msb_path, settings.game_config.msb_class, operator=self)  # type: MSB_TYPING
         oldest_map_stem = settings.get_oldest_map_stem_version(msb_stem)
 
         return _import_msb(self, context, msb, msb_stem, oldest_map_stem)
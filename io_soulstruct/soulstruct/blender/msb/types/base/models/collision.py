@@ -4,6 +4,7 @@ __all__ = [
     "BlenderMSBCollisionModelImporter",
 ]
 
+import time
 import traceback
 from dataclasses import dataclass
 
@@ -14,6 +15,7 @@ from soulstruct.havok.fromsoft.shared import BothResHKXBHD, MapCollisionModel
 
 from soulstruct.blender.general import SoulstructSettings
 from soulstruct.blender.collision.types import BlenderMapCollision
+from soulstruct.blender.collision.utilities import read_both_res_collisions
 from soulstruct.blender.exceptions import MapCollisionImportError
 from soulstruct.blender.utilities import find_or_create_collection, LoggingOperator
 
@@ -194,8 +196,6 @@ class BlenderMSBCollisionModelImporter(BaseBlenderMSBModelImporter):
         """
         settings = operator.settings(context)
 
-        imported_model_names = set()
-
         try:
             hi_res_hkxbhd_path = settings.get_import_map_file_path(f"h{map_stem[1:]}.hkxbhd")
         except FileNotFoundError:
@@ -205,26 +205,34 @@ class BlenderMSBCollisionModelImporter(BaseBlenderMSBModelImporter):
         except FileNotFoundError:
             raise FileNotFoundError(f"Cannot find lo-res HKXBHD for map {map_stem}.")
 
+        p = time.perf_counter()
         both_res_hkxbhd = BothResHKXBHD.from_both_paths(hi_res_hkxbhd_path, lo_res_hkxbhd_path)
+        operator.debug(f"Read HKXBHDs for map {map_stem} in {time.perf_counter() - p:.2f} s.")
+
+        # Decompress and parse all HKX entries in parallel. Only mesh creation below needs the main thread.
+        p = time.perf_counter()
+        model_names = [model.get_model_file_stem(map_stem) for model in models]
+        collisions = read_both_res_collisions(both_res_hkxbhd, model_names)
+        operator.info(
+            f"Loaded {sum(not isinstance(result, Exception) for result in collisions.values())} Collision models from "
+            f"HKXBHDs in map {map_stem} in parallel in {time.perf_counter() - p:.2f} s."
+        )
 
-        for model in models:
-            model_name = model.get_model_file_stem(map_stem)
-
-            if model_name in imported_model_names:
-                continue
-            imported_model_names.add(model_name)
+        p = time.perf_counter()
+        created_count = 0
+        for model_name, result in collisions.items():
 
-            try:
-                hi_collision, lo_collision = both_res_hkxbhd.get_both_hkx(model_name)
-            except EntryNotFoundError:
+            if isinstance(result, EntryNotFoundError):
                 self._handle_missing_hkx(operator, model_name, map_stem)
                 continue
-            except Exception as ex:
+            elif isinstance(result, Exception):
                 operator.error(
-                    f"(Batch) Cannot load Collision model '{model_name}' from HKXBHDs in map {map_stem}. Error: {ex}"
+                    f"(Batch) Cannot load Collision model '{model_name}' from HKXBHDs in map {map_stem}. "
+                    f"Error: {result}"
                 )
                 continue
 
+            hi_collision, lo_collision = result
             try:
                 BlenderMapCollision.new_from_soulstruct_obj(
                     operator,
@@ -240,3 +248,7 @@ class BlenderMSBCollisionModelImporter(BaseBlenderMSBModelImporter):
                     f"(Batch) Cannot import Collision model '{model_name}' from HKXBHDs in map {map_stem}. Error: {ex}"
                 )
                 # We continue with other models.
+            else:
+                created_count += 1
+
+        operator.info(f"Created {created_count} Collision model meshes in {time.perf_counter() - p:.2f} s.")
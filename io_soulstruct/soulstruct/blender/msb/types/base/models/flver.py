@@ -21,6 +21,7 @@ from soulstruct.flver import FLVER, MergedMesh
 
 from soulstruct.blender.exceptions import FLVERImportError
 from soulstruct.blender.flver.image.image_import_manager import ImageImportManager
+from soulstruct.blender.flver.models.merged_mesh_cache import MergedMeshCache
 from soulstruct.blender.flver.models.types import BlenderFLVER
 from soulstruct.blender.flver.utilities import get_flvers_from_binder
 from soulstruct.blender.types import ObjectType, SoulstructType
@@ -125,6 +126,18 @@ class BaseBlenderMSBFLVERModelImporter(BaseBlenderMSBModelImporter, abc.ABC):
                         flver_sources[model_name],
                         flver_source_binders.get(model_name, None),
                     )
+            # Load all textures named by the batch's FLVERs in parallel now, rather than one source at a time during
+            # material creation. (MATBIN textures of newer games are still found on demand.)
+            texture_stems = {
+                texture_path.stem
+                for flver in flvers.values()
+                for texture_path in flver.get_all_texture_paths()
+            }
+            image_import_manager.prefetch_flver_textures(texture_stems)
+            operator.debug(
+                f"Found and prefetched textures for {len(flvers)} {cls.MODEL_SUBTYPE_TITLE} FLVERs in "
+                f"{time.perf_counter() - p:.2f} seconds."
+            )
         else:
             image_import_manager = None
 
@@ -168,15 +181,44 @@ class BaseBlenderMSBFLVERModelImporter(BaseBlenderMSBModelImporter, abc.ABC):
         )
         p = time.perf_counter()
 
+        # Load any cached merged meshes (if enabled) and only merge the rest.
+        flver_merged_meshes = {}  # type: dict[str, MergedMesh | None]
+        merged_mesh_cache = MergedMeshCache.from_context(operator, context)
+        cache_keys = {}  # type: dict[str, str]
+        if merged_mesh_cache:
+            for model_name, merged_mesh_args in zip(flver_names_to_merge, flver_merged_mesh_args):
+                flver_source = flver_sources[model_name]
+                flver_data = flver_source.read_bytes() if isinstance(flver_source, Path) else flver_source.data
+                cache_keys[model_name] = cache_key = MergedMeshCache.get_key(flver_data, *merged_mesh_args)
+                if (merged_mesh := merged_mesh_cache.load(cache_key)) is not None:
+                    flver_merged_meshes[model_name] = merged_mesh
+            if flver_merged_meshes:
+                operator.info(
+                    f"Loaded {len(flver_merged_meshes)} cached merged {cls.MODEL_SUBTYPE_TITLE} FLVER meshes."
+                )
+        uncached_indices = [
+            i for i, model_name in enumerate(flver_names_to_merge) if model_name not in flver_merged_meshes
+        ]
+
         # Merge meshes in parallel. Empty meshes will be `None`.
-        flver_merged_meshes_list = MergedMesh.from_flver_batch(flvers_to_merge, flver_merged_mesh_args)
-        flver_merged_meshes = {  # nothing dropped
-            model_name: merged_mesh
-            for model_name, merged_mesh in zip(flver_names_to_merge, flver_merged_meshes_list)
-        }
+        if uncached_indices:
+            flver_merged_meshes_list = MergedMesh.from_flver_batch(
+                [flvers_to_merge[i] for i in uncached_indices],
+                [flver_merged_mesh_args[i] for i in uncached_indices],
+            )
+        else:
+            flver_merged_meshes_list = []
+        for i, merged_mesh in zip(uncached_indices, flver_merged_meshes_list):  # nothing dropped
+            model_name = flver_names_to_merge[i]
+            flver_merged_meshes[model_name] = merged_mesh
+            if merged_mesh is not None and model_name in cache_keys:
+                merged_mesh_cache.save(cache_keys[model_name], merged_mesh, evict=False)
+        if merged_mesh_cache and uncached_indices:
+            merged_mesh_cache.evict()
 
         operator.info(
-            f"Merged {len(flvers)} {cls.MODEL_SUBTYPE_TITLE} FLVERs in {time.perf_counter() - p:.2f} seconds."
+            f"Merged {len(uncached_indices)} {cls.MODEL_SUBTYPE_TITLE} FLVERs in {time.perf_counter() - p:.2f} "
+            f"seconds."
         )
         p = time.perf_counter()
 
@@ -8,6 +8,7 @@ __all__ = [
     "ExportMapMCGMCP",
 
     "MCGDrawSettings",
+    "mark_mcg_draw_caches_dirty",
     "update_mcg_draw_caches",
     "draw_mcg_nodes",
     "draw_mcg_edges",
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 __all__ = [
     "MCGDrawSettings",
+    "mark_mcg_draw_caches_dirty",
     "update_mcg_draw_caches",
     "draw_mcg_nodes",
     "draw_mcg_edges",
@@ -10,12 +11,14 @@ __all__ = [
 
 import typing as tp
 
+import numpy as np
+
 import bpy
 import blf
 import gpu
+from bpy.app.handlers import persistent
 from bpy_extras.view3d_utils import location_3d_to_region_2d
 from gpu_extras.batch import batch_for_shader
-from mathutils import Vector
 
 from soulstruct.blender.exceptions import SoulstructTypeError
 from soulstruct.blender.bpy_base.property_group import SoulstructPropertyGroup
@@ -32,11 +35,15 @@ _CACHED_NODES_BATCH = None  # type: GPUBatch | None
 _CACHED_EDGES_BATCH = None  # type: GPUBatch | None
 _CACHED_TRIANGLES_A_BATCH = None  # type: GPUBatch | None
 _CACHED_TRIANGLES_B_BATCH = None  # type: GPUBatch | None
-# Store last computed geometry to know when to update.
-_LAST_DRAWN_NODES = None  # type: list[Vector] | None
-_LAST_DRAWN_EDGES = None  # type: list[Vector] | None  # flattened list of edge endpoint pairs
-_LAST_DRAWN_TRIANGLES_A = None  # type: list[Vector] | None  # flattened list of triangle vertices
-_LAST_DRAWN_TRIANGLES_B = None  # type: list[Vector] | None  # flattened list of triangle vertices
+# Store last computed geometry to know when to update batches.
+_LAST_DRAWN_NODES = None  # type: np.ndarray | None  # `(n, 3)` node locations
+_LAST_DRAWN_EDGES = None  # type: np.ndarray | None  # `(2 * n, 3)` edge endpoint pairs
+_LAST_DRAWN_TRIANGLES_A = None  # type: np.ndarray | None  # `(3 * n, 3)` triangle vertices
+_LAST_DRAWN_TRIANGLES_B = None  # type: np.ndarray | None  # `(3 * n, 3)` triangle vertices
+# Caches are only rebuilt when dirty (after any depsgraph update or file load) or when relevant draw settings change,
+# not on every viewport redraw.
+_MCG_DRAW_CACHES_DIRTY = True
+_LAST_DRAW_SETTINGS_KEY = None  # type: tuple | None
 
 
 class MCGDrawSettings(SoulstructPropertyGroup):
@@ -75,18 +82,86 @@ class MCGDrawSettings(SoulstructPropertyGroup):
             return None
 
 
+@persistent
+def mark_mcg_draw_caches_dirty(*_args):
+    """Handler for `depsgraph_update_post` and `load_post` that makes `update_mcg_draw_caches()` check MCG objects and
+    their navmeshes again on the next redraw."""
+    global _MCG_DRAW_CACHES_DIRTY
+    _MCG_DRAW_CACHES_DIRTY = True
+
+
+def _get_navmesh_triangle_coords(navmesh: bpy.types.MeshObject) -> np.ndarray:
+    """Get `(faces, 3, 3)` array of the world coordinates of every triangle in `navmesh`. Vertices beyond the first
+    three of any non-triangle faces are ignored."""
+    mesh = navmesh.data
+    vertex_coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", vertex_coords)
+    vertex_coords = vertex_coords.reshape(-1, 3)
+    matrix_world = np.array(navmesh.matrix_world, dtype=np.float32)
+    vertex_coords = vertex_coords @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_vertex_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+    face_vertex_indices = loop_vertex_indices[loop_starts[:, np.newaxis] + np.arange(3)]
+    return vertex_coords[face_vertex_indices]
+
+
+def _gather_triangle_coords(
+    navmesh_triangles: list[tuple[bpy.types.MeshObject, list[int]]],
+    navmesh_triangle_coords: dict[str, np.ndarray],
+) -> np.ndarray:
+    """Get `(3 * n, 3)` array of triangle vertices for each `(navmesh, triangle_indices)` (ignoring invalid indices),
+    using and filling `navmesh_triangle_coords` cache."""
+    coords = []
+    for navmesh, triangle_indices in navmesh_triangles:
+        if navmesh.name not in navmesh_triangle_coords:
+            navmesh_triangle_coords[navmesh.name] = _get_navmesh_triangle_coords(navmesh)
+        triangle_coords = navmesh_triangle_coords[navmesh.name]
+        triangle_indices = np.array(triangle_indices, dtype=np.int64)
+        triangle_indices = triangle_indices[triangle_indices < triangle_coords.shape[0]]  # ignore invalid face indices
+        coords.append(triangle_coords[triangle_indices].reshape(-1, 3))
+    if not coords:
+        return np.empty((0, 3), dtype=np.float32)
+    return np.concatenate(coords)
+
+
+def _get_shader() -> GPUShader:
+    global _CACHED_SHADER
+    if _CACHED_SHADER is None:
+        _CACHED_SHADER = gpu.shader.from_builtin("UNIFORM_COLOR")
+    return _CACHED_SHADER
+
+
 def update_mcg_draw_caches():
-    """Process selected MCG nodes/edges and update cached batches if necessary."""
-    global _CACHED_SHADER, _CACHED_NODES_BATCH, _CACHED_EDGES_BATCH
+    """Process selected MCG nodes/edges and update cached batches if necessary.
+
+    Does nothing unless caches have been marked dirty by `mark_mcg_draw_caches_dirty()` or the MCG draw settings have
+    changed. Geometry is then gathered into NumPy arrays, and each batch is only rebuilt if its array has changed.
+    """
+    global _CACHED_NODES_BATCH, _CACHED_EDGES_BATCH
     global _CACHED_TRIANGLES_A_BATCH, _CACHED_TRIANGLES_B_BATCH
     global _LAST_DRAWN_NODES, _LAST_DRAWN_EDGES
     global _LAST_DRAWN_TRIANGLES_A, _LAST_DRAWN_TRIANGLES_B
+    global _MCG_DRAW_CACHES_DIRTY, _LAST_DRAW_SETTINGS_KEY
 
     draw_settings = bpy.context.scene.mcg_draw_settings
     if not draw_settings.draw_graph:
         # Don't erase caches.
         return
 
+    draw_settings_key = (
+        draw_settings.mcg_parent.name if draw_settings.mcg_parent else None,
+        draw_settings.draw_selected_only,
+        draw_settings.highlight_edge_navmesh_triangles,
+        draw_settings.highlight_selected_only,
+    )
+    if not _MCG_DRAW_CACHES_DIRTY and draw_settings_key == _LAST_DRAW_SETTINGS_KEY:
+        return  # nothing can have changed
+    _MCG_DRAW_CACHES_DIRTY = False
+    _LAST_DRAW_SETTINGS_KEY = draw_settings_key
+
     bl_mcg = draw_settings.mcg
     if not bl_mcg:
         # Erase cached batches.
@@ -105,21 +180,18 @@ def update_mcg_draw_caches():
     if draw_settings.draw_selected_only:
         bl_nodes = [node for node in bl_nodes if node.obj.select_get()]
 
-    # Build the points list.
-    points = [node.location.copy() for node in bl_nodes]
+    # Build the points array.
+    points = np.array([node.location for node in bl_nodes], dtype=np.float32).reshape(-1, 3)
 
     # Only update nodes batch if the points have changed.
-    if points != _LAST_DRAWN_NODES:
-        # Cache (or create) the shader
-        if _CACHED_SHADER is None:
-            _CACHED_SHADER = gpu.shader.from_builtin("UNIFORM_COLOR")
-        _CACHED_NODES_BATCH = batch_for_shader(_CACHED_SHADER, 'POINTS', {"pos": points})
+    if _LAST_DRAWN_NODES is None or not np.array_equal(points, _LAST_DRAWN_NODES):
+        _CACHED_NODES_BATCH = batch_for_shader(_get_shader(), "POINTS", {"pos": points})
         _LAST_DRAWN_NODES = points
 
     # Process edges/triangles similarly.
-    all_edge_location_pairs = []
-    node_a_triangles_coords = []
-    node_b_triangles_coords = []
+    edge_location_pairs = []
+    node_a_navmesh_triangles = []  # type: list[tuple[bpy.types.MeshObject, list[int]]]
+    node_b_navmesh_triangles = []  # type: list[tuple[bpy.types.MeshObject, list[int]]]
     edges_and_nodes = []  # for moving edges to midpoint if cache refreshed
     for bl_edge in bl_mcg.get_edges():
         try:
@@ -133,7 +205,7 @@ def update_mcg_draw_caches():
             if not (bl_edge.obj.select_get() or bl_node_a.obj.select_get() or bl_node_b.obj.select_get()):
                 continue
 
-        all_edge_location_pairs.extend([bl_node_a.location.copy(), bl_node_b.location.copy()])
+        edge_location_pairs += [bl_node_a.location, bl_node_b.location]
         edges_and_nodes.append((bl_edge, bl_node_a, bl_node_b))
 
         if draw_settings.highlight_edge_navmesh_triangles:
@@ -142,41 +214,13 @@ def update_mcg_draw_caches():
             # Draw triangles over faces linked to start and end nodes.
             navmesh = bl_edge.navmesh_part
             if navmesh is not None:
-                if bl_node_a.navmesh_a == navmesh:
-                    node_a_triangles = bl_node_a.navmesh_a_triangles
-                elif bl_node_a.navmesh_b == navmesh:
-                    node_a_triangles = bl_node_a.navmesh_b_triangles
-                else:
-                    node_a_triangles = []  # can't find
-                for i in node_a_triangles:
-                    if i >= len(navmesh.data.polygons):
-                        continue  # invalid face index
-                    face = navmesh.data.polygons[i]
-                    for vert_index in face.vertices:
-                        vert = navmesh.data.vertices[vert_index]
-                        world_coord = navmesh.matrix_world @ vert.co
-                        node_a_triangles_coords.append(world_coord)
-
-                if bl_node_b.navmesh_a == navmesh:
-                    node_b_triangles = bl_node_b.navmesh_a_triangles
-                elif bl_node_b.navmesh_b == navmesh:
-                    node_b_triangles = bl_node_b.navmesh_b_triangles
-                else:
-                    node_b_triangles = []  # can't find
-                for i in node_b_triangles:
-                    if i >= len(navmesh.data.polygons):
-                        continue  # invalid face index
-                    face = navmesh.data.polygons[i]
-                    for vert_index in face.vertices:
-                        vert = navmesh.data.vertices[vert_index]
-                        world_coord = navmesh.matrix_world @ vert.co
-                        node_b_triangles_coords.append(world_coord)
-
-    if all_edge_location_pairs != _LAST_DRAWN_EDGES:
-        if _CACHED_SHADER is None:
-            _CACHED_SHADER = gpu.shader.from_builtin("UNIFORM_COLOR")
-        _CACHED_EDGES_BATCH = batch_for_shader(_CACHED_SHADER, "LINES", {"pos": all_edge_location_pairs})
-        _LAST_DRAWN_EDGES = all_edge_location_pairs
+                node_a_navmesh_triangles.append((navmesh, bl_node_a.get_navmesh_triangles(navmesh) or []))
+                node_b_navmesh_triangles.append((navmesh, bl_node_b.get_navmesh_triangles(navmesh) or []))
+
+    edge_location_pairs = np.array(edge_location_pairs, dtype=np.float32).reshape(-1, 3)
+    if _LAST_DRAWN_EDGES is None or not np.array_equal(edge_location_pairs, _LAST_DRAWN_EDGES):
+        _CACHED_EDGES_BATCH = batch_for_shader(_get_shader(), "LINES", {"pos": edge_location_pairs})
+        _LAST_DRAWN_EDGES = edge_location_pairs
 
         # Reposition edge objects between their nodes for convenience.
         for bl_edge, bl_node_a, bl_node_b in edges_and_nodes:
@@ -187,15 +231,15 @@ def update_mcg_draw_caches():
             bl_edge.rotation_euler = direction.to_track_quat('Z', 'Y').to_euler()
 
     if draw_settings.highlight_edge_navmesh_triangles:
-        if node_a_triangles_coords != _LAST_DRAWN_TRIANGLES_A:
-            if _CACHED_SHADER is None:
-                _CACHED_SHADER = gpu.shader.from_builtin("UNIFORM_COLOR")
-            _CACHED_TRIANGLES_A_BATCH = batch_for_shader(_CACHED_SHADER, "TRIS", {"pos": node_a_triangles_coords})
+        # World-space triangles of each navmesh are only read once per update.
+        navmesh_triangle_coords = {}  # type: dict[str, np.ndarray]
+        node_a_triangles_coords = _gather_triangle_coords(node_a_navmesh_triangles, navmesh_triangle_coords)
+        node_b_triangles_coords = _gather_triangle_coords(node_b_navmesh_triangles, navmesh_triangle_coords)
+        if _LAST_DRAWN_TRIANGLES_A is None or not np.array_equal(node_a_triangles_coords, _LAST_DRAWN_TRIANGLES_A):
+            _CACHED_TRIANGLES_A_BATCH = batch_for_shader(_get_shader(), "TRIS", {"pos": node_a_triangles_coords})
             _LAST_DRAWN_TRIANGLES_A = node_a_triangles_coords
-        if node_b_triangles_coords != _LAST_DRAWN_TRIANGLES_B:
-            if _CACHED_SHADER is None:
-                _CACHED_SHADER = gpu.shader.from_builtin("UNIFORM_COLOR")
-            _CACHED_TRIANGLES_B_BATCH = batch_for_shader(_CACHED_SHADER, "TRIS", {"pos": node_b_triangles_coords})
+        if _LAST_DRAWN_TRIANGLES_B is None or not np.array_equal(node_b_triangles_coords, _LAST_DRAWN_TRIANGLES_B):
+            _CACHED_TRIANGLES_B_BATCH = batch_for_shader(_get_shader(), "TRIS", {"pos": node_b_triangles_coords})
             _LAST_DRAWN_TRIANGLES_B = node_b_triangles_coords
 
 
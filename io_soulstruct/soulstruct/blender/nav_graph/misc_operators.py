@@ -331,6 +331,9 @@ class RecomputeEdgeCost(LoggingOperator):
         bl_edges = BlenderMCGEdge.from_selected_objects(context)  # type: list[BlenderMCGEdge]
         map_stem = bl_edges[0].game_name
 
+        # Face graphs are only built once per navmesh `Mesh`, as many selected edges usually share navmeshes.
+        face_graphs = {}  # type: dict[str, NavmeshFaceGraph]
+
         for bl_edge in bl_edges:
 
             edge_stem = bl_edge.game_name
@@ -372,7 +375,9 @@ class RecomputeEdgeCost(LoggingOperator):
             end_face_i = min(node_b_triangles)
 
             try:
-                total_cost = get_best_cost(edge_navmesh.data, start_face_i, end_face_i)
+                if edge_navmesh.data.name not in face_graphs:
+                    face_graphs[edge_navmesh.data.name] = NavmeshFaceGraph.from_mesh(edge_navmesh.data)
+                total_cost = face_graphs[edge_navmesh.data.name].get_best_costs([start_face_i, end_face_i])[0, 1]
             except Exception as ex:
                 raise ValueError(
                     f"Failed to compute cost of edge '{bl_edge.name}' between nodes {bl_node_a.name} and "
@@ -511,7 +516,7 @@ class AutoCreateMCG(LoggingOperator):
 
         navmesh_exit_clusters = []  # type: list[tuple[EXIT_CLUSTER, ...]]
 
-        exit_sq_dist = context.scene.nav_graph_compute_settings.connected_exit_vertex_distance ** 2
+        exit_distance = context.scene.nav_graph_compute_settings.connected_exit_vertex_distance
 
         for navmesh_part in navmesh_parts:
 
@@ -543,7 +548,7 @@ class AutoCreateMCG(LoggingOperator):
         bl_mcg = BlenderMCG.new(f"{map_stem} MCG", data=None, collection=collection)
 
         navmesh_nodes_and_keys = self._create_mcg_nodes(
-            bl_mcg, collection, map_stem, navmesh_parts, navmesh_exit_clusters, exit_sq_dist
+            bl_mcg, collection, map_stem, navmesh_parts, navmesh_exit_clusters, exit_distance
         )
         try:
             self._create_mcg_edges(
@@ -563,13 +568,13 @@ class AutoCreateMCG(LoggingOperator):
 
         # First, find all clusters of connected 'Exit' faces in each navmesh.
         exit_clusters = []
-        checked = []
+        checked = set()  # type: set[bmesh.types.BMFace]
 
         for face in bm.faces:
 
             if face in checked:
                 continue
-            checked.append(face)
+            checked.add(face)
 
             if face[flags_layer] & NavmeshFlag.Exit:
                 # Find all connected 'Exit' faces.
@@ -577,17 +582,14 @@ class AutoCreateMCG(LoggingOperator):
                 stack = [face]
                 while stack:
                     f = stack.pop()
-                    if f in cluster:
-                        continue
-
                     verts = frozenset(tuple(v.co + navmesh_part.location) for v in f.verts)
                     cluster.append((f, verts))
                     for edge in f.edges:
                         for other_face in edge.link_faces:
                             if other_face in checked:
                                 continue
-                            checked.append(other_face)  # cannot possibly already be checked
-                            if other_face not in cluster and other_face[flags_layer] & NavmeshFlag.Exit:
+                            checked.add(other_face)
+                            if other_face[flags_layer] & NavmeshFlag.Exit:
                                 stack.append(other_face)
                 exit_clusters.append(tuple(cluster))
 
@@ -600,10 +602,13 @@ class AutoCreateMCG(LoggingOperator):
         map_stem: str,
         navmesh_parts: list[BlenderMSBNavmesh],
         navmesh_exit_clusters: list[tuple[EXIT_CLUSTER, ...]],
-        exit_sq_dist: float,
+        exit_distance: float,
     ) -> list[list[NODE_WITH_KEY]]:
         """Find connected exit clusters across navmeshes and create MCG nodes in Blender at those sites.
 
+        Exit clusters are connected if any of their faces have (at least) two vertices within `exit_distance` of each
+        other. They are matched with a spatial grid (see `get_touching_exit_clusters()`).
+
         Returns a list of lists of `(BlenderMCGNode, (navmesh_a, navmesh_b))` tuples (one node list per navmesh part),
         where the inner navmesh tuples are always in ascending order.
         """
@@ -612,122 +617,75 @@ class AutoCreateMCG(LoggingOperator):
         # Actual returned list.
         navmesh_nodes_and_keys = [[] for _ in navmesh_parts]  # type: list[list[tuple[BlenderMCGNode, tuple[int, int]]]]
 
-        # All MCG nodes, keyed by non-ordered (ascending navmesh ID) pairs of navmesh model IDs AND exact exit clusters.
-        # Used to prevent the same node from being generated multiple times (from both sides).
-        all_nodes = set()  # type: set[tuple[tuple[int, int], tuple[tuple[int, ...], tuple[int, ...]]]]
-
         # Maps non-ordered (ascending) pairs of navmesh part indices to the nodes connecting them.
         # Used to detect and add name suffix to multiple nodes between the same navmesh part pair.
         navmesh_pair_nodes = {}  # type: dict[tuple[int, int], list[BlenderMCGNode]]
 
-        for nav_index, (navmesh_part, exit_clusters) in enumerate(
-            zip(navmesh_parts, navmesh_exit_clusters, strict=True)
-        ):
-
-            navmesh_model_id = int(navmesh_part.name[1:5])  # validated above
-            for cluster in exit_clusters:
-                for face, face_verts in cluster:
-
-                    for other_nav_index, (other_navmesh_part, other_exit_clusters) in enumerate(
-                        zip(navmesh_parts, navmesh_exit_clusters, strict=True)
-                    ):
-                        if nav_index >= other_nav_index:
-                            # Don't compare navmeshes we've already compared (or to self).
-                            continue
+        # Each pair of touching clusters is only found once (from the earlier navmesh part).
+        touching_clusters = get_touching_exit_clusters(navmesh_exit_clusters, exit_distance)
 
-                        other_navmesh_id = int(other_navmesh_part.name[1:5])  # validated above
+        for (nav_index, cluster_index), (other_nav_index, other_cluster_index) in touching_clusters:
+            navmesh_part = navmesh_parts[nav_index]
+            other_navmesh_part = navmesh_parts[other_nav_index]
+            cluster = navmesh_exit_clusters[nav_index][cluster_index]
+            other_cluster = navmesh_exit_clusters[other_nav_index][other_cluster_index]
 
-                        # Don't forget that `i` and `j` are not necessarily equal to the navmesh model IDs.
-
-                        for other_cluster in other_exit_clusters:
-
-                            # Get node key and model pair key in ascending *navmesh ID* order.
-                            if navmesh_model_id < other_navmesh_id:
-                                model_pair_key = (navmesh_model_id, other_navmesh_id)
-                                node_key = (cluster, other_cluster)
-                            else:
-                                model_pair_key = (other_navmesh_id, navmesh_model_id)
-                                node_key = (other_cluster, cluster)
-
-                            if (model_pair_key, node_key) in all_nodes:
-                                # Already created this exact node.
-                                continue
+            # Don't forget that navmesh part indices are not necessarily equal to the navmesh model IDs.
+            navmesh_model_id = int(navmesh_part.name[1:5])  # validated above
+            other_navmesh_id = int(other_navmesh_part.name[1:5])  # validated above
+            if navmesh_model_id > other_navmesh_id:
+                # Swap order of node's navmeshes, so node navmesh A is the earlier one (by model ID).
+                navmesh_part, other_navmesh_part = other_navmesh_part, navmesh_part
+                cluster, other_cluster = other_cluster, cluster
+                navmesh_model_id, other_navmesh_id = other_navmesh_id, navmesh_model_id
+            model_pair_key = (navmesh_model_id, other_navmesh_id)
+
+            # Found a touching cluster. Create a new `BlenderMCGNode`.
+            node_name = f"{map_stem} Node [{model_pair_key[0]} | {model_pair_key[1]}]"
+            if model_pair_key in navmesh_pair_nodes:
+                # Have already created a node for this pair of navmeshes. Add index suffices.
+                index = len(navmesh_pair_nodes[model_pair_key])  # at least 1
+                if index == 1:
+                    # Edit first node to add '(0)' suffix.
+                    navmesh_pair_nodes[model_pair_key][0].name += " (0)"
+                node_name += f" ({index})"
+            else:
+                # First node between these navmeshes. May not need to add index suffices.
+                navmesh_pair_nodes[model_pair_key] = []
+
+            # Node position is average of all vertices in both clusters.
+            node_position = Vector()
+            v_count = 0
+            for _, f_verts in cluster + other_cluster:
+                for v in f_verts:
+                    node_position += Vector(v)
+                    v_count += 1
+            node_position /= v_count
+
+            bl_node = BlenderMCGNode.new(node_name, None, collection)  # type: BlenderMCGNode
+            bl_node.obj.location = node_position
+            bl_node.obj.empty_display_type = "SPHERE"
+            bl_node.obj.parent = bl_mcg.node_parent
+
+            # Record node connecting this navmesh pair.
+            navmesh_pair_nodes[model_pair_key].append(bl_node)
+
+            bl_node.navmesh_a = navmesh_part.obj
+            bl_node.navmesh_a_triangles = [f.index for f, _ in cluster]
+            bl_node.navmesh_b = other_navmesh_part.obj
+            bl_node.navmesh_b_triangles = [f.index for f, _ in other_cluster]
+
+            navmesh_nodes_and_keys[nav_index].append((bl_node, model_pair_key))
+            navmesh_nodes_and_keys[other_nav_index].append((bl_node, model_pair_key))
+
+            self.info(
+                f"Created node: {bl_node.name} from {navmesh_part.name} to {other_navmesh_part.name} "
+                f"({bl_node.navmesh_a.name}, {bl_node.navmesh_b.name}) with model IDs {navmesh_model_id} and "
+                f"{other_navmesh_id}."
+            )
 
-                            for other_face, other_face_verts in other_cluster:
-                                # Check if faces are connected by an edge.
-                                # As vertices may not be completely identical, this is unfortunately a bit slow.
-                                hits = 0
-                                for v in face_verts:
-                                    for ov in other_face_verts:
-                                        if self.sq_dist(v, ov) < exit_sq_dist:
-                                            hits += 1
-                                            if hits >= 2:
-                                                break
-                                    else:
-                                        continue
-                                    break
-
-                                if hits < 2:
-                                    # No shared edge.
-                                    continue
-
-                                # Found a touching cluster. Create a new `BlenderMCGNode`.
-                                node_name = f"{map_stem} Node [{model_pair_key[0]} | {model_pair_key[1]}]"
-                                if model_pair_key in navmesh_pair_nodes:
-                                    # Have already created a node for this pair of navmeshes. Add index suffices.
-                                    index = len(navmesh_pair_nodes[model_pair_key])  # at least 1
-                                    if index == 1:
-                                        # Edit first node to add '(0)' suffix.
-                                        navmesh_pair_nodes[model_pair_key][0].name += " (0)"
-                                    node_name += f" ({index})"
-                                else:
-                                    # First node between these navmeshes. May not need to add index suffices.
-                                    navmesh_pair_nodes[model_pair_key] = []
-
-                                # Node position is average of all vertices in both clusters.
-                                node_position = Vector()
-                                v_count = 0
-                                for _, f_verts in cluster:
-                                    for v in f_verts:
-                                        node_position += Vector(v)
-                                        v_count += 1
-                                for _, f_verts in other_cluster:
-                                    for v in f_verts:
-                                        node_position += Vector(v)
-                                        v_count += 1
-                                node_position /= v_count
-
-                                bl_node = BlenderMCGNode.new(node_name, None, collection)  # type: BlenderMCGNode
-                                bl_node.obj.location = node_position
-                                bl_node.obj.empty_display_type = "SPHERE"
-                                bl_node.obj.parent = bl_mcg.node_parent
-
-                                # Record node connecting this navmesh pair.
-                                navmesh_pair_nodes[model_pair_key].append(bl_node)
-
-                                if navmesh_model_id > other_navmesh_id:
-                                    # Swap order of node's navmeshes, so node navmesh A is the earlier one.
-                                    navmesh_part, other_navmesh_part = other_navmesh_part, navmesh_part
-                                    cluster, other_cluster = other_cluster, cluster
-                                    # Not used after this (except for logging), but for clarity:
-                                    navmesh_model_id, other_navmesh_id = other_navmesh_id, navmesh_model_id
-
-                                bl_node.navmesh_a = navmesh_part.obj
-                                bl_node.navmesh_a_triangles = [f.index for f, _ in cluster]
-                                bl_node.navmesh_b = other_navmesh_part.obj
-                                bl_node.navmesh_b_triangles = [f.index for f, _ in other_cluster]
-
-                                all_nodes.add((model_pair_key, node_key))
-                                navmesh_nodes_and_keys[nav_index].append((bl_node, model_pair_key))
-                                navmesh_nodes_and_keys[other_nav_index].append((bl_node, model_pair_key))
-
-                                self.info(
-                                    f"Created node: {bl_node.name} from {navmesh_part.name} to "
-                                    f"{other_navmesh_part.name} ({bl_node.navmesh_a.name}, {bl_node.navmesh_b.name}) "
-                                    f"with model IDs {navmesh_model_id} and {other_navmesh_id}."
-                                )
-
-            self.info(f"Found {len(navmesh_nodes_and_keys[nav_index])} nodes for navmesh {navmesh_part.name}.")
+        for navmesh_part, nodes_and_keys in zip(navmesh_parts, navmesh_nodes_and_keys):
+            self.info(f"Found {len(nodes_and_keys)} nodes for navmesh {navmesh_part.name}.")
 
         return navmesh_nodes_and_keys
 
@@ -741,7 +699,6 @@ class AutoCreateMCG(LoggingOperator):
     ):
         """Create edges between connected node pairs in Blender MCG."""
         for navmesh_part, nodes_and_keys in zip(navmesh_parts, navmesh_nodes_and_keys, strict=True):
-            created = set()
 
             if len(nodes_and_keys) == 1:
                 # DEAD END navmesh with a single node. Only case where `MCGNode` references a navmesh part.
@@ -752,74 +709,68 @@ class AutoCreateMCG(LoggingOperator):
                 bl_node.name += " <DEAD END>"  # this will cause the above error if it has no edges in ANOTHER navmesh
                 continue  # no edges to create
 
-            # We need to create non-directional edges on every pair of nodes touching this navmesh.
-            for i, (bl_node_a, (a_navmesh_a, a_navmesh_b)) in enumerate(nodes_and_keys):
-                for j, (bl_node_b, (b_navmesh_a, b_navmesh_b)) in enumerate(nodes_and_keys):
-                    if i == j or (i, j) in created or (j, i) in created:
-                        continue
-
-                    # Neither of these can fail, by design.
-                    node_a_triangles = bl_node_a.get_navmesh_triangles(navmesh_part.obj)
-                    node_b_triangles = bl_node_b.get_navmesh_triangles(navmesh_part.obj)
-                    if node_a_triangles is None or node_b_triangles is None:
-                        print(navmesh_part.name, bl_node_a.navmesh_a.name, bl_node_b.navmesh_a.name)
-                        raise ValueError(
-                            f"Node {bl_node_a.name} and/or {bl_node_b.name} references no triangles in MSB Navmesh "
-                            f"'{navmesh_part.name}'. Indicates MCG generator bug."
-                        )
-
-                    try:
-                        start_face_i = min(node_a_triangles)
-                        end_face_i = min(node_b_triangles)
-                    except ValueError:
-                        # No triangles! Only permitted by dead end navmeshes.
-                        raise ValueError(
-                            f"Node {bl_node_a.name} and/or {bl_node_b.name} references no "
-                            f"triangles in MSB Navmesh '{navmesh_part.name}'."
-                        )
-
-                    if start_face_i == end_face_i:
-                        raise ValueError(
-                            f"Node {bl_node_a.name} and {bl_node_b.name} reference the same triangle "
-                            f"({start_face_i}) in MSB Navmesh '{navmesh_part.name}'. This indicates that duplicate "
-                            f"nodes have been created for the same cluster of Exit faces in the navmesh (an error)."
-                        )
-
-                    # Note that this creates its own `BMesh` that removes vertex doubles.
-                    try:
-                        total_cost = get_best_cost(navmesh_part.mesh, start_face_i, end_face_i)
-                    except Exception as ex:
-                        raise ValueError(
-                            f"Failed to compute cost between nodes {bl_node_a.name} and {bl_node_b.name} in "
-                            f"MSB Navmesh '{navmesh_part.name}'. Make sure all NVM vertices have been merged by "
-                            f"distance. Error: {ex}"
-                        )
-                    if total_cost == 0.0:
-                        total_cost = 10000.0  # arbitrary error catch
-
-                    edge_name = (
-                        f"{map_stem} Edge ([{a_navmesh_a} | {a_navmesh_b}] "
-                        f"-> [{b_navmesh_a} | {b_navmesh_b}]) <{navmesh_part.name}>"
+            # Each node's edges start from its first triangle in this navmesh.
+            start_face_indices = []
+            for bl_node, _ in nodes_and_keys:
+                # Cannot fail, by design.
+                node_triangles = bl_node.get_navmesh_triangles(navmesh_part.obj)
+                if node_triangles is None:
+                    raise ValueError(
+                        f"Node {bl_node.name} references no triangles in MSB Navmesh '{navmesh_part.name}'. "
+                        f"Indicates MCG generator bug."
+                    )
+                if not node_triangles:
+                    # No triangles! Only permitted by dead end navmeshes.
+                    raise ValueError(
+                        f"Node {bl_node.name} references no triangles in MSB Navmesh '{navmesh_part.name}'."
+                    )
+                start_face_indices.append(min(node_triangles))
+
+            for i, start_face_i in enumerate(start_face_indices):
+                if start_face_i in start_face_indices[:i]:
+                    bl_node_a = nodes_and_keys[start_face_indices.index(start_face_i)][0]
+                    bl_node_b = nodes_and_keys[i][0]
+                    raise ValueError(
+                        f"Node {bl_node_a.name} and {bl_node_b.name} reference the same triangle "
+                        f"({start_face_i}) in MSB Navmesh '{navmesh_part.name}'. This indicates that duplicate "
+                        f"nodes have been created for the same cluster of Exit faces in the navmesh (an error)."
                     )
 
-                    bl_edge = BlenderMCGEdge.new(edge_name, None, collection)  # type: BlenderMCGEdge
-                    bl_edge.parent = bl_mcg.edge_parent
-                    start = bl_node_a.location
-                    end = bl_node_b.location
-                    direction = end - start
-                    midpoint = (start + end) / 2.0
-                    bl_edge.obj.empty_display_type = "PLAIN_AXES"
-                    bl_edge.location = midpoint
-                    # Point empty arrow in direction of edge.
-                    bl_edge.rotation_euler = direction.to_track_quat('Z', 'Y').to_euler()
-
-                    bl_edge.cost = total_cost
-                    bl_edge.node_a = bl_node_a.obj
-                    bl_edge.node_b = bl_node_b.obj
-                    bl_edge.navmesh_part = navmesh_part.obj
+            # Build navmesh face graph (which removes vertex doubles) once, and find the costs between all node pairs
+            # with one search per node.
+            try:
+                face_graph = NavmeshFaceGraph.from_mesh(navmesh_part.mesh)
+                best_costs = face_graph.get_best_costs(start_face_indices)
+            except Exception as ex:
+                raise ValueError(
+                    f"Failed to compute costs between nodes in MSB Navmesh '{navmesh_part.name}'. Make sure all NVM "
+                    f"vertices have been merged by distance. Error: {ex}"
+                )
 
-                    created.add((i, j))
+            # We need to create non-directional edges on every pair of nodes touching this navmesh.
+            for (i, j), total_cost in best_costs.items():
+                bl_node_a, (a_navmesh_a, a_navmesh_b) = nodes_and_keys[i]
+                bl_node_b, (b_navmesh_a, b_navmesh_b) = nodes_and_keys[j]
+                if total_cost == 0.0:
+                    total_cost = 10000.0  # arbitrary error catch
+
+                edge_name = (
+                    f"{map_stem} Edge ([{a_navmesh_a} | {a_navmesh_b}] "
+                    f"-> [{b_navmesh_a} | {b_navmesh_b}]) <{navmesh_part.name}>"
+                )
 
-    @staticmethod
-    def sq_dist(v1, v2) -> float:
-        return sum((v1[_i] - v2[_i]) ** 2 for _i in range(3))
+                bl_edge = BlenderMCGEdge.new(edge_name, None, collection)  # type: BlenderMCGEdge
+                bl_edge.parent = bl_mcg.edge_parent
+                start = bl_node_a.location
+                end = bl_node_b.location
+                direction = end - start
+                midpoint = (start + end) / 2.0
+                bl_edge.obj.empty_display_type = "PLAIN_AXES"
+                bl_edge.location = midpoint
+                # Point empty arrow in direction of edge.
+                bl_edge.rotation_euler = direction.to_track_quat('Z', 'Y').to_euler()
+
+                bl_edge.cost = total_cost
+                bl_edge.node_a = bl_node_a.obj
+                bl_edge.node_b = bl_node_b.obj
+                bl_edge.navmesh_part = navmesh_part.obj
@@ -4,16 +4,21 @@ __all__ = [
     "get_neighbors",
     "a_star",
     "get_navmesh_step_cost",
+    "get_navmesh_flags_step_cost",
     "get_best_cost",
     "get_edge_cost",
+    "NavmeshFaceGraph",
+    "get_touching_exit_clusters",
 ]
 
 import heapq
 import itertools
 import math
+import typing as tp
 
 import bpy
 import bmesh
+import numpy as np
 from bmesh.types import BMesh, BMFace
 from mathutils import Vector
 
@@ -127,6 +132,30 @@ def get_navmesh_step_cost(
 
     from_face_flags = from_face[flags_layer] if flags_layer is not None else 0
     to_face_flags = to_face[flags_layer] if flags_layer is not None else 0
+    if to_face_flags == 0:
+        # Cost is just distance. (Checked here to avoid reading settings.)
+        return distance
+    settings = bpy.context.scene.nav_graph_compute_settings
+    return get_navmesh_flags_step_cost(
+        from_face_flags,
+        to_face_flags,
+        distance,
+        all_faces_passable,
+        settings.wall_multiplier,
+        settings.obstacle_multiplier,
+    )
+
+
+def get_navmesh_flags_step_cost(
+    from_face_flags: int,
+    to_face_flags: int,
+    distance: float,
+    all_faces_passable: bool,
+    wall_multiplier: float,
+    obstacle_multiplier: float,
+) -> float:
+    """Get the cost of travelling from a face with `from_face_flags` to a face with `to_face_flags` whose centroid is
+    `distance` away. See `get_navmesh_step_cost()`."""
     if to_face_flags == 0:
         # Cost is just distance.
         return distance
@@ -140,27 +169,35 @@ def get_navmesh_step_cost(
             return float("inf")
         # NOTE: Degenerate faces are passable. They are sometimes used to join faces with different edge lengths.
 
-    settings = bpy.context.scene.nav_graph_compute_settings
-
     if to_face_flags & NavmeshFlag.Obstacle:
-        return settings.obstacle_multiplier * distance
+        return obstacle_multiplier * distance
 
     # TODO: Ladders don't seem to be penalized in general.
     # if to_face_flags & NavmeshFlag.Ladder:
     #     return 200 * distance
 
     if to_face_flags & NavmeshFlag.Wall:
-        return settings.wall_multiplier * distance  # drop
+        return wall_multiplier * distance  # drop
 
     return distance
 
 
 def get_best_cost(mesh: bpy.types.Mesh, start_face_i: int, end_face_i: int) -> float:
-    """We calculate cost in both directions and use the cheaper one."""
-    forward_path, forward_cost, forward_all_passable = get_edge_cost(mesh, start_face_i, end_face_i)
-    backward_path, backward_cost, backward_all_passable = get_edge_cost(mesh, end_face_i, start_face_i)
+    """We calculate cost in both directions and use the cheaper one.
 
-    if not forward_path and not backward_path:
+    Builds a new `NavmeshFaceGraph` of `mesh`. Use `NavmeshFaceGraph.get_best_costs()` for multiple faces.
+    """
+    return NavmeshFaceGraph.from_mesh(mesh).get_best_costs([start_face_i, end_face_i])[0, 1]
+
+
+def _combine_directed_costs(forward: tuple[float, bool], backward: tuple[float, bool]) -> float:
+    """Combine `(cost, all_faces_passable)` of both directions between two faces into a single edge cost.
+
+    Returns 0.0 if there is no path in either direction, even when all faces are passable.
+    """
+    (forward_cost, forward_all_passable), (backward_cost, backward_all_passable) = forward, backward
+
+    if math.isinf(forward_cost) and math.isinf(backward_cost):
         return 0.0
 
     if forward_all_passable == backward_all_passable:
@@ -185,3 +222,265 @@ def get_edge_cost(
         return a_star(start_face, end_face, bm)
     finally:
         bm.free()
+
+
+class NavmeshFaceGraph:
+    """Face adjacency graph of a navmesh `Mesh` (after merging vertices by distance), with face centroid distances and
+    flags, for computing MCG edge costs without any further `BMesh` work.
+
+    Costs from one face to any number of other faces are found with a single Dijkstra search, so the costs between all
+    pairs of N faces (e.g. the start triangles of MCG nodes in a navmesh) need at most 2N searches.
+    """
+
+    face_count: int
+    # For each face, a list of `(neighbor_face_index, centroid_distance)` tuples.
+    neighbors: list[list[tuple[int, float]]]
+    face_flags: list[int]
+    wall_multiplier: float
+    obstacle_multiplier: float
+    # Cached `(neighbor_face_index, step_cost)` lists for each face, keyed by `all_faces_passable`. Impassable steps are
+    # omitted.
+    _step_costs: dict[bool, list[list[tuple[int, float]]]]
+
+    def __init__(
+        self,
+        neighbors: list[list[tuple[int, float]]],
+        face_flags: list[int],
+        wall_multiplier=1.0,
+        obstacle_multiplier=1.0,
+    ):
+        self.face_count = len(neighbors)
+        self.neighbors = neighbors
+        self.face_flags = face_flags
+        self.wall_multiplier = wall_multiplier
+        self.obstacle_multiplier = obstacle_multiplier
+        self._step_costs = {}
+
+    @classmethod
+    def from_mesh(cls, mesh: bpy.types.Mesh, merge_distance=0.001) -> NavmeshFaceGraph:
+        """Build graph from `mesh` once, merging vertices by `merge_distance` (as `get_edge_cost()` does).
+
+        Face costs use the scene's current `nav_graph_compute_settings` multipliers.
+        """
+        bm = bmesh.new()
+        try:
+            bm.from_mesh(mesh)
+            bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
+            bm.verts.index_update()
+            bm.faces.index_update()
+
+            vert_co = np.array([v.co for v in bm.verts], dtype=np.float64).reshape(-1, 3)
+            face_vert_indices = np.array(
+                [[v.index for v in face.verts[:3]] for face in bm.faces], dtype=np.int64
+            ).reshape(-1, 3)
+            centroids = vert_co[face_vert_indices].mean(axis=1)  # type: np.ndarray
+
+            face_neighbor_indices = []  # type: list[list[int]]
+            for face in bm.faces:
+                face_neighbor_indices.append(
+                    [other_face.index for edge in face.edges for other_face in edge.link_faces if other_face != face]
+                )
+
+            flags_layer = bm.faces.layers.int.get("nvm_face_flags")  # could be `None` for non-NVM meshes
+            if flags_layer is not None:
+                face_flags = [face[flags_layer] for face in bm.faces]
+            else:
+                face_flags = [0] * len(bm.faces)
+        finally:
+            bm.free()
+
+        # Compute all centroid distances in one go.
+        face_indices = np.repeat(
+            np.arange(len(face_neighbor_indices)), [len(indices) for indices in face_neighbor_indices]
+        )
+        neighbor_indices = np.fromiter(
+            itertools.chain.from_iterable(face_neighbor_indices), dtype=np.int64, count=face_indices.size
+        )
+        distances = np.linalg.norm(centroids[neighbor_indices] - centroids[face_indices], axis=1).tolist()
+        distance_iter = iter(distances)
+        neighbors = [
+            [(neighbor_i, next(distance_iter)) for neighbor_i in indices] for indices in face_neighbor_indices
+        ]
+
+        settings = bpy.context.scene.nav_graph_compute_settings
+        return cls(neighbors, face_flags, settings.wall_multiplier, settings.obstacle_multiplier)
+
+    def get_step_costs(self, all_faces_passable: bool) -> list[list[tuple[int, float]]]:
+        """Get (cached) lists of passable `(neighbor_face_index, step_cost)` tuples for each face."""
+        try:
+            return self._step_costs[all_faces_passable]
+        except KeyError:
+            pass
+        step_costs = []
+        for face_i, face_neighbors in enumerate(self.neighbors):
+            from_flags = self.face_flags[face_i]
+            face_step_costs = []
+            for neighbor_i, distance in face_neighbors:
+                cost = get_navmesh_flags_step_cost(
+                    from_flags,
+                    self.face_flags[neighbor_i],
+                    distance,
+                    all_faces_passable,
+                    self.wall_multiplier,
+                    self.obstacle_multiplier,
+                )
+                if not math.isinf(cost):
+                    face_step_costs.append((neighbor_i, cost))
+            step_costs.append(face_step_costs)
+        self._step_costs[all_faces_passable] = step_costs
+        return step_costs
+
+    def get_costs(self, start_face_i: int, end_face_indices: set[int], all_faces_passable=False) -> dict[int, float]:
+        """Find cheapest path costs from `start_face_i` to every face in `end_face_indices` with a single Dijkstra
+        search, which stops once all end faces are reached.
+
+        Unreachable end faces have infinite cost.
+        """
+        if not 0 <= start_face_i < self.face_count:
+            raise IndexError(f"Face index {start_face_i} is out of range for navmesh with {self.face_count} faces.")
+        step_costs = self.get_step_costs(all_faces_passable)
+        remaining = set(end_face_indices)
+        end_costs = {face_i: float("inf") for face_i in remaining}
+
+        best_costs = [float("inf")] * self.face_count
+        best_costs[start_face_i] = 0.0
+        open_set = [(0.0, start_face_i)]  # heap of `(cost, face_index)` tuples
+        while open_set and remaining:
+            cost, face_i = heapq.heappop(open_set)
+            if cost > best_costs[face_i]:
+                continue  # stale heap entry
+            if face_i in remaining:
+                end_costs[face_i] = cost
+                remaining.remove(face_i)
+            for neighbor_i, step_cost in step_costs[face_i]:
+                tentative_cost = cost + step_cost
+                if tentative_cost < best_costs[neighbor_i]:
+                    best_costs[neighbor_i] = tentative_cost
+                    heapq.heappush(open_set, (tentative_cost, neighbor_i))
+
+        return end_costs
+
+    def get_costs_with_fallback(self, start_face_i: int, end_face_indices: set[int]) -> dict[int, tuple[float, bool]]:
+        """As `get_costs()`, but any end faces that cannot be reached through passable face flags are searched for
+        again with all faces passable (like `a_star()` fallback).
+
+        Returns a dictionary mapping end face indices to `(cost, all_faces_passable)` tuples.
+        """
+        costs = {
+            face_i: (cost, False) for face_i, cost in self.get_costs(start_face_i, end_face_indices).items()
+        }
+        unreachable = {face_i for face_i, (cost, _) in costs.items() if math.isinf(cost)}
+        if unreachable:
+            for face_i, cost in self.get_costs(start_face_i, unreachable, all_faces_passable=True).items():
+                costs[face_i] = (cost, True)
+        return costs
+
+    def get_best_costs(self, face_indices: list[int]) -> dict[tuple[int, int], float]:
+        """Get the best edge cost (see `get_best_cost()`) between every pair of faces in `face_indices`.
+
+        Returns a dictionary mapping `(i, j)` (with `i < j`) positions in `face_indices` to costs. Cost is 0.0 if there
+        is no path in either direction.
+        """
+        unique_face_indices = set(face_indices)
+        for face_i in unique_face_indices:
+            if not 0 <= face_i < self.face_count:
+                raise IndexError(f"Face index {face_i} is out of range for navmesh with {self.face_count} faces.")
+        directed_costs = {
+            face_i: self.get_costs_with_fallback(face_i, unique_face_indices - {face_i})
+            for face_i in unique_face_indices
+        }
+        best_costs = {}
+        for i, face_i in enumerate(face_indices):
+            for j in range(i + 1, len(face_indices)):
+                face_j = face_indices[j]
+                if face_i == face_j:
+                    best_costs[i, j] = 0.0
+                    continue
+                best_costs[i, j] = _combine_directed_costs(
+                    directed_costs[face_i][face_j], directed_costs[face_j][face_i]
+                )
+        return best_costs
+
+
+# Offsets of a grid cell and its 26 neighbors.
+_NEIGHBOR_CELL_OFFSETS = np.array(list(itertools.product((-1, 0, 1), repeat=3)), dtype=np.int64)
+
+
+def get_touching_exit_clusters(
+    navmesh_exit_clusters: tp.Sequence[tp.Sequence[tp.Sequence[tuple[tp.Any, tp.Collection[tp.Sequence[float]]]]]],
+    max_distance: float,
+) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    """Find all pairs of exit face clusters in different navmeshes that touch.
+
+    `navmesh_exit_clusters` contains, for each navmesh, a sequence of clusters, each of which is a sequence of
+    `(face, face_vertex_coords)` tuples (with vertex coordinates in world space). Two clusters touch if a face in one
+    and a face in the other have at least two pairs of vertices that are closer than `max_distance` (i.e. share an
+    edge).
+
+    Vertices are hashed into a uniform grid with `max_distance` cells, so each vertex is only compared with the
+    vertices in its own and neighboring cells, rather than every exit vertex of every other navmesh.
+
+    Returns `((navmesh_index, cluster_index), (other_navmesh_index, other_cluster_index))` pairs with
+    `navmesh_index < other_navmesh_index`, sorted.
+    """
+    if max_distance <= 0.0:
+        return []
+
+    face_clusters = []  # type: list[tuple[int, int]]
+    vertex_coords = []
+    vertex_face_indices = []
+    for navmesh_index, exit_clusters in enumerate(navmesh_exit_clusters):
+        for cluster_index, cluster in enumerate(exit_clusters):
+            for _, face_verts in cluster:
+                face_index = len(face_clusters)
+                face_clusters.append((navmesh_index, cluster_index))
+                for v in face_verts:
+                    vertex_coords.append(v[:3])
+                    vertex_face_indices.append(face_index)
+    if not vertex_coords:
+        return []
+
+    coords = np.array(vertex_coords, dtype=np.float64)
+    vertex_faces = np.array(vertex_face_indices, dtype=np.int64)
+    vertex_navmeshes = np.array([face_clusters[i][0] for i in vertex_face_indices], dtype=np.int64)
+
+    # Encode grid cell of every vertex (padded by one cell on each side for neighbor offsets) as a single integer key.
+    cells = np.floor(coords / max_distance).astype(np.int64)
+    cells -= cells.min(axis=0) - 1
+    cell_dims = cells.max(axis=0) + 2
+    cell_radix = np.array([cell_dims[1] * cell_dims[2], cell_dims[2], 1], dtype=np.int64)
+    cell_keys = cells @ cell_radix
+    sort_order = np.argsort(cell_keys, kind="stable")
+    sorted_cell_keys = cell_keys[sort_order]
+
+    max_sq_distance = max_distance ** 2
+    close_face_pairs = []
+    for offset in _NEIGHBOR_CELL_OFFSETS:
+        # Find the range of vertices in this neighbor cell of every vertex, then expand ranges to vertex pairs.
+        query_keys = cell_keys + offset @ cell_radix
+        starts = np.searchsorted(sorted_cell_keys, query_keys, side="left")
+        counts = np.searchsorted(sorted_cell_keys, query_keys, side="right") - starts
+        total = counts.sum()
+        if total == 0:
+            continue
+        a = np.repeat(np.arange(coords.shape[0]), counts)
+        b = sort_order[np.arange(total) - np.repeat(np.cumsum(counts) - counts - starts, counts)]
+        # Only compare vertices in different navmeshes (once per pair of navmeshes).
+        a_b_mask = vertex_navmeshes[a] < vertex_navmeshes[b]
+        a, b = a[a_b_mask], b[a_b_mask]
+        close_mask = np.sum((coords[a] - coords[b]) ** 2, axis=1) < max_sq_distance
+        close_face_pairs.append(np.stack((vertex_faces[a[close_mask]], vertex_faces[b[close_mask]]), axis=1))
+
+    if not close_face_pairs:
+        return []
+    close_face_pairs = np.concatenate(close_face_pairs)
+    if close_face_pairs.size == 0:
+        return []
+
+    # Faces with at least two close vertex pairs share an edge.
+    face_pairs, pair_counts = np.unique(close_face_pairs, axis=0, return_counts=True)
+    touching = {
+        (face_clusters[face_a], face_clusters[face_b])
+        for face_a, face_b in face_pairs[pair_counts >= 2].tolist()
+    }
+    return sorted(touching)
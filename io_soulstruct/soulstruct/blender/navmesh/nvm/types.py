@@ -9,7 +9,6 @@ import typing as tp
 
 import numpy as np
 
-import bmesh
 import bpy
 from mathutils import Vector
 
@@ -18,7 +17,12 @@ from soulstruct.blender.exceptions import NVMExportError
 from soulstruct.blender.types import *
 from soulstruct.blender.utilities import *
 from .properties import *
-from .utilities import set_face_material
+from .utilities import get_face_flags_material_index
+
+
+# Names of `int` face attributes (`BMesh` face int layers) that store `NVMTriangle` data.
+NVM_FACE_FLAGS = "nvm_face_flags"
+NVM_FACE_OBSTACLE_COUNT = "nvm_face_obstacle_count"
 
 
 class BlenderNVM(BaseBlenderSoulstructObject[NVM, NVMProps]):
@@ -46,43 +50,31 @@ class BlenderNVM(BaseBlenderSoulstructObject[NVM, NVMProps]):
 
         nvm = soulstruct_obj
 
-        # Create mesh.
-        mesh = bpy.data.meshes.new(name=name)
-        vertices = game_vector_array_to_bl_vector_array(nvm.vertices)
-        edges = []  # no edges in NVM
-        faces = [triangle.vertex_indices for triangle in nvm.triangles]
-        mesh.from_pydata(vertices, edges, faces)
-
-        # Create `BMesh` (as we need to assign face flag data to a custom `int` layer).
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-        flags_layer = bm.faces.layers.int.new("nvm_face_flags")
-        obstacle_count_layer = bm.faces.layers.int.new("nvm_face_obstacle_count")
-        for f_i, face in enumerate(bm.faces):
-            nvm_triangle = nvm.triangles[f_i]
-            face[flags_layer] = nvm_triangle.flags
-            face[obstacle_count_layer] = nvm_triangle.obstacle_count
+        # Create mesh from arrays.
+        vertices = game_vector_array_to_bl_vector_array(nvm.vertices).astype(np.float32)
+        faces = np.array([triangle.vertex_indices for triangle in nvm.triangles], dtype=np.int32).reshape(-1, 3)
+        mesh = new_mesh_from_arrays(name, vertices, faces)  # no edges in NVM
+
+        # Store face flags and obstacle counts in `int` face attributes (also accessible as `BMesh` face int layers).
+        flags = np.fromiter((triangle.flags for triangle in nvm.triangles), dtype=np.int32, count=len(faces))
+        obstacle_counts = np.fromiter(
+            (triangle.obstacle_count for triangle in nvm.triangles), dtype=np.int32, count=len(faces)
+        )
+        mesh.attributes.new(NVM_FACE_FLAGS, "INT", "FACE").data.foreach_set("value", flags)
+        mesh.attributes.new(NVM_FACE_OBSTACLE_COUNT, "INT", "FACE").data.foreach_set("value", obstacle_counts)
 
         bl_nvm = cls.new(name, data=mesh, collection=collection)  # type: BlenderNVM
 
+        face_centers = vertices[faces].mean(axis=1)
         for nvm_event in nvm.event_entities:
             # Get the average position of the faces. This is purely for show and is not exported.
-            avg_pos = Vector((0, 0, 0))
-            for i in nvm_event.triangle_indices:
-                face = bm.faces[i]
-                avg_pos += face.calc_center_median()
-            avg_pos /= len(nvm_event.triangle_indices)
+            avg_pos = Vector(face_centers[nvm_event.triangle_indices].mean(axis=0))
             nvm_event_name = f"{name} Event {nvm_event.entity_id}"
             bl_event = BlenderNVMEventEntity.new_from_soulstruct_obj(
                 operator, context, nvm_event, nvm_event_name, collection, location=avg_pos
             )
             bl_event.obj.parent = bl_nvm.obj
 
-        bm.to_mesh(mesh)
-        del bm
-
         return bl_nvm
 
     def get_nvm_event_entities(self) -> list[BlenderNVMEventEntity]:
@@ -101,68 +93,50 @@ class BlenderNVM(BaseBlenderSoulstructObject[NVM, NVMProps]):
         triangles actually matter for navigation.
         """
         mesh_data = self.obj.data
-        nvm_verts = np.array([vert.co for vert in mesh_data.vertices], dtype=np.float32)
+        nvm_verts = np.empty(len(mesh_data.vertices) * 3, dtype=np.float32)
+        mesh_data.vertices.foreach_get("co", nvm_verts)
         # Swap Y and Z coordinates.
-        nvm_verts[:, [1, 2]] = nvm_verts[:, [2, 1]]
-
-        nvm_faces = []  # type: list[tuple[int, int, int]]
-        for face in mesh_data.polygons:
-            if len(face.vertices) != 3:
-                raise NVMExportError(
-                    f"Found a non-triangle mesh face in NVM {self.name} (face {face.index}). You must triangulate it."
-                )
-            # noinspection PyTypeChecker
-            vertices = tuple(face.vertices)  # type: tuple[int, int, int]
-            nvm_faces.append(vertices)
-
-        def find_connected_face_index(edge_v1: int, edge_v2: int, not_face) -> int:
-            """Find face that shares an edge with the given edge.
-
-            Returns -1 if no connected face is found (i.e. edge is on the edge of the mesh).
-            """
-            # TODO: Could surely iterate over faces just once for this?
-            for i_, f_ in enumerate(nvm_faces):
-                if f_ != not_face and edge_v1 in f_ and edge_v2 in f_:  # order doesn't matter
-                    return i_
-            return -1
+        nvm_verts = nvm_verts.reshape(-1, 3)[:, [0, 2, 1]]
+
+        face_count = len(mesh_data.polygons)
+        loop_totals = np.empty(face_count, dtype=np.int32)
+        mesh_data.polygons.foreach_get("loop_total", loop_totals)
+        if (non_triangles := np.flatnonzero(loop_totals != 3)).size > 0:
+            raise NVMExportError(
+                f"Found a non-triangle mesh face in NVM {self.name} (face {non_triangles[0]}). You must triangulate it."
+            )
+        loop_starts = np.empty(face_count, dtype=np.int32)
+        mesh_data.polygons.foreach_get("loop_start", loop_starts)
+        loop_vertex_indices = np.empty(len(mesh_data.loops), dtype=np.int32)
+        mesh_data.loops.foreach_get("vertex_index", loop_vertex_indices)
+        face_array = loop_vertex_indices[loop_starts[:, np.newaxis] + np.arange(3)]
+        nvm_faces = [tuple(face) for face in face_array.tolist()]  # type: list[tuple[int, int, int]]
 
         # Get connected faces along each edge of each face.
-        nvm_connected_face_indices = []  # type: list[tuple[int, int, int]]
-        for face in nvm_faces:
-            connected_v1 = find_connected_face_index(face[0], face[1], face)
-            connected_v2 = find_connected_face_index(face[1], face[2], face)
-            connected_v3 = find_connected_face_index(face[2], face[0], face)
-            nvm_connected_face_indices.append((connected_v1, connected_v2, connected_v3))
-            if connected_v1 == -1 and connected_v2 == -1 and connected_v3 == -1:
-                operator.warning(
-                    f"NVM face {face} in '{self.name}' appears to have no connected faces, which is very suspicious!"
-                )
-
-        # Create `BMesh` to access custom face layers for `flags` and `obstacle_count`.
-        bm = bmesh.new()
-        bm.from_mesh(mesh_data)
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-
-        flags_layer = bm.faces.layers.int.get("nvm_face_flags")
-        if not flags_layer:
-            raise ValueError("NVM mesh does not have 'nvm_face_flags' custom face layer.")
-        obstacle_count_layer = bm.faces.layers.int.get("nvm_face_obstacle_count")
-        if not obstacle_count_layer:
-            raise ValueError("NVM mesh does not have 'nvm_face_obstacle_count' custom face layer.")
-
-        nvm_flags = []
-        nvm_obstacle_counts = []
-        for bm_face in bm.faces:
-            nvm_flags.append(bm_face[flags_layer])
-            nvm_obstacle_counts.append(bm_face[obstacle_count_layer])
-        if len(nvm_flags) != len(nvm_faces):
-            raise ValueError("NVM mesh has different number of `Mesh` faces and `BMesh` face flags.")
+        nvm_connected_face_indices, non_manifold_edges = get_triangle_edge_adjacency(face_array)
+        if len(non_manifold_edges) > 0:
+            edges_str = ", ".join(str(tuple(edge)) for edge in non_manifold_edges[:10].tolist())
+            if len(non_manifold_edges) > 10:
+                edges_str += ", ..."
+            operator.warning(
+                f"NVM '{self.name}' has {len(non_manifold_edges)} edge(s) shared by more than two faces. Only the "
+                f"lowest-index other face will be connected across them. Edge vertex indices: {edges_str}"
+            )
+        for face_index in np.flatnonzero(np.all(nvm_connected_face_indices == -1, axis=1)):
+            operator.warning(
+                f"NVM face {nvm_faces[face_index]} in '{self.name}' appears to have no connected faces, which is very "
+                f"suspicious!"
+            )
+        nvm_connected_face_indices = nvm_connected_face_indices.tolist()
+
+        # Read `flags` and `obstacle_count` from custom face attributes.
+        nvm_flags = self._get_int_face_attribute(NVM_FACE_FLAGS).tolist()
+        nvm_obstacle_counts = self._get_int_face_attribute(NVM_FACE_OBSTACLE_COUNT).tolist()
 
         nvm_triangles = [
             NVMTriangle(
                 vertex_indices=nvm_faces[i],
-                connected_indices=nvm_connected_face_indices[i],
+                connected_indices=tuple(nvm_connected_face_indices[i]),
                 obstacle_count=nvm_obstacle_counts[i],
                 flags=nvm_flags[i],
             )
@@ -184,10 +158,28 @@ class BlenderNVM(BaseBlenderSoulstructObject[NVM, NVMProps]):
 
         return nvm
 
+    def _get_int_face_attribute(self, attribute_name: str) -> np.ndarray:
+        attribute = self.data.attributes.get(attribute_name)
+        if not attribute or attribute.domain != "FACE" or attribute.data_type != "INT":
+            raise ValueError(f"NVM mesh does not have '{attribute_name}' custom face layer.")
+        values = np.empty(len(self.data.polygons), dtype=np.int32)
+        attribute.data.foreach_get("value", values)
+        return values
+
     def set_face_materials(self, nvm: NVM):
         mesh_data = self.obj.data
-        for bl_tri, nvm_triangle in zip(mesh_data.polygons, nvm.triangles, strict=True):
-            set_face_material(mesh_data, bl_tri, nvm_triangle.flags)
+        if len(nvm.triangles) != len(mesh_data.polygons):
+            raise ValueError(
+                f"NVM has {len(nvm.triangles)} triangles, but mesh '{mesh_data.name}' has {len(mesh_data.polygons)} "
+                f"faces."
+            )
+        flags = np.fromiter((triangle.flags for triangle in nvm.triangles), dtype=np.int64, count=len(nvm.triangles))
+        unique_flags, first_indices, inverse = np.unique(flags, return_index=True, return_inverse=True)
+        # Add materials to mesh in order of first use, as when setting them face by face.
+        unique_material_indices = np.empty(len(unique_flags), dtype=np.int32)
+        for i in np.argsort(first_indices):
+            unique_material_indices[i] = get_face_flags_material_index(mesh_data, int(unique_flags[i]))
+        mesh_data.polygons.foreach_set("material_index", unique_material_indices[inverse.ravel()])
 
     def create_nvm_quadtree(
         self, context: bpy.types.Context, nvm: NVM, model_name: str, collection: bpy.types.Collection = None
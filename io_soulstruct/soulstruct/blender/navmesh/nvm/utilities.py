@@ -7,6 +7,7 @@ __all__ = [
     "NAVMESH_FLAG_COLORS",
     "NAVMESH_MULTIPLE_FLAG_COLOR",
     "set_face_material",
+    "get_face_flags_material_index",
     "get_navmesh_material",
 ]
 
@@ -55,6 +56,15 @@ def set_face_material(bl_mesh, bl_face, face_flags: int):
 
     NOTE: `bl_face` can be from a `Mesh` or `BMesh`. Both have `material_index`.
     """
+    bl_face.material_index = get_face_flags_material_index(bl_mesh, face_flags)
+    return bl_mesh.materials[bl_face.material_index]
+
+
+def get_face_flags_material_index(bl_mesh, face_flags: int) -> int:
+    """Get index of the material for `NVMTriangle` flags in `bl_mesh` materials, adding it to the mesh if absent.
+
+    Use this to set many faces' `material_index` at once (e.g. with `foreach_set`).
+    """
 
     # Color face according to its single `flag` if present.
     try:
@@ -66,15 +76,11 @@ def set_face_material(bl_mesh, bl_face, face_flags: int):
 
     material_index = bl_mesh.materials.find(material_name)
     if material_index >= 0:
-        bl_face.material_index = material_index
-        return bl_mesh.materials[material_name]
-
-    bl_material = get_navmesh_material(flag)
+        return material_index
 
-    # Add material to this mesh and this face.
-    bl_face.material_index = len(bl_mesh.materials)
-    bl_mesh.materials.append(bl_material)
-    return bl_material
+    # Add material to this mesh.
+    bl_mesh.materials.append(get_navmesh_material(flag))
+    return len(bl_mesh.materials) - 1
 
 
 def get_navmesh_material(flag: int | NavmeshFlag) -> bpy.types.Material:
@@ -41,10 +41,9 @@ class NVMHKTImporter:
             bpy.ops.object.mode_set(mode="OBJECT", toggle=False)
 
         # Create mesh.
-        bl_mesh = bpy.data.meshes.new(name=name)
         mesh = nvmhkt.get_simple_mesh(merge_dist=vertex_merge_dist)
         vertices = game_vector_array_to_bl_vector_array(mesh.vertices)
-        bl_mesh.from_pydata(vertices, [], mesh.faces)
+        bl_mesh = new_mesh_from_arrays(name, vertices, mesh.faces)
         # noinspection PyTypeChecker
         mesh_obj = bpy.data.objects.new(name, bl_mesh)  # type: bpy.types.MeshObject
         self.collection.objects.link(mesh_obj)
@@ -0,0 +1,149 @@
+"""Process pool and picklable worker functions for CPU-heavy work that does not need Blender, e.g. packing game files.
+
+This module must NOT import `bpy` (directly, or via any `soulstruct.blender` subpackage `__init__`), as worker processes
+run in a plain Python interpreter and import worker functions from here.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "get_process_pool",
+    "pack_game_file",
+    "read_map_collision",
+    "read_animation_hkx_entry",
+    "AnimationArmatureArrays",
+    "init_animation_worker",
+    "read_animation_armature_arrays",
+    "load_remo_cut_parts",
+]
+
+import multiprocessing
+import typing as tp
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+if tp.TYPE_CHECKING:
+    from soulstruct.base.base_binary_file import BaseBinaryFile
+    from soulstruct.containers import BinderEntry
+    from soulstruct.havok.core import HKX
+    from soulstruct.havok.fromsoft.base import BaseAnimationHKX, BaseSkeletonHKX
+    from soulstruct.havok.fromsoft.darksouls1r.remobnd import RemoCut, RemoPart, RemoPartType
+    from soulstruct.havok.fromsoft.shared import MapCollisionModel
+
+
+def get_process_pool(max_workers: int = None, initializer: tp.Callable = None, initargs=()) -> ProcessPoolExecutor:
+    """Create a process pool that spawns fresh interpreters, as forking Blender's process is not safe.
+
+    `initializer(*initargs)` is called once in each worker process, e.g. to receive shared data only once.
+    """
+    return ProcessPoolExecutor(
+        max_workers, mp_context=multiprocessing.get_context("spawn"), initializer=initializer, initargs=initargs
+    )
+
+
+def pack_game_file(game_file: BaseBinaryFile) -> bytes:
+    """Pack `game_file` (including any DCX compression)."""
+    return game_file.to_bytes()
+
+
+def read_map_collision(data: bytes) -> MapCollisionModel:
+    """Decompress DCX (if needed) and parse a map collision HKX from uncompressed Binder entry `data`."""
+    from soulstruct.havok.fromsoft.shared import MapCollisionModel
+
+    return MapCollisionModel.from_bytes(data)
+
+
+def read_animation_hkx_entry(hkx_entry: BinderEntry, compendium: HKX = None) -> BaseAnimationHKX:
+    """Read animation HKX file from a Binder entry and return the appropriate `AnimationHKX` subclass instance."""
+    from soulstruct.havok.fromsoft import demonssouls, darksouls1ptde, darksouls1r, bloodborne, eldenring
+    from soulstruct.blender.exceptions import UnsupportedGameError
+
+    data = hkx_entry.get_uncompressed_data()
+    packfile_version = data[0x28:0x38]
+    tagfile_version = data[0x10:0x18]
+    if packfile_version.startswith(b"Havok-4.5.0-r1"):  # DeS (c9900)
+        hkx = demonssouls.AnimationHKX.from_bytes(data, compendium=compendium)
+    elif packfile_version.startswith(b"Havok-5.5.0-r1"):  # DeS
+        hkx = demonssouls.AnimationHKX.from_bytes(data, compendium=compendium)
+    elif packfile_version.startswith(b"hk_2010.2.0-r1"):  # PTDE
+        hkx = darksouls1ptde.AnimationHKX.from_bytes(data, compendium=compendium)
+    elif tagfile_version == b"20150100":  # DSR
+        hkx = darksouls1r.AnimationHKX.from_bytes(data, compendium=compendium)
+    elif packfile_version.startswith(b"hk_2014.1.0-r1"):  # BB
+        hkx = bloodborne.AnimationHKX.from_bytes(data, compendium=compendium)
+    elif tagfile_version == b"20180100":  # ER
+        hkx = eldenring.AnimationHKX.from_bytes(data, compendium=compendium)
+    else:
+        raise UnsupportedGameError(
+            f"Cannot support this HKX skeleton file version in Soulstruct and/or Blender.\n"
+            f"   Possible packfile version: {packfile_version}\n"
+            f"   Possible tagfile version: {tagfile_version}"
+        )
+    hkx.path = Path(hkx_entry.name)
+    return hkx
+
+
+class AnimationArmatureArrays(tp.NamedTuple):
+    """Decompressed HKX animation, as compact arrays that are cheap to send between processes."""
+    track_bone_names: list[str]
+    # `(frames, tracks, 10)` armature-space transforms: translate XYZ, rotate XYZW, scale XYZ.
+    frame_transforms: np.ndarray
+    # Raw `(samples, 4)` reference frame (root motion) samples in game space, or `None`.
+    root_motion: np.ndarray | None
+
+
+# Skeleton and compendium shared by all animations read by this worker process. Set by `init_animation_worker()`.
+_worker_skeleton_hkx = None  # type: BaseSkeletonHKX | None
+_worker_compendium = None  # type: HKX | None
+
+
+def init_animation_worker(skeleton_hkx: BaseSkeletonHKX, compendium: HKX | None):
+    """Process pool `initializer` for `read_animation_armature_arrays()`."""
+    global _worker_skeleton_hkx, _worker_compendium
+    _worker_skeleton_hkx = skeleton_hkx
+    _worker_compendium = compendium
+
+
+def read_animation_armature_arrays(hkx_entry: BinderEntry) -> AnimationArmatureArrays:
+    """Read, decompress (if spline- or wavelet-compressed), and convert animation HKX entry to armature space, using
+    the skeleton set by `init_animation_worker()`."""
+    animation_hkx = read_animation_hkx_entry(hkx_entry, _worker_compendium)
+    if not animation_hkx.animation_container.is_interleaved:
+        animation_hkx = animation_hkx.to_interleaved_hkx()
+    container = animation_hkx.animation_container
+
+    skeleton = _worker_skeleton_hkx.skeleton
+    track_bone_names = [skeleton.bones[i].name for i in container.get_track_bone_indices()]
+    arma_frames = list(container.get_interleaved_data_in_armature_space(skeleton))
+    # Explicit frame count, as `-1` cannot be inferred for animations with no transform tracks.
+    frame_transforms = np.array([
+        [
+            (
+                trs.translation.x, trs.translation.y, trs.translation.z,
+                trs.rotation.x, trs.rotation.y, trs.rotation.z, trs.rotation.w,
+                trs.scale.x, trs.scale.y, trs.scale.z,
+            )
+            for trs in frame
+        ]
+        for frame in arma_frames
+    ], dtype=np.float64).reshape(len(arma_frames), len(track_bone_names), 10)
+
+    try:
+        root_motion = np.array(container.get_reference_frame_samples())
+    except (ValueError, TypeError):
+        root_motion = None
+
+    return AnimationArmatureArrays(track_bone_names, frame_transforms, root_motion)
+
+
+def load_remo_cut_parts(
+    cut: RemoCut, main_map_area_block: tuple[int, int]
+) -> dict[RemoPartType, dict[str, RemoPart]]:
+    """Load placeholder Remo parts (without `MSB` references) of a single `RemoBND` cut.
+
+    The returned parts only have armature-space frames for that cut.
+    """
+    cut_remo_parts = {}  # type: dict[RemoPartType, dict[str, RemoPart]]
+    cut.load_remo_parts(main_map_area_block, cut_remo_parts, msbs=None)
+    return cut_remo_parts
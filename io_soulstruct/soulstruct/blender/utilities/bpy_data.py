@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 __all__ = [
+    "new_mesh_from_arrays",
     "new_mesh_object",
     "new_armature_object",
     "new_empty_object",
@@ -15,6 +16,7 @@ __all__ = [
 import typing as tp
 
 import bpy
+import numpy as np
 
 from .misc import remove_dupe_suffix
 from .bpy_types import ObjectType, SoulstructType
@@ -23,6 +25,43 @@ if tp.TYPE_CHECKING:
     PROPS_TYPE = tp.Union[tp.Dict[str, tp.Any], bpy.types.Object, None]
 
 
+def new_mesh_from_arrays(
+    name: str,
+    vertices: np.ndarray,
+    faces: np.ndarray | None = None,
+    face_material_indices: np.ndarray | None = None,
+    edges: np.ndarray | None = None,
+) -> bpy.types.Mesh:
+    """Create a new Mesh from Blender-space `vertices` (N, 3) and fixed-size `faces` (F, K) of vertex indices with
+    bulk `foreach_set` calls, which is much faster than `Mesh.from_pydata()` for large meshes.
+
+    `face_material_indices` (F,) are assigned to polygon `material_index` if given; the caller must append materials.
+    `edges` (E, 2) are only needed for loose edges, as face edges are calculated automatically.
+    """
+    vertices = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+    mesh = bpy.data.meshes.new(name=name)
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", vertices.ravel())
+
+    if edges is not None and len(edges) > 0:
+        edges = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+        mesh.edges.add(len(edges))
+        mesh.edges.foreach_set("vertices", edges.ravel())
+
+    if faces is not None and len(faces) > 0:
+        faces = np.asarray(faces, dtype=np.int32)
+        face_count, face_size = faces.shape
+        mesh.loops.add(faces.size)
+        mesh.loops.foreach_set("vertex_index", faces.ravel())
+        mesh.polygons.add(face_count)
+        mesh.polygons.foreach_set("loop_start", np.arange(0, faces.size, face_size, dtype=np.int32))
+        if face_material_indices is not None:
+            mesh.polygons.foreach_set("material_index", np.asarray(face_material_indices, dtype=np.int32))
+
+    mesh.update(calc_edges=True)
+    return mesh
+
+
 def new_mesh_object(
     name: str, data: bpy.types.Mesh, soulstruct_type: SoulstructType = SoulstructType.NONE
 ) -> bpy.types.MeshObject:
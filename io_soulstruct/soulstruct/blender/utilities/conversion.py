@@ -7,6 +7,7 @@ __all__ = [
     "to_game",
     "bl_vector_array_to_game_vector_array",
     "bl_matrix_to_game_trs",
+    "bl_matrix_array_to_game_trs_list",
     "FSTransform",
     "BLTransform",
 ]
@@ -29,6 +30,8 @@ from mathutils import (
 from soulstruct.utilities.maths import Vector3, EulerDeg, EulerRad, Matrix3, Matrix4
 from soulstruct.havok.utilities.maths import TRSTransform, Quaternion as FSQuaternion
 
+from .maths import decompose_matrix_arrays, get_continuous_quaternion_arrays
+
 
 # This is the CoB matrix that all the functions below are effectively applying. (They just do it in a more efficient
 # way than actually multiplying by this matrix.) It is also its own inverse.
@@ -115,6 +118,24 @@ def bl_matrix_to_game_trs(matrix: BLMatrix) -> TRSTransform:
     game_scale = to_game(bl_scale)
     return TRSTransform(game_translate, game_rotate, game_scale)
 
+
+def bl_matrix_array_to_game_trs_list(matrices: np.ndarray, continuous_rotations=True) -> list[TRSTransform]:
+    """Convert `(N, 4, 4)` Blender matrices (e.g. one bone's armature matrix on every frame) to game `TRSTransform`s.
+
+    Same conversion as `bl_matrix_to_game_trs()`, with decomposition done for all matrices at once. If
+    `continuous_rotations` is True, rotations are negated as needed to keep each one in the same hemisphere as the last.
+    """
+    bl_translates, bl_rotates, bl_scales = decompose_matrix_arrays(matrices)
+    if continuous_rotations:
+        bl_rotates = get_continuous_quaternion_arrays(bl_rotates)
+    game_translates = bl_translates[:, [0, 2, 1]]
+    game_rotates = np.c_[-bl_rotates[:, 1], -bl_rotates[:, 3], -bl_rotates[:, 2], bl_rotates[:, 0]]  # XYZW
+    game_scales = bl_scales[:, [0, 2, 1]]
+    return [
+        TRSTransform(Vector3(t), FSQuaternion(r), Vector3(s))
+        for t, r, s in zip(game_translates.tolist(), game_rotates.tolist(), game_scales.tolist())
+    ]
+
 # =========================
 # Blender -> Game  (inverse)
 # =========================
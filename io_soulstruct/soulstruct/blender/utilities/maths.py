@@ -2,6 +2,13 @@ from __future__ import annotations
 
 __all__ = [
     "np_cross",
+    "get_valid_triangle_mask",
+    "get_triangle_edge_adjacency",
+    "quaternion_arrays_to_rotation_matrices",
+    "rotation_matrices_to_quaternion_arrays",
+    "decompose_matrix_arrays",
+    "compose_matrix_arrays",
+    "get_continuous_quaternion_arrays",
 ]
 
 import numpy as np
@@ -15,3 +22,189 @@ def np_cross(array_a: np.ndarray, array_b: np.ndarray) -> np.ndarray:
     See line 506 in `numpy/core/numeric.pyi`.
     """
     return np.cross(array_a, array_b)
+
+
+def get_valid_triangle_mask(
+    face_vertex_indices: np.ndarray, remove_duplicates=True, face_groups: np.ndarray = None
+) -> np.ndarray:
+    """Get a 1D boolean mask of the rows of `(N, 3)` triangle vertex index array that should be kept.
+
+    Degenerate triangles (any vertex index repeated) are always masked out. If `remove_duplicates` is True, all but
+    the first occurrence of any triangle using the same vertices in the same winding order (i.e. same indices up to
+    cyclic rotation) are also masked out. Triangles with the same vertices but opposite winding are NOT duplicates, as
+    they face in opposite directions (e.g. double-sided geometry).
+
+    If `face_groups` (1D, length N) is given, triangles are only duplicates if they also have the same group value,
+    e.g. the same material index (so overlay/decal faces that reuse vertices with another material are kept).
+
+    Fully vectorized: safe to use on arrays with millions of faces.
+    """
+    a, b, c = face_vertex_indices[:, 0], face_vertex_indices[:, 1], face_vertex_indices[:, 2]
+    mask = (a != b) & (b != c) & (c != a)
+
+    if not remove_duplicates:
+        return mask
+
+    valid_indices = np.flatnonzero(mask)
+    if valid_indices.size < 2:
+        return mask
+
+    # Rotate each (valid) triangle so its smallest vertex index comes first, which preserves winding order but gives
+    # every rotation of the same triangle an identical row.
+    valid_faces = face_vertex_indices[valid_indices]
+    first_columns = np.argmin(valid_faces, axis=1)
+    rotated_faces = np.take_along_axis(valid_faces, (first_columns[:, np.newaxis] + np.arange(3)) % 3, axis=1)
+
+    # Stable sort keeps original face order within each run of identical rows, so every row that matches its
+    # predecessor is a later duplicate.
+    if rotated_faces.max() < 2 ** 21:
+        # Pack each row into a single 63-bit key, which sorts much faster than a three-key `lexsort`.
+        rotated_faces = rotated_faces.astype(np.int64)
+        sort_keys = [(rotated_faces[:, 0] << 42) | (rotated_faces[:, 1] << 21) | rotated_faces[:, 2]]
+    else:
+        sort_keys = [rotated_faces[:, 2], rotated_faces[:, 1], rotated_faces[:, 0]]
+    if face_groups is not None:
+        sort_keys.append(face_groups[valid_indices])  # primary `lexsort` key
+    if len(sort_keys) == 1:
+        order = np.argsort(sort_keys[0], kind="stable")
+    else:
+        order = np.lexsort(sort_keys)  # also stable
+    is_duplicate = np.ones(valid_indices.size, dtype=bool)
+    is_duplicate[0] = False
+    for key in sort_keys:
+        sorted_key = key[order]
+        is_duplicate[1:] &= sorted_key[1:] == sorted_key[:-1]
+    mask[valid_indices[order[is_duplicate]]] = False
+
+    return mask
+
+
+def get_triangle_edge_adjacency(face_vertex_indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Find the neighboring triangle across each edge of each triangle in `(F, 3)` vertex index array.
+
+    Edge `k` of triangle `f` connects vertices `[f, k]` and `[f, (k + 1) % 3]`. Edge direction is ignored.
+
+    Returns:
+        connected_face_indices: `(F, 3)` int32 array of the (lowest) index of the other triangle sharing each edge, or
+            -1 if no other triangle shares it (boundary edge).
+        non_manifold_edges: `(N, 2)` array of sorted vertex index pairs for edges shared by more than two triangles.
+            These still get the lowest-index other triangle as their neighbor, but callers should report them.
+
+    Runs in one pass over the sorted edge keys, rather than checking every pair of triangles.
+    """
+    face_count = len(face_vertex_indices)
+    half_edges = face_vertex_indices[:, [0, 1, 1, 2, 2, 0]].reshape(face_count * 3, 2).astype(np.int64)
+    low, high = half_edges.min(axis=1), half_edges.max(axis=1)
+    edge_keys = low * (high.max(initial=0) + 1) + high
+    half_edge_faces = np.repeat(np.arange(face_count), 3)
+
+    # Stable sort keeps each edge's triangles in ascending face index order.
+    order = np.argsort(edge_keys, kind="stable")
+    sorted_keys = edge_keys[order]
+    is_group_start = np.ones(sorted_keys.size, dtype=bool)
+    is_group_start[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    group_starts = np.flatnonzero(is_group_start)
+    group_sizes = np.diff(np.append(group_starts, sorted_keys.size))
+    group_indices = np.cumsum(is_group_start) - 1
+
+    # Each half-edge's neighbor is the first triangle in its group, or the second triangle if it is the first itself.
+    sorted_faces = half_edge_faces[order]
+    first_faces = sorted_faces[group_starts]
+    second_faces = np.full(group_starts.size, -1, dtype=np.int64)
+    has_second = group_sizes > 1
+    second_faces[has_second] = sorted_faces[group_starts[has_second] + 1]
+    sorted_first_faces = first_faces[group_indices]
+    sorted_neighbors = np.where(sorted_faces != sorted_first_faces, sorted_first_faces, second_faces[group_indices])
+    sorted_neighbors[sorted_neighbors == sorted_faces] = -1  # e.g. degenerate triangle with a repeated edge
+
+    connected_face_indices = np.empty(sorted_keys.size, dtype=np.int32)
+    connected_face_indices[order] = sorted_neighbors
+    non_manifold_starts = order[group_starts[group_sizes > 2]]
+    non_manifold_edges = np.stack((low[non_manifold_starts], high[non_manifold_starts]), axis=1)
+    return connected_face_indices.reshape(face_count, 3), non_manifold_edges
+
+
+def quaternion_arrays_to_rotation_matrices(quaternions: np.ndarray) -> np.ndarray:
+    """Convert `(N, 4)` WXYZ quaternions (normalized here, like Blender does for pose bones) to `(N, 3, 3)` rotation
+    matrices."""
+    norms = np.linalg.norm(quaternions, axis=1, keepdims=True)
+    q = np.where(norms > 0.0, quaternions / np.where(norms > 0.0, norms, 1.0), (1.0, 0.0, 0.0, 0.0))  # zero -> identity
+    w, x, y, z = q.T
+    rotmats = np.empty((len(q), 3, 3), dtype=q.dtype)
+    rotmats[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    rotmats[:, 0, 1] = 2.0 * (x * y - w * z)
+    rotmats[:, 0, 2] = 2.0 * (x * z + w * y)
+    rotmats[:, 1, 0] = 2.0 * (x * y + w * z)
+    rotmats[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    rotmats[:, 1, 2] = 2.0 * (y * z - w * x)
+    rotmats[:, 2, 0] = 2.0 * (x * z - w * y)
+    rotmats[:, 2, 1] = 2.0 * (y * z + w * x)
+    rotmats[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return rotmats
+
+
+def rotation_matrices_to_quaternion_arrays(rotmats: np.ndarray) -> np.ndarray:
+    """Convert `(N, 3, 3)` orthonormal rotation matrices to `(N, 4)` WXYZ unit quaternions with non-negative W (which
+    matches `mathutils.Matrix.to_quaternion()`).
+
+    Each row uses whichever of the four standard formulas has the largest (most numerically stable) divisor.
+    """
+    m00, m01, m02 = rotmats[:, 0, 0], rotmats[:, 0, 1], rotmats[:, 0, 2]
+    m10, m11, m12 = rotmats[:, 1, 0], rotmats[:, 1, 1], rotmats[:, 1, 2]
+    m20, m21, m22 = rotmats[:, 2, 0], rotmats[:, 2, 1], rotmats[:, 2, 2]
+    traces = np.stack([m00 + m11 + m22, m00 - m11 - m22, m11 - m00 - m22, m22 - m00 - m11], axis=1)
+    cases = np.argmax(np.stack([traces[:, 0], m00, m11, m22], axis=1), axis=1)
+    # Four times the largest quaternion component for each row.
+    d = 2.0 * np.sqrt(np.maximum(1.0 + traces[np.arange(len(cases)), cases], 1e-12))
+
+    # Columns: (W, X, Y, Z) * d for each case.
+    skew = np.stack([m21 - m12, m02 - m20, m10 - m01], axis=1)
+    sym = np.stack([m01 + m10, m02 + m20, m12 + m21], axis=1)
+    quarter_d_sq = 0.25 * d * d
+    candidates = np.stack([
+        np.c_[quarter_d_sq, skew],
+        np.c_[skew[:, 0], quarter_d_sq, sym[:, 0], sym[:, 1]],
+        np.c_[skew[:, 1], sym[:, 0], quarter_d_sq, sym[:, 2]],
+        np.c_[skew[:, 2], sym[:, 1], sym[:, 2], quarter_d_sq],
+    ], axis=1)  # (N, 4 cases, 4 components)
+    q = candidates[np.arange(len(cases)), cases] / d[:, np.newaxis]
+
+    q /= np.linalg.norm(q, axis=1, keepdims=True)
+    q[q[:, 0] < 0.0] *= -1.0
+    return q
+
+
+def decompose_matrix_arrays(matrices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Decompose `(N, 4, 4)` affine matrices into `(N, 3)` translations, `(N, 4)` WXYZ quaternions, and `(N, 3)` scales,
+    in the same way as `mathutils.Matrix.decompose()` (negative determinants negate all scale components)."""
+    translations = matrices[:, :3, 3].copy()
+    rotscales = matrices[:, :3, :3]
+    scales = np.linalg.norm(rotscales, axis=1)  # column lengths
+    rotmats = rotscales / np.where(scales == 0.0, 1.0, scales)[:, np.newaxis, :]
+    negative = np.linalg.det(rotmats) < 0.0
+    rotmats[negative] *= -1.0
+    scales[negative] *= -1.0
+    return translations, rotation_matrices_to_quaternion_arrays(rotmats), scales
+
+
+def compose_matrix_arrays(translations: np.ndarray, quaternions: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Inverse of `decompose_matrix_arrays()`: build `(N, 4, 4)` matrices `T @ R @ S` from `(N, 3)` translations,
+    `(N, 4)` WXYZ quaternions, and `(N, 3)` scales."""
+    matrices = np.zeros((len(translations), 4, 4), dtype=np.float64)
+    matrices[:, :3, :3] = quaternion_arrays_to_rotation_matrices(quaternions) * scales[:, np.newaxis, :]
+    matrices[:, :3, 3] = translations
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+def get_continuous_quaternion_arrays(quaternions: np.ndarray) -> np.ndarray:
+    """Negate quaternions in `(N, 4)` sequence as needed so that each has a non-negative dot product with the (possibly
+    negated) previous quaternion, which avoids interpolating the 'long way' between samples.
+
+    Equivalent to negating each quaternion in a loop, but uses a cumulative product of sign changes.
+    """
+    if len(quaternions) < 2:
+        return quaternions.copy()
+    dots = np.einsum("ij,ij->i", quaternions[1:], quaternions[:-1])
+    signs = np.cumprod(np.r_[1.0, np.where(dots < 0.0, -1.0, 1.0)])
+    return quaternions * signs[:, np.newaxis]
@@ -0,0 +1,82 @@
+"""Benchmark HKX animation import keyframe insertion: old `tolist()` + per-keyframe interpolation loop vs. the bulk
+`foreach_set` method now used by `SoulstructAnimation._add_keyframes_batch`.
+
+Run from Blender's Text Editor. No scene objects are needed: keyframes are added to temporary Actions for a synthetic
+100-bone, 1000-frame animation (ten FCurves per bone), which are checked for equality and then removed.
+"""
+import time
+
+import bpy
+import numpy as np
+
+from soulstruct.blender.animation.types import SoulstructAnimation
+
+BONE_COUNT = 100
+FRAME_COUNT = 1000
+
+
+def legacy_add_keyframes_batch(action: bpy.types.Action, bone_basis_samples: dict[str, np.ndarray]):
+    """Copy of the old bone keyframe loop (root motion omitted) for comparison."""
+    for bone_name, basis_samples in bone_basis_samples.items():
+        data_path = f"pose.bones[\"{bone_name}\"]"
+        fcurves = [action.fcurves.new(data_path=f"{data_path}.location", index=i) for i in range(3)]
+        fcurves += [action.fcurves.new(data_path=f"{data_path}.rotation_quaternion", index=i) for i in range(4)]
+        fcurves += [action.fcurves.new(data_path=f"{data_path}.scale", index=i) for i in range(3)]
+        for fcurve_i, fcurve in enumerate(fcurves):
+            fcurve.keyframe_points.add(count=basis_samples.shape[0])
+            data = basis_samples[:, [0, fcurve_i + 1]]
+            fcurve.keyframe_points.foreach_set("co", data.ravel().tolist())
+            for kp in fcurve.keyframe_points:
+                kp.interpolation = "LINEAR"
+
+
+def get_action_keyframes(action: bpy.types.Action) -> tuple[np.ndarray, np.ndarray]:
+    co = []
+    interpolations = []
+    for fcurve in action.fcurves:
+        count = len(fcurve.keyframe_points)
+        fcurve_co = np.empty(count * 2, dtype=np.float32)
+        fcurve.keyframe_points.foreach_get("co", fcurve_co)
+        fcurve_interpolations = np.empty(count, dtype=np.int32)
+        fcurve.keyframe_points.foreach_get("interpolation", fcurve_interpolations)
+        co.append(fcurve_co)
+        interpolations.append(fcurve_interpolations)
+    return np.concatenate(co), np.concatenate(interpolations)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    bone_basis_samples = {}
+    for i in range(BONE_COUNT):
+        samples = rng.standard_normal((FRAME_COUNT, 11))
+        samples[:, 0] = np.arange(FRAME_COUNT) * 2.0  # 30 -> 60 FPS keyframe times
+        bone_basis_samples[f"Bone{i:03d}"] = samples
+    keyframe_count = BONE_COUNT * FRAME_COUNT * 10
+
+    legacy_action = bpy.data.actions.new("__BENCHMARK_LEGACY__")
+    batch_action = bpy.data.actions.new("__BENCHMARK_BATCH__")
+    try:
+        p = time.perf_counter()
+        legacy_add_keyframes_batch(legacy_action, bone_basis_samples)
+        legacy_time = time.perf_counter() - p
+
+        p = time.perf_counter()
+        SoulstructAnimation._add_keyframes_batch(batch_action, bone_basis_samples, root_motion=None)
+        batch_time = time.perf_counter() - p
+
+        for legacy_array, batch_array in zip(get_action_keyframes(legacy_action), get_action_keyframes(batch_action)):
+            if not np.array_equal(legacy_array, batch_array):
+                raise AssertionError("Bulk keyframes do not match legacy loop keyframes.")
+    finally:
+        bpy.data.actions.remove(legacy_action)
+        bpy.data.actions.remove(batch_action)
+
+    print(f"{BONE_COUNT} bones, {FRAME_COUNT} frames: {keyframe_count} keyframes.")
+    print(f"    Legacy loop:  {legacy_time:.3f} s ({keyframe_count / legacy_time:,.0f} keyframes/s)")
+    print(
+        f"    Bulk set:     {batch_time:.3f} s ({keyframe_count / batch_time:,.0f} keyframes/s, "
+        f"{legacy_time / max(batch_time, 1e-9):.1f}x faster)"
+    )
+
+
+main()
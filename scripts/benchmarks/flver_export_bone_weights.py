@@ -0,0 +1,95 @@
+"""Benchmark FLVER export bone weight extraction: old per-vertex loop vs. the array-based `_get_vertex_bone_arrays`.
+
+Run from Blender's Text Editor with a FLVER mesh object (rigged or Map Piece) active. Both methods are run on the same
+mesh and their outputs are checked for equality.
+"""
+import time
+
+import bpy
+import numpy as np
+
+from soulstruct.blender.flver.models.types.bl_flver._export import _get_vertex_bone_arrays
+
+REPEATS = 3
+
+
+class _PrintOperator:
+    """Stands in for `LoggingOperator` outside of an operator."""
+
+    @staticmethod
+    def warning(msg: str):
+        print(msg)
+
+
+def legacy_vertex_bone_arrays(mesh, bl_bone_names: list[str], use_map_piece_layout: bool):
+    """Copy of the old per-vertex loop (validation and warnings omitted) for comparison."""
+    vertex_count = len(mesh.data.vertices)
+    vertex_bone_weights = np.zeros((vertex_count, 4), dtype=np.float32)
+    vertex_bone_indices = np.full((vertex_count, 4), -1, dtype=np.int32)
+    bone_name_indices = {bone_name: i for i, bone_name in enumerate(bl_bone_names)}
+    vertex_groups_dict = {group.index: group for group in mesh.vertex_groups}
+    used_bone_indices = set()
+
+    for i, vertex in enumerate(mesh.data.vertices):
+        bone_indices = []
+        bone_weights = []
+        for vertex_group in vertex.groups:
+            mesh_group = vertex_groups_dict[vertex_group.group]
+            bone_index = bone_name_indices[mesh_group.name]
+            bone_indices.append(bone_index)
+            used_bone_indices.add(bone_index)
+            if not use_map_piece_layout:
+                bone_weights.append(mesh_group.weight(i))
+        if not bone_indices:
+            bone_indices = [0]
+            used_bone_indices.add(0)
+        if use_map_piece_layout:
+            bone_indices *= 4
+        else:
+            while len(bone_weights) < 4:
+                bone_weights.append(0.0)
+            while len(bone_indices) < 4:
+                bone_indices.append(-1)
+        vertex_bone_indices[i] = bone_indices
+        if bone_weights:
+            vertex_bone_weights[i] = bone_weights
+
+    return vertex_bone_indices, vertex_bone_weights, np.array(sorted(used_bone_indices))
+
+
+def _best_time(func, *args) -> tuple[float, tuple]:
+    best = float("inf")
+    result = None
+    for _ in range(REPEATS):
+        p = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - p)
+    return best, result
+
+
+def main():
+    mesh = bpy.context.active_object
+    if mesh is None or mesh.type != "MESH":
+        raise TypeError("Active object must be a FLVER mesh.")
+    armature = mesh.parent if mesh.parent and mesh.parent.type == "ARMATURE" else None
+    bl_bone_names = [bone.name for bone in armature.data.bones] if armature else [mesh.name.split(" ")[0]]
+    use_map_piece_layout = mesh.name.startswith("m")
+
+    legacy_time, legacy_result = _best_time(
+        legacy_vertex_bone_arrays, mesh, bl_bone_names, use_map_piece_layout
+    )
+    array_time, array_result = _best_time(
+        _get_vertex_bone_arrays, _PrintOperator(), mesh, bl_bone_names, use_map_piece_layout, armature is None
+    )
+
+    for legacy_array, new_array in zip(legacy_result, array_result, strict=True):
+        if not np.array_equal(legacy_array, new_array):
+            raise AssertionError("Array-based bone weights do not match legacy loop output.")
+
+    vertex_count = len(mesh.data.vertices)
+    print(f"Mesh '{mesh.name}': {vertex_count} vertices, {len(bl_bone_names)} bones (best of {REPEATS}).")
+    print(f"    Legacy loop:  {legacy_time:.4f} s")
+    print(f"    Array-based:  {array_time:.4f} s ({legacy_time / max(array_time, 1e-9):.1f}x faster)")
+
+
+main()
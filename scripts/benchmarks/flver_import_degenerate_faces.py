@@ -0,0 +1,58 @@
+"""Benchmark FLVER import degenerate face filtering: old `np.apply_along_axis` filter vs. `get_valid_triangle_mask`.
+
+Run from Blender's Text Editor. Uses synthetic million-face arrays with a sprinkling of degenerate and duplicate faces.
+The old filter only removes degenerate faces, so results are compared with duplicate removal disabled.
+"""
+import time
+
+import numpy as np
+
+from soulstruct.blender.utilities import get_valid_triangle_mask
+
+FACE_COUNT = 1_000_000
+VERTEX_COUNT = 500_000
+DEGENERATE_FRACTION = 0.01
+DUPLICATE_FRACTION = 0.01
+
+
+def legacy_valid_triangle_mask(face_vertex_indices: np.ndarray) -> np.ndarray:
+    return np.apply_along_axis(lambda row: len(np.unique(row)) == 3, 1, face_vertex_indices)
+
+
+def make_faces(rng: np.random.Generator) -> np.ndarray:
+    faces = rng.integers(0, VERTEX_COUNT, size=(FACE_COUNT, 3), dtype=np.int32)
+    degenerate_rows = rng.choice(FACE_COUNT, int(FACE_COUNT * DEGENERATE_FRACTION), replace=False)
+    faces[degenerate_rows, 1] = faces[degenerate_rows, 0]
+    duplicate_rows = rng.choice(FACE_COUNT, int(FACE_COUNT * DUPLICATE_FRACTION), replace=False)
+    faces[duplicate_rows] = np.roll(faces[duplicate_rows[::-1]], 1, axis=1)  # rotated copies of other faces
+    return faces
+
+
+def main():
+    faces = make_faces(np.random.default_rng(0))
+
+    p = time.perf_counter()
+    legacy_mask = legacy_valid_triangle_mask(faces)
+    legacy_time = time.perf_counter() - p
+
+    p = time.perf_counter()
+    degenerate_mask = get_valid_triangle_mask(faces, remove_duplicates=False)
+    degenerate_time = time.perf_counter() - p
+
+    p = time.perf_counter()
+    full_mask = get_valid_triangle_mask(faces, remove_duplicates=True)
+    full_time = time.perf_counter() - p
+
+    if not np.array_equal(legacy_mask, degenerate_mask):
+        raise AssertionError("Vectorized degenerate face mask does not match legacy filter.")
+
+    print(f"{FACE_COUNT} faces:")
+    print(f"    Legacy `apply_along_axis`:   {legacy_time:.4f} s ({np.sum(~legacy_mask)} removed)")
+    print(
+        f"    Vectorized (degenerate):     {degenerate_time:.4f} s "
+        f"({legacy_time / max(degenerate_time, 1e-9):.0f}x faster)"
+    )
+    print(f"    Vectorized (+ duplicates):   {full_time:.4f} s ({np.sum(~full_mask)} removed)")
+
+
+main()
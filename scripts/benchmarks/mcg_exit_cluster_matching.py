@@ -0,0 +1,106 @@
+"""Benchmark MCG node creation exit cluster matching: old all-pairs vertex comparison vs. the spatial grid used by
+`get_touching_exit_clusters`.
+
+Run from Blender's Text Editor. No scene objects are needed: a synthetic map of square navmesh tiles is generated, where
+each tile has a strip of 'Exit' faces along each edge shared with a neighboring tile (with slightly jittered vertices,
+like separately exported NVMs). Matched cluster pairs are checked for equality.
+"""
+import itertools
+import time
+
+import numpy as np
+
+from soulstruct.blender.nav_graph.utilities import get_touching_exit_clusters
+
+GRID_SIZE = 6  # 36 navmeshes
+TILE_SIZE = 20.0
+EXIT_FACES_PER_SIDE = 8  # each exit strip is a cluster of `2 * EXIT_FACES_PER_SIDE` triangles
+EXIT_VERTEX_DISTANCE = 0.01
+JITTER = 0.001
+
+
+def make_exit_strip(rng: np.random.Generator, start: np.ndarray, direction: np.ndarray, normal: np.ndarray):
+    """Make a strip of exit triangles along one tile edge, with one side exactly on the edge."""
+    step = TILE_SIZE / EXIT_FACES_PER_SIDE
+    cluster = []
+    for i in range(EXIT_FACES_PER_SIDE):
+        a = start + direction * step * i
+        b = start + direction * step * (i + 1)
+        c, d = a + normal, b + normal
+        for tri in ((a, b, c), (b, d, c)):
+            verts = frozenset(tuple(v + rng.uniform(-JITTER, JITTER, 3)) for v in tri)
+            cluster.append((None, verts))  # no real `BMFace`
+    return tuple(cluster)
+
+
+def make_navmesh_exit_clusters(rng: np.random.Generator):
+    navmesh_exit_clusters = []
+    x_dir, y_dir = np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0])
+    for gx, gy in itertools.product(range(GRID_SIZE), repeat=2):
+        origin = np.array([gx * TILE_SIZE, gy * TILE_SIZE, 0.0])
+        clusters = []
+        if gx > 0:
+            clusters.append(make_exit_strip(rng, origin, y_dir, x_dir))
+        if gx < GRID_SIZE - 1:
+            clusters.append(make_exit_strip(rng, origin + x_dir * TILE_SIZE, y_dir, -x_dir))
+        if gy > 0:
+            clusters.append(make_exit_strip(rng, origin, x_dir, y_dir))
+        if gy < GRID_SIZE - 1:
+            clusters.append(make_exit_strip(rng, origin + y_dir * TILE_SIZE, x_dir, -y_dir))
+        navmesh_exit_clusters.append(tuple(clusters))
+    return navmesh_exit_clusters
+
+
+def legacy_touching_exit_clusters(navmesh_exit_clusters, exit_sq_dist: float):
+    """Copy of the old `_create_mcg_nodes` matching loop (node creation omitted) for comparison."""
+    touching = set()
+    for nav_index, exit_clusters in enumerate(navmesh_exit_clusters):
+        for cluster_index, cluster in enumerate(exit_clusters):
+            for _, face_verts in cluster:
+                for other_nav_index, other_exit_clusters in enumerate(navmesh_exit_clusters):
+                    if nav_index >= other_nav_index:
+                        continue
+                    for other_cluster_index, other_cluster in enumerate(other_exit_clusters):
+                        node_key = ((nav_index, cluster_index), (other_nav_index, other_cluster_index))
+                        if node_key in touching:
+                            continue
+                        for _, other_face_verts in other_cluster:
+                            hits = 0
+                            for v in face_verts:
+                                for ov in other_face_verts:
+                                    if sum((v[_i] - ov[_i]) ** 2 for _i in range(3)) < exit_sq_dist:
+                                        hits += 1
+                                        if hits >= 2:
+                                            break
+                                else:
+                                    continue
+                                break
+                            if hits >= 2:
+                                touching.add(node_key)
+                                break
+    return sorted(touching)
+
+
+def main():
+    navmesh_exit_clusters = make_navmesh_exit_clusters(np.random.default_rng(0))
+    face_count = sum(len(cluster) for clusters in navmesh_exit_clusters for cluster in clusters)
+
+    p = time.perf_counter()
+    legacy_touching = legacy_touching_exit_clusters(navmesh_exit_clusters, EXIT_VERTEX_DISTANCE ** 2)
+    legacy_time = time.perf_counter() - p
+
+    p = time.perf_counter()
+    grid_touching = get_touching_exit_clusters(navmesh_exit_clusters, EXIT_VERTEX_DISTANCE)
+    grid_time = time.perf_counter() - p
+
+    if legacy_touching != grid_touching:
+        raise AssertionError("Spatial grid cluster matches do not match legacy matches.")
+
+    print(
+        f"{len(navmesh_exit_clusters)} navmeshes, {face_count} exit faces: {len(grid_touching)} touching cluster pairs."
+    )
+    print(f"    Legacy all-pairs:  {legacy_time:.3f} s")
+    print(f"    Spatial grid:      {grid_time:.3f} s ({legacy_time / max(grid_time, 1e-9):.0f}x faster)")
+
+
+main()